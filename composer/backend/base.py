@@ -79,10 +79,31 @@ class PlannerBase(ABC):
             self.jump_to_date if self.jump_to_date else get_next_day(self.date)
         )
 
+    def fork(self):
+        """Create a new planner with the same state as this one, e.g. to be
+        populated for the next day.
+
+        The new planner shares all of its state (e.g. log files and
+        preferences) with this one rather than copying it. This relies on
+        planner state only ever being reassigned rather than modified in place,
+        so that any state that is subsequently reassigned on either planner
+        diverges from the other without affecting it. The tasklist is the
+        exception, and is treated as a single instance common to both.
+
+        :returns :class:`PlannerBase`: The new planner
+        """
+        planner = copy.copy(self)
+        planner.next_day_planner = None
+        return planner
+
     @abc.abstractmethod
     def get_log(self, for_day, period):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def has_log(self, for_day, period):
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_agenda(self, period, complete=None):
         raise NotImplementedError
@@ -246,13 +267,14 @@ class PlannerBase(ABC):
             # period boundary criteria are not met, that it still represents an
             # advance of the concerned period since we may not already have a
             # log file tracking the target date
-            is_date_tracked = self.get_log(next_day, next_period)
+            is_date_tracked = self.has_log(next_day, next_period)
             criteria_met = not is_date_tracked
         return criteria_met
 
     def advance_period(self, current_period=None, next_day=None):
-        """Recursive function to advance planner by day, week, month, quarter,
-        or year as the case may be.
+        """Advance planner by day, week, month, quarter, or year as the case
+        may be. Any input needed from the user is raised as an error (see
+        :class:`PlannerAdvance` for a way to resume the advance instead).
 
         :param :class:`~composer.timeperiod.Period` current_period: The period
             we have advanced up to thus far.
@@ -261,28 +283,29 @@ class PlannerBase(ABC):
         :returns :class:`~composer.timeperiod.Period`: The highest period
             advanced
         """
-        if not current_period:
-            current_period = Zero
-        if not next_day:
-            next_day = self.next_day()  # the new day to advance to
-        if current_period == Year:
-            # base case
-            return current_period
-
-        next_period = get_next_period(current_period)
-
-        if self._advance_criteria_met(next_period, next_day):
-            self.end_period(next_period)
-            self.begin_period(next_period, next_day)
-
-            return self.advance_period(next_period, next_day)
-        else:
-            # did not advance beyond current period. If we have advanced
-            # at all (e.g. a smaller period), we still want to
-            # update the existing template for the encompassing period
-            if current_period > Zero:
-                self.continue_period(next_period, next_day)
-            return current_period
+        advance = PlannerAdvance(self, current_period, next_day)
+        needs_input = advance.run()
+        if needs_input is not None:
+            raise needs_input
+        return advance.status
+
+    def _fork_for_next_day(self):
+        """Check that the planner can be advanced, and create the planner for
+        the next day, to be populated in the course of advancing.
+
+        :returns :class:`datetime.date`: The day to advance to
+        """
+        if self.date > datetime.date.today():
+            raise PlannerIsInTheFutureError("Planner is in the future!")
+
+        next_day = self.next_day()  # the new day to advance to
+
+        # create a clone of the planner to be populated
+        # for the next day. Both current and next day planner
+        # instances use the same tasklist instance
+        self.next_day_planner = self.fork()
+        self.next_day_planner.date = next_day
+        return next_day
 
     def advance(self):
         """Advance planner state to next day, updating week and month info
@@ -296,25 +319,39 @@ class PlannerBase(ABC):
         :returns :class:`~composer.timeperiod.Period`: The highest period
             advanced
         """
-
-        if self.date > datetime.date.today():
-            raise PlannerIsInTheFutureError("Planner is in the future!")
-
-        next_day = self.next_day()  # the new day to advance to
-
-        # create a clone of the planner to be populated
-        # for the next day
-        self.next_day_planner = copy.deepcopy(self)
-        # both current and next day planner instances use
-        # the same tasklist instance
-        self.next_day_planner.tasklist = self.tasklist
-        self.next_day_planner.date = next_day
+        next_day = self._fork_for_next_day()
 
         status = self.advance_period(Zero, next_day)
         if status == Zero:
             self.next_day_planner = None
         return status, self.next_day_planner
 
+    def start_advance(self):
+        """Begin advancing planner state to the next day, as :meth:`advance`
+        does, but in a form that can be resumed whenever input is needed from
+        the user, rather than starting over.
+
+        :returns :class:`PlannerAdvance`: The advance, ready to be run
+        """
+        next_day = self._fork_for_next_day()
+        return PlannerAdvance(self, Zero, next_day)
+
+    def snapshot(self):
+        """Save the state of the planner, e.g. to return to later. This
+        includes the state of the next day's planner and of the tasklist,
+        and like :meth:`fork`, shares rather than copies the state of each.
+
+        :returns :class:`PlannerBase`: A planner with the same state as this
+            one, unaffected by any further changes to this one
+        """
+        tasklist = copy.copy(self.tasklist)
+        planner = copy.copy(self)
+        planner.tasklist = tasklist
+        if self.next_day_planner is not None:
+            planner.next_day_planner = copy.copy(self.next_day_planner)
+            planner.next_day_planner.tasklist = tasklist
+        return planner
+
     @abc.abstractmethod
     def is_ok_to_advance(self, period=Year):
         raise NotImplementedError
@@ -352,3 +389,119 @@ class TasklistBase(ABC):
     @abc.abstractmethod
     def save(self):
         raise NotImplementedError
+
+
+# errors indicating that advancing the planner needs input from the user
+NEEDS_INPUT_ERRORS = (
+    LogfileNotCompletedError,
+    AgendaNotReviewedError,
+    MissingThemeError,
+)
+
+
+class PlannerAdvance(object):
+    """The advance of a planner by day, week, month, quarter, or year as the
+    case may be, as a resumable state machine.
+
+    Each period advanced is first ended and then begun, and either step may
+    need input from the user (e.g. to complete a log, or to review an
+    agenda). When that happens, the advance stops and reports the input that
+    is needed, and once the user's preferences have been updated accordingly,
+    it may be resumed from the state saved just before the step in question.
+    The steps before it are not repeated.
+    """
+
+    # the steps in advancing each period
+    CHECK = "check"
+    END = "end"
+    BEGIN = "begin"
+
+    def __init__(self, planner, current_period=None, next_day=None):
+        """
+        :param :class:`PlannerBase` planner: The planner to advance
+        :param :class:`~composer.timeperiod.Period` current_period: The period
+            we have advanced up to thus far.
+        :param :class:`datetime.date` next_day: The day we are advancing to
+            (which may entail an advancement of multiple encompassing periods)
+        """
+        self.planner = planner
+        self.next_day = next_day or planner.next_day()
+        self.period = current_period or Zero
+        self.step = self.CHECK
+        # the highest period advanced, once the advance is complete
+        self.status = None
+        # the input needed from the user, if any, and the state of the
+        # planner to resume from once it has been provided
+        self.needs_input = None
+        self._checkpoint = None
+
+    @property
+    def next_day_planner(self):
+        """The planner for the day advanced to, if the planner advanced."""
+        if self.status == Zero:
+            return None
+        return self.planner.next_day_planner
+
+    def _attempt(self, step, *args):
+        self._checkpoint = self.planner.snapshot()
+        try:
+            step(*args)
+        except NEEDS_INPUT_ERRORS as err:
+            self.needs_input = err
+        return self.needs_input
+
+    def run(self):
+        """Advance the planner until the advance is either complete or needs
+        input from the user.
+
+        :returns :class:`~composer.errors.UserError`: The error describing
+            the input needed, or None if the advance is complete
+        """
+        while self.status is None:
+            if self.period == Year:
+                self.status = self.period
+                break
+            next_period = get_next_period(self.period)
+            if self.step == self.CHECK:
+                if self.planner._advance_criteria_met(
+                    next_period, self.next_day
+                ):
+                    self.step = self.END
+                else:
+                    # did not advance beyond current period. If we have
+                    # advanced at all (e.g. a smaller period), we still want
+                    # to update the existing template for the encompassing
+                    # period
+                    if self.period > Zero:
+                        self.planner.continue_period(
+                            next_period, self.next_day
+                        )
+                    self.status = self.period
+            elif self.step == self.END:
+                if self._attempt(self.planner.end_period, next_period):
+                    return self.needs_input
+                self.step = self.BEGIN
+            elif self.step == self.BEGIN:
+                if self._attempt(
+                    self.planner.begin_period, next_period, self.next_day
+                ):
+                    return self.needs_input
+                self.period = next_period
+                self.step = self.CHECK
+        return None
+
+    def resume(self, preferences):
+        """Resume the advance once the input needed from the user has been
+        provided, retrying the step that needed it.
+
+        :param dict preferences: User preferences, updated in light of the
+            input provided
+        :returns :class:`~composer.errors.UserError`: The error describing
+            the input needed, or None if the advance is complete
+        """
+        # resume from a copy so that the saved state remains as it was, in
+        # case the same step needs input again
+        self.planner = self._checkpoint.snapshot()
+        self.planner.set_preferences(preferences)
+        self.needs_input = None
+        return self.run()
@@ -1,5 +1,11 @@
 from .base import FilesystemPlanner, FilesystemTasklist
+from .catalog import WikiCatalog
 from .interface import get_log_for_date
 
 
-__all__ = ("FilesystemPlanner", "FilesystemTasklist", "get_log_for_date")
+__all__ = (
+    "FilesystemPlanner",
+    "FilesystemTasklist",
+    "WikiCatalog",
+    "get_log_for_date",
+)
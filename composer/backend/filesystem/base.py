@@ -1,8 +1,8 @@
 import os
-from collections import defaultdict
+import time
 
 from ..base import PlannerBase, TasklistBase
-from ...config import LOGFILE_CHECKING
+from ...config import DEFAULT_READ_WORKERS, LOGFILE_CHECKING
 from ...timeperiod import (
     get_next_period,
     get_time_periods,
@@ -14,7 +14,12 @@ from ...timeperiod import (
     Zero,
     Eternity,
 )
-from ...errors import LogfileLayoutError, TasklistLayoutError, InvalidDateError
+from ...errors import (
+    InvalidDateError,
+    LogfileAlreadyExistsError,
+    LogfileLayoutError,
+    TasklistLayoutError,
+)
 from ...utils import display_message
 from .scheduling import (
     check_logfile_for_errors,
@@ -22,6 +27,14 @@ from .scheduling import (
     standardize_entry_date,
     string_to_date,
 )
+from .placement import (
+    advance_placement,
+    bucket_tasks,
+    get_period_end_dates,
+    placement_from_string,
+    placement_to_string,
+    record_placement,
+)
 from .templates import get_template
 from .interface import ensure_file_does_not_exist, get_log_for_date
 
@@ -38,15 +51,14 @@ from .primitives import (
     get_log_filename,
     make_file,
     full_file_path,
+    DirectoryListing,
     read_file,
+    read_files,
     write_file,
-    add_to_section,
-    get_entries,
     entries_to_string,
-    partition_entries,
-    read_section,
     bare_filename,
     parse_task,
+    parse_document,
 )
 
 try:  # py3
@@ -55,6 +67,8 @@ except NameError:  # py2
     FileNotFoundError = IOError
 
 PLANNERTASKLISTFILE = "TaskList.wiki"
+# the placement of scheduled tasks in the tasklist as of the last advance
+PLANNERPLACEMENTFILE = ".composer-placement"
 PLANNERDAYTHEMESFILE = "DayThemes.wiki"
 PLANNERDAYFILELINK = "currentday"
 # e.g. Checkpoints_Week.wiki
@@ -63,24 +77,122 @@ SCHEDULE_FILE_PREFIX = "Checkpoints"
 PERIODIC_FILE_PREFIX = "Periodic"
 
 
+class PlannerFiles(object):
+    """The files backing a planner on disk. Each file is read the first time
+    it is needed and remembered thereafter, so that planners (and their
+    forks) only read the files that they actually use.
+    """
+
+    def __init__(self, location, filenames):
+        """
+        :param str location: Filesystem path to the planner wiki
+        :param dict filenames: The name of the file on disk for each planner
+            attribute
+        """
+        self.location = location
+        self.filenames = filenames
+        self.contents = {}
+        # the number of files actually read from disk, and the (wall-clock)
+        # time spent reading them
+        self.files_read = 0
+        self.read_time = 0.0
+
+    def _path(self, attr):
+        return full_file_path(
+            root=self.location, filename=self.filenames[attr]
+        )
+
+    def read(self, attr):
+        """Read the file for a planner attribute, if it hasn't been read
+        already.
+
+        :param str attr: The name of the planner attribute
+        :returns :class:`io.StringIO`: The contents of the file
+        """
+        if attr not in self.contents:
+            start = time.time()
+            self.contents[attr] = read_file(self._path(attr))
+            self.read_time += time.time() - start
+            self.files_read += 1
+        return make_file(self.contents[attr].getvalue())
+
+    def read_all(self, workers):
+        """Read all files that haven't been read already, a number of them at
+        a time. On high-latency storage this is much faster than reading the
+        files one by one as they are needed.
+
+        :param int workers: The number of files to read at a time
+        """
+        attrs = [attr for attr in self.filenames if attr not in self.contents]
+        start = time.time()
+        contents = read_files([self._path(attr) for attr in attrs], workers)
+        self.read_time += time.time() - start
+        self.contents.update(zip(attrs, contents))
+        self.files_read += len(attrs)
+
+    def is_unchanged(self, path, contents):
+        """Whether the given contents are those of the file at the given path,
+        as it was read from disk. Files that haven't been read are assumed
+        to have changed.
+
+        :param str path: Filesystem path to the file
+        :param str contents: The (possibly modified) contents of the file
+        :returns bool: Whether the contents are unchanged
+        """
+        for attr, original in self.contents.items():
+            if self._path(attr) == path:
+                return original.getvalue() == contents
+        return False
+
+
+class LazyFile(object):
+    """The internal value of a planner file attribute, which is loaded from
+    the planner's files on disk the first time it is accessed. Once loaded
+    (or explicitly set), the value is held on the planner instance itself and
+    this is no longer consulted.
+    """
+
+    def __init__(self, attr):
+        """
+        :param str attr: The name of the (public) planner attribute
+        """
+        self.attr = attr
+
+    def __get__(self, planner, owner):
+        if planner is None:
+            return self
+        if planner._files is None:
+            return None
+        # load the file via the attribute's setter, which stores the value
+        # on the instance, shadowing this descriptor
+        setattr(planner, self.attr, planner._files.read(self.attr))
+        return planner.__dict__['_' + self.attr]
+
+
 class FilesystemPlanner(PlannerBase):
-    _daythemesfile = None
-    _dayfile = None
-    _weekfile = None
-    _monthfile = None
-    _quarterfile = None
-    _yearfile = None
-    _checkpoints_weekday_file = None
-    _checkpoints_weekend_file = None
-    _checkpoints_week_file = None
-    _checkpoints_month_file = None
-    _checkpoints_quarter_file = None
-    _checkpoints_year_file = None
-    _periodic_day_file = None
-    _periodic_week_file = None
-    _periodic_month_file = None
-    _periodic_quarter_file = None
-    _periodic_year_file = None
+    _daythemesfile = LazyFile('daythemesfile')
+    _dayfile = LazyFile('dayfile')
+    _weekfile = LazyFile('weekfile')
+    _monthfile = LazyFile('monthfile')
+    _quarterfile = LazyFile('quarterfile')
+    _yearfile = LazyFile('yearfile')
+    _checkpoints_weekday_file = LazyFile('checkpoints_weekday_file')
+    _checkpoints_weekend_file = LazyFile('checkpoints_weekend_file')
+    _checkpoints_week_file = LazyFile('checkpoints_week_file')
+    _checkpoints_month_file = LazyFile('checkpoints_month_file')
+    _checkpoints_quarter_file = LazyFile('checkpoints_quarter_file')
+    _checkpoints_year_file = LazyFile('checkpoints_year_file')
+    _periodic_day_file = LazyFile('periodic_day_file')
+    _periodic_week_file = LazyFile('periodic_week_file')
+    _periodic_month_file = LazyFile('periodic_month_file')
+    _periodic_quarter_file = LazyFile('periodic_quarter_file')
+    _periodic_year_file = LazyFile('periodic_year_file')
+    # the files backing the planner on disk, read as they are needed
+    _files = None
+    # the files in the wiki, to tell whether logs exist
+    _listing = None
+    # if more than one, all files are read up front, this many at a time
+    read_workers = DEFAULT_READ_WORKERS
 
     def __init__(self, location=None, tasklist=None, preferences=None):
         super(FilesystemPlanner, self).__init__(
@@ -91,7 +203,11 @@ class FilesystemPlanner(PlannerBase):
     # use 'getters' and 'setters' for file attributes so that any state changes
     # to their values (e.g. "head" position after reading the file's contents)
     # are contained within the client code and not reflected on the planner
-    # instance unless it is explicitly modified via a setter
+    # instance unless it is explicitly modified via a setter. Log files are
+    # held internally as parsed documents so that their sections can be read
+    # and modified without rescanning the entire file each time. As neither
+    # documents nor files are ever modified in place, forked planners can
+    # safely share them
 
     @property
     def daythemesfile(self):
@@ -103,43 +219,43 @@ class FilesystemPlanner(PlannerBase):
 
     @property
     def dayfile(self):
-        return make_file(self._dayfile.getvalue())
+        return make_file(self._dayfile.render())
 
     @dayfile.setter
     def dayfile(self, value):
-        self._dayfile = value
+        self._dayfile = parse_document(value)
 
     @property
     def weekfile(self):
-        return make_file(self._weekfile.getvalue())
+        return make_file(self._weekfile.render())
 
     @weekfile.setter
     def weekfile(self, value):
-        self._weekfile = value
+        self._weekfile = parse_document(value)
 
     @property
     def monthfile(self):
-        return make_file(self._monthfile.getvalue())
+        return make_file(self._monthfile.render())
 
     @monthfile.setter
     def monthfile(self, value):
-        self._monthfile = value
+        self._monthfile = parse_document(value)
 
     @property
     def quarterfile(self):
-        return make_file(self._quarterfile.getvalue())
+        return make_file(self._quarterfile.render())
 
     @quarterfile.setter
     def quarterfile(self, value):
-        self._quarterfile = value
+        self._quarterfile = parse_document(value)
 
     @property
     def yearfile(self):
-        return make_file(self._yearfile.getvalue())
+        return make_file(self._yearfile.render())
 
     @yearfile.setter
     def yearfile(self, value):
-        self._yearfile = value
+        self._yearfile = parse_document(value)
 
     @property
     def checkpoints_weekday_file(self):
@@ -229,6 +345,18 @@ class FilesystemPlanner(PlannerBase):
     def periodic_year_file(self, value):
         self._periodic_year_file = value
 
+    def set_preferences(self, preferences):
+        """Set planner preferences, including those specific to the
+        filesystem, e.g. the number of files to read at a time.
+
+        :param dict preferences: A dictionary of user preferences, e.g. read
+            from a config location on disk
+        """
+        super(FilesystemPlanner, self).set_preferences(preferences)
+        self.read_workers = int(
+            preferences.get("read_workers", self.read_workers)
+        )
+
     def _logfile_attribute(self, period):
         """A helper to get the name of the attribute on the planner instance
         corresponding to the log file for the given period.
@@ -256,11 +384,11 @@ class FilesystemPlanner(PlannerBase):
         concerned with a specific period rather than all periods.
 
         :param :class:`~composer.timeperiod.Period` period: A time period
-        :returns :class:`io.StringIO`: A file corresponding to the log for
-            the given time period
+        :returns :class:`~composer.backend.filesystem.primitives.LogDocument`:
+            The parsed log for the given time period
         """
         log_attr = self._logfile_attribute(period)
-        log = getattr(self, log_attr)
+        log = getattr(self, '_' + log_attr)
         return log
 
     def _update_logfile(self, period, contents):
@@ -269,11 +397,12 @@ class FilesystemPlanner(PlannerBase):
         concerned with a specific period rather than all periods.
 
         :param :class:`~composer.timeperiod.Period` period: A time period
-        :param str contents: The new contents of the log file
+        :param contents: The new contents of the log file, either as a
+            string or as a parsed document
         """
         log_attr = self._logfile_attribute(period)
         if log_attr:
-            setattr(self, log_attr, make_file(contents))
+            setattr(self, log_attr, contents)
 
     def _get_date(self):
         """Get date from planner's current state on disk.
@@ -292,14 +421,14 @@ class FilesystemPlanner(PlannerBase):
 
         :param str location: Filesystem path to planner wiki
         """
-        # use a bunch of StringIO buffers for the Planner object
+        # use a bunch of in-memory logical files for the Planner object
         # populate them here from real files
         if location is None:
             # needed for tests atm -- eventually make location a required arg
             return
         self.location = location
         self.date = self._get_date()
-        # populate attributes on planner object from files on disk
+        # the files on disk backing each attribute on the planner object
         planner_files = {
             'daythemesfile': PLANNERDAYTHEMESFILE,
             'dayfile': get_log_filename(self.date, Day),
@@ -347,12 +476,22 @@ class FilesystemPlanner(PlannerBase):
                 PERIODIC_FILE_PREFIX
             ),
         }
-        for attr, filename in planner_files.items():
-            setattr(
-                self,
-                attr,
-                read_file(full_file_path(root=location, filename=filename)),
-            )
+        # files are only read from disk as they are needed, unless they are
+        # to be read concurrently, in which case it's quicker to read them
+        # all at once
+        self._files = PlannerFiles(location, planner_files)
+        self._listing = DirectoryListing(location)
+        if self.read_workers > 1:
+            self._files.read_all(self.read_workers)
+
+    @property
+    def files_read(self):
+        """The number of planner files that have been read from disk, shared
+        with any forks of this planner.
+        """
+        if self._files is None:
+            return 0
+        return self._files.files_read
 
     def get_log(self, for_day, period):
         """Get the log file responsible for the specified period and date.
@@ -362,6 +501,9 @@ class FilesystemPlanner(PlannerBase):
         :param :class:`datetime.date` for_day: The reference date to identify
             the desired log file.
         """
+        if self._is_own_log(for_day, period):
+            # it may not have been written to disk yet, e.g. when catching up
+            return getattr(self, self._logfile_attribute(period))
         try:
             log = get_log_for_date(period, for_day, self.location)
         except FileNotFoundError:
@@ -369,6 +511,32 @@ class FilesystemPlanner(PlannerBase):
         else:
             return log
 
+    def has_log(self, for_day, period):
+        """Whether there is a log file responsible for the specified period
+        and date. This is told from a listing of the files in the wiki,
+        without reading the log.
+
+        :param :class:`datetime.date` for_day: The reference date
+        :param :class:`~composer.timeperiod.Period` period: The time period
+        :returns bool: Whether the log exists
+        """
+        if period < Day:
+            return False
+        if self._is_own_log(for_day, period):
+            return True
+        if self._listing is None:
+            return self.get_log(for_day, period) is not None
+        start_date = period.get_start_date(for_day)
+        return get_log_filename(start_date, period) in self._listing
+
+    def _is_own_log(self, for_day, period):
+        """Whether the planner's own log for the given period is the one that
+        tracks the specified date.
+        """
+        return period >= Day and period.get_start_date(
+            for_day
+        ) == period.get_start_date(self.date)
+
     def schedule_tasks(self):
         """Parse today's agenda for any (e.g. newly-added) scheduled tasks,
         and move them to the appropriate section of the tasklist after
@@ -388,9 +556,9 @@ class FilesystemPlanner(PlannerBase):
         # additional interfaces as needed
         # TODO: these diagnostics are not covered by tests
         display_message("Tracking any newly scheduled tasks", interactive=True)
-        check_logfile_for_errors(self.dayfile)
+        check_logfile_for_errors(self._dayfile)
 
-        tasks = get_entries(self.dayfile, of_type=is_scheduled_task)
+        tasks = self._dayfile.get_entries(of_type=is_scheduled_task)
 
         tasks = [
             (
@@ -433,14 +601,16 @@ class FilesystemPlanner(PlannerBase):
             interactive=True,
         )
         try:
-            tasks, _ = read_section(self.dayfile, 'agenda')
+            tasks = self._dayfile.section_entries('agenda')
         except ValueError:
             raise LogfileLayoutError(
                 "No AGENDA section found in today's log file!"
                 " Add one and try again."
             )
 
-        tasks = entries_to_string(get_entries(tasks, is_unfinished))
+        tasks = entries_to_string(
+            [task for task in tasks if is_unfinished(task)]
+        )
 
         return tasks
 
@@ -470,7 +640,7 @@ class FilesystemPlanner(PlannerBase):
         # set the logfile on the next day's planner instance to the
         # newly created file, to be saved later
         log_attr = self._logfile_attribute(period)
-        setattr(self.next_day_planner, log_attr, make_file(contents))
+        setattr(self.next_day_planner, log_attr, contents)
 
     def update_log(self, period, for_day):
         """Update the existing log for the specified period to account for the
@@ -501,15 +671,14 @@ class FilesystemPlanner(PlannerBase):
             return True
 
         completed = False
-        log = self._get_logfile(period)
+        log = parse_document(self._get_logfile(period))
         try:
-            notes, _ = read_section(log, 'notes')
+            notes = log.read_section('notes')
         except ValueError:
             raise LogfileLayoutError(
                 "Error: No 'NOTES' section found in your {period} "
                 "log file!".format(period=period)
             )
-        notes = notes.read()
         if notes.strip("\n ") != "":
             completed = True
         return completed
@@ -527,9 +696,9 @@ class FilesystemPlanner(PlannerBase):
         """
         if period is Zero:
             return None
-        log = self._get_logfile(period)
+        log = parse_document(self._get_logfile(period))
         try:
-            agenda, _ = read_section(log, 'agenda')
+            agenda = log.section_entries('agenda')
         except ValueError:
             raise LogfileLayoutError(
                 "No AGENDA section found in {period} log file!"
@@ -541,7 +710,8 @@ class FilesystemPlanner(PlannerBase):
             of_type = is_not_completed
         else:
             of_type = None
-        agenda = get_entries(agenda, of_type)
+        if of_type:
+            agenda = [entry for entry in agenda if of_type(entry)]
         agenda = entries_to_string(agenda)
         return agenda
 
@@ -553,17 +723,17 @@ class FilesystemPlanner(PlannerBase):
             for this period
         :param str agenda: New contents to be appended to the agenda
         """
-        log = self._get_logfile(period)
+        log = parse_document(self._get_logfile(period))
         try:
-            logfile_updated = add_to_section(
-                log, 'agenda', agenda, above=False, ensure_separator=True
+            logfile_updated = log.add_to_section(
+                'agenda', agenda, above=False, ensure_separator=True
             )
         except ValueError:
             raise LogfileLayoutError(
                 "No AGENDA section found in {period} log file!"
                 " Add one and try again.".format(period=period)
             )
-        self._update_logfile(period, logfile_updated.getvalue())
+        self._update_logfile(period, logfile_updated)
 
     def _get_filename(self, period):
         """Genenerate a full path to the current log file for a given
@@ -576,6 +746,44 @@ class FilesystemPlanner(PlannerBase):
         start_date = period.get_start_date(self.date)
         return get_log_filename(start_date, period, root=self.location)
 
+    def following_planner(self, status):
+        """The planner for the day advanced to, as it would be constructed
+        from disk once the advance has been saved. This allows it to be
+        advanced in turn without saving and reloading the planner in between.
+
+        :param :class:`~composer.timeperiod.Period` status: The highest period
+            advanced
+        :returns :class:`FilesystemPlanner`: The planner for the next day
+        """
+        planner = self.next_day_planner
+        # logs for periods that didn't advance carry on into the next day,
+        # including any updates made to them in the course of advancing
+        for period in (Week, Month, Quarter, Year):
+            log_attr = '_' + self._logfile_attribute(period)
+            if period > status and log_attr in self.__dict__:
+                setattr(planner, log_attr, getattr(self, log_attr))
+        return planner
+
+    def get_current_files(self):
+        """Generate full paths to the files that make up the current state of
+        the planner as the user sees it, i.e. the current log files and the
+        tasklist. These files need not exist on disk.
+
+        :returns list: The paths to the files
+        """
+        paths = [
+            self._get_filename(period)
+            for period in (Day, Week, Month, Quarter, Year)
+        ]
+        paths.append(
+            full_file_path(root=self.location, filename=PLANNERTASKLISTFILE)
+        )
+        # kept alongside the tasklist, so that it's restored together with it
+        paths.append(
+            full_file_path(root=self.location, filename=PLANNERPLACEMENTFILE)
+        )
+        return paths
+
     def is_ok_to_advance(self, period=Year):
         """A helper to check if any time periods just advanced already have
         log files on disk, which is unexpected and an error. This is only
@@ -587,64 +795,119 @@ class FilesystemPlanner(PlannerBase):
         if period == Zero:
             return
         filename = self._get_filename(period)
-        ensure_file_does_not_exist(filename, period)
+        if self._listing is None:
+            ensure_file_does_not_exist(filename, period)
+        elif os.path.basename(filename) in self._listing:
+            raise LogfileAlreadyExistsError(
+                "New {period} logfile already exists!".format(period=period)
+            )
         self.is_ok_to_advance(get_next_period(period, decreasing=True))
 
-    def _write_log_to_file(self, period):
-        """Write the log for the given period to the filesystem.
-        If this represents an advancement of the period in question,
-        then also update the 'current' state of the planner on disk
-        by updating the relevant symbolic link.
+    def _is_log_unchanged(self, period, contents):
+        """Whether the log for the given period is the same as its file on
+        disk, so that there is no need to write it.
+
+        :param :class:`~composer.timeperiod.Period` period: A time period
+        :param str contents: The contents of the log
+        :returns bool: Whether the log is unchanged
+        """
+        if self._files is None:
+            return False
+        return self._files.is_unchanged(self._get_filename(period), contents)
+
+    def _write_log_to_file(self, period, batch=None):
+        """Write the log for the given period to the filesystem, unless it is
+        unchanged from the file on disk.
+
+        :returns str: The path to the file written, or None if it was
+            unchanged
         """
-        log = self._get_logfile(period)
+        log_attr = '_' + self._logfile_attribute(period)
+        if log_attr not in self.__dict__:
+            # the log was neither read from disk nor modified
+            return None
+        contents = self._get_logfile(period).render()
+        if self._is_log_unchanged(period, contents):
+            return None
         filename = self._get_filename(period)
         # write the file to disk
-        write_file(log, filename)
+        write_file(make_file(contents), filename, batch)
+        return filename
 
-    def _write_files_for_contained_periods(self, period):
+    def _write_files_for_contained_periods(self, period, batch=None):
         """Write all log files corresponding to periods contained within
         a given time period.
 
         :param :class:`~composer.timeperiod.Period` period: A time period
+        :param :class:`~composer.backend.filesystem.primitives.WriteBatch`
+            batch: The batch of changes to stage the files in, if any
+        :returns list: The paths to the files written
         """
         if period == Zero:
-            return
-        self._write_log_to_file(period)
-        self._write_files_for_contained_periods(
-            get_next_period(period, decreasing=True)
+            return []
+        filename = self._write_log_to_file(period, batch)
+        written = self._write_files_for_contained_periods(
+            get_next_period(period, decreasing=True), batch
         )
+        return ([filename] if filename else []) + written
 
-    def _update_current_date_link(self):
+    def _update_current_date_link(self, batch=None):
         """Update "current" link on disk to the newly created log file
         for the date to which the planner was advanced.
+
+        :param :class:`~composer.backend.filesystem.primitives.WriteBatch`
+            batch: The batch of changes to stage the link in, if any
+        :returns str: The path to the link, or None if it already pointed to
+            the current log file
         """
         link_name = PLANNERDAYFILELINK
         filelinkfn = full_file_path(root=self.location, filename=link_name)
-        if os.path.islink(filelinkfn):
-            os.remove(filelinkfn)
         filename = get_log_filename(self.date, Day)
-        os.symlink(
-            filename, filelinkfn
-        )  # don't need full path in filename since it's relative to the link
+        is_link = os.path.islink(filelinkfn)
+        if is_link and os.readlink(filelinkfn) == filename:
+            return None
+        # don't need full path in filename since it's relative to the link
+        if batch is not None:
+            batch.link(filename, filelinkfn)
+        else:
+            if is_link:
+                os.remove(filelinkfn)
+            os.symlink(filename, filelinkfn)
+        return filelinkfn
 
-    def save(self, period=Year):
+    def save(self, period=Year, batch=None):
         """Write the planner object to the filesystem.
 
         :param :class:`~composer.timeperiod.Period` period: The highest period
             advanced -- only log files encompassed by this period will be
             updated. If unspecified, all logfiles will be overwritten.
+        :param :class:`~composer.backend.filesystem.primitives.WriteBatch`
+            batch: If provided, stage the changes in this batch, to be
+            written to disk together with any other changes in the batch when
+            it is committed. Otherwise, write them immediately
+        :returns list: The paths to the files written -- logs that are
+            unchanged from the files on disk are not written
         """
 
         # write the logfile for the current period as well as all contained
         # periods, since they are all affected by the advance
-        self._write_files_for_contained_periods(period)
+        written = self._write_files_for_contained_periods(period, batch)
 
-        self._update_current_date_link()
+        link = self._update_current_date_link(batch)
+        if link:
+            written.append(link)
+        return written
 
 
 class FilesystemTasklist(TasklistBase):
 
     _file = None
+    # the placement of scheduled tasks as of the last advance
+    _placement = None
+    # the contents of the tasklist on disk, if known
+    _saved_contents = None
+    # the placement of scheduled tasks on disk, if known
+    _saved_placement = None
 
     section_name = {
         Zero: None,
@@ -661,11 +924,11 @@ class FilesystemTasklist(TasklistBase):
 
     @property
     def file(self):
-        return make_file(self._file.getvalue())
+        return make_file(self._file.render())
 
     @file.setter
     def file(self, value):
-        self._file = value
+        self._file = parse_document(value)
 
     def construct(self, location=None):
         """Construct a tasklist object from a filesystem representation.
@@ -679,6 +942,18 @@ class FilesystemTasklist(TasklistBase):
         self.file = read_file(
             full_file_path(root=location, filename=PLANNERTASKLISTFILE)
         )
+        self._saved_contents = self._file.render()
+        # knowing where tasks were placed allows the tasklist to be advanced
+        # without re-placing every task
+        try:
+            placement = read_file(
+                full_file_path(root=location, filename=PLANNERPLACEMENTFILE)
+            )
+        except FileNotFoundError:
+            pass
+        else:
+            self._placement = placement_from_string(placement.read())
+            self._saved_placement = self._placement
 
     def place_tasks(self, scheduled_tasks, reference_date):
         """Given a list of scheduled tasks, place them in the appropriate
@@ -695,26 +970,25 @@ class FilesystemTasklist(TasklistBase):
         :param :class:`datetime.date` reference_date: The reference date
             for task placement
         """
+        periods = get_time_periods(Day)
         # sort them first so that they are placed in chronological order within
         # each section
-        scheduled_tasks = sorted(
-            scheduled_tasks,
-            key=lambda entry: get_due_date(entry, reference_date)[0],
+        dated_tasks = sorted(
+            (get_due_date(entry, reference_date)[0], index, entry)
+            for index, entry in enumerate(scheduled_tasks)
+        )
+        tasks = bucket_tasks(
+            [(due_date, entry) for due_date, _, entry in dated_tasks],
+            periods,
+            get_period_end_dates(periods, reference_date),
+        )
+        self.file = self._file.add_to_sections(
+            {
+                self.section_name[period]: entries_to_string(tasks[period])
+                for period in periods
+            },
+            above=False,
         )
-        tasks = defaultdict(lambda: [])
-        for entry in scheduled_tasks:
-            due_date, _ = get_due_date(entry, reference_date)
-            for period in get_time_periods(Day):
-                # append and break if within time window
-                end_date = period.get_end_date(reference_date)
-                if due_date <= end_date:
-                    tasks[period].append(entry)
-                    break
-        for period in get_time_periods(Day):
-            tasks_to_add = entries_to_string(tasks[period])
-            self.file = add_to_section(
-                self.file, self.section_name[period], tasks_to_add, above=False
-            )
 
     def advance(self, to_date):
         """'Reverse cascade' tasks from a higher period to an upcoming lower
@@ -727,15 +1001,21 @@ class FilesystemTasklist(TasklistBase):
             "are due tomorrow",  # improve
             interactive=True,
         )
-        entries = get_entries(self.file)
-        scheduled, tasklist_no_scheduled = partition_entries(
-            entries, is_scheduled_task
+        # only move those tasks that need to move, if possible
+        advanced = advance_placement(
+            self._file, self._placement, self.section_name, to_date
         )
-        tasklist_no_scheduled = make_file(
-            entries_to_string(tasklist_no_scheduled)
+        if advanced:
+            self.file, self._placement = advanced
+            return
+        scheduled, tasklist_no_scheduled = self._file.partition_entries(
+            is_scheduled_task
         )
         self.file = tasklist_no_scheduled
         self.place_tasks(scheduled, to_date)
+        self._placement = record_placement(
+            self._file, self.section_name, to_date
+        )
 
     def standardize_entries(self, reference_date):
         """Convert all entries in the tasklist to a standard and unambiguous
@@ -748,14 +1028,11 @@ class FilesystemTasklist(TasklistBase):
         :param :class:`datetime.date` reference_date: The date relative to
             which entries are to be standardized
         """
-        entries = get_entries(self.file)
-        entries = [
-            standardize_entry_date(entry, reference_date)
+        self.file = self._file.map_entries(
+            lambda entry: standardize_entry_date(entry, reference_date)
             if is_scheduled_task(entry)
             else entry
-            for entry in entries
-        ]
-        self.file = make_file(entries_to_string(entries))
+        )
 
     def get_tasks(self, period):
         """Read the tasklist, parse all tasks under a specific time period
@@ -763,7 +1040,7 @@ class FilesystemTasklist(TasklistBase):
         with those tasks removed.
 
         :returns tuple: The tasks under the specified time period (str), and
-            the 'complement' tasklist file
+            the 'complement' tasklist document
         """
         if period == Day:
             section = 'TOMORROW'
@@ -771,13 +1048,14 @@ class FilesystemTasklist(TasklistBase):
             section = 'THIS ' + str(period).upper()
 
         try:
-            tasks, tasklist_complement = read_section(self.file, section)
+            tasks = self._file.read_section(section)
+            tasklist_complement = self._file.replace_section(section, "")
         except ValueError:
             raise TasklistLayoutError(
                 "Error: No '{section}' section found in your tasklist!"
                 " Please add one and try again.".format(section=section)
             )
-        return tasks.read(), tasklist_complement
+        return tasks, tasklist_complement
 
     def get_tasks_for_tomorrow(self):
         """Read the tasklist, parse all tasks under the TOMORROW section
@@ -794,11 +1072,50 @@ class FilesystemTasklist(TasklistBase):
         self.file = tasklist_nextday
         return tasks
 
-    def save(self):
-        """Write the tasklist object to the filesystem."""
-
-        tasklist_filename = full_file_path(
-            root=self.location, filename=PLANNERTASKLISTFILE
+    def save(self, batch=None):
+        """Write the tasklist object to the filesystem, along with the
+        placement of its scheduled tasks.
+
+        :param :class:`~composer.backend.filesystem.primitives.WriteBatch`
+            batch: If provided, stage the tasklist in this batch, to be
+            written to disk together with any other changes in the batch when
+            it is committed. Otherwise, write it immediately
+        :returns list: The paths to the files written, i.e. none if the
+            tasklist and the placement of its tasks are unchanged from the
+            files on disk
+        """
+        written = []
+        contents = self._file.render()
+        if contents != self._saved_contents:
+            tasklist_filename = full_file_path(
+                root=self.location, filename=PLANNERTASKLISTFILE
+            )
+            write_file(make_file(contents), tasklist_filename, batch)
+            self._saved_contents = contents
+            written.append(tasklist_filename)
+        if self._placement_changed():
+            placement_filename = full_file_path(
+                root=self.location, filename=PLANNERPLACEMENTFILE
+            )
+            write_file(
+                make_file(placement_to_string(self._placement)),
+                placement_filename,
+                batch,
+            )
+            self._saved_placement = self._placement
+            written.append(placement_filename)
+        return written
+
+    def _placement_changed(self):
+        """Whether the placement of tasks differs from the one on disk. A
+        placement that differs only in its reference date need not be saved,
+        since the horizons of unmodified sections remain valid for any later
+        date.
+        """
+        if self._placement is None:
+            return False
+        saved = self._saved_placement
+        return saved is None or (saved.sections, saved.horizons) != (
+            self._placement.sections,
+            self._placement.horizons,
         )
-
-        write_file(self.file, tasklist_filename)
@@ -0,0 +1,105 @@
+import bisect
+
+from ...timeperiod import get_time_periods, Day
+from .primitives import (
+    DirectoryListing,
+    full_file_path,
+    get_log_filename,
+    parse_log_filename,
+)
+
+
+class WikiCatalog(object):
+    """The logs present in a wiki, identified from the names of the files in
+    it. For each time period, the start dates of the logs are kept in order,
+    so that the logs for any range of dates can be found without going to
+    disk for each date in the range.
+
+    The catalog is kept up to date with the wiki on disk as it is used, by
+    listing the wiki again whenever it has changed, and only identifying
+    those files that have been added or removed since.
+    """
+
+    def __init__(self, location):
+        """
+        :param str location: Filesystem path to the planner wiki
+        """
+        self.location = location
+        self._listing = DirectoryListing(location)
+        self._start_dates = dict(
+            (period, []) for period in get_time_periods(Day)
+        )
+
+    def refresh(self):
+        """Bring the catalog up to date with the wiki on disk, if it has
+        changed.
+        """
+        previous = self._listing.names
+        if not self._listing.refresh():
+            return
+        current = self._listing.names
+        for filename in previous - current:
+            log = parse_log_filename(filename)
+            if log:
+                (period, start_date) = log
+                start_dates = self._start_dates[period]
+                del start_dates[bisect.bisect_left(start_dates, start_date)]
+        for filename in current - previous:
+            log = parse_log_filename(filename)
+            if log:
+                (period, start_date) = log
+                bisect.insort(self._start_dates[period], start_date)
+
+    def has_log(self, period, start_date):
+        """Whether the wiki has the log for the given period starting on the
+        given date.
+
+        :param :class:`~composer.timeperiod.Period` period: The time period
+        :param :class:`datetime.date` start_date: The start date of the log
+        :returns bool: Whether the log exists
+        """
+        self.refresh()
+        start_dates = self._start_dates.get(period, [])
+        index = bisect.bisect_left(start_dates, start_date)
+        return index < len(start_dates) and start_dates[index] == start_date
+
+    def get_start_dates(self, period, start=None, end=None):
+        """The start dates of the logs in the wiki for a period, in order.
+
+        :param :class:`~composer.timeperiod.Period` period: The time period
+        :param :class:`datetime.date` start: If provided, only logs starting
+            on or after this date are of interest
+        :param :class:`datetime.date` end: If provided, only logs starting
+            on or before this date are of interest
+        :returns list: The start dates
+        """
+        self.refresh()
+        start_dates = self._start_dates.get(period, [])
+        lower = 0 if start is None else bisect.bisect_left(start_dates, start)
+        upper = (
+            len(start_dates)
+            if end is None
+            else bisect.bisect_right(start_dates, end)
+        )
+        return start_dates[lower:upper]
+
+    def get_paths(self, period, start=None, end=None):
+        """The paths to the logs in the wiki for a period, in order of their
+        start dates.
+
+        :param :class:`~composer.timeperiod.Period` period: The time period
+        :param :class:`datetime.date` start: If provided, only logs starting
+            on or after this date are of interest
+        :param :class:`datetime.date` end: If provided, only logs starting
+            on or before this date are of interest
+        :returns list: Pairs of the start date and the path to each log
+        """
+        return [
+            (
+                start_date,
+                full_file_path(
+                    get_log_filename(start_date, period), root=self.location
+                ),
+            )
+            for start_date in self.get_start_dates(period, start, end)
+        ]
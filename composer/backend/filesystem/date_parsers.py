@@ -1,10 +1,11 @@
+import calendar
 import datetime
 import re
 
 from ...errors import RelativeDateError
 from ...timeperiod import (
     get_next_day,
-    get_next_month,
+    period_calendar,
     Day,
     Week,
     Month,
@@ -13,8 +14,6 @@ from ...timeperiod import (
     Eternity,
     month_for_quarter,
     quarter_for_month,
-    get_month_name,
-    get_month_number,
     day_of_week,
     upcoming_dow_to_date,
 )
@@ -90,6 +89,40 @@ dateformat28 = re.compile(
 )
 
 
+MONTH_NUMBERS = dict(
+    (name.upper(), number)
+    for number, name in enumerate(calendar.month_name)
+    if name
+)
+DAYS_OF_WEEK = tuple(name.upper() for name in calendar.day_name)
+DAYS_OF_WEEK_ABBREVIATED = tuple(name.upper() for name in calendar.day_abbr)
+
+
+def _month_number(month):
+    """The calendar number for a (case-insensitive) month name. Raises
+    ValueError if the name isn't recognized.
+
+    :param str month: The name of the month
+    :returns int: The number of the month
+    """
+    try:
+        return MONTH_NUMBERS[month.upper()]
+    except KeyError:
+        raise ValueError("Unknown month {}".format(month))
+
+
+def _upcoming_weekday(weekday, reference_date):
+    """The first date strictly after the reference date that falls on the
+    given day of the week.
+
+    :param int weekday: The day of the week, with Monday as 0
+    :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :returns :class:`datetime.date`: The upcoming date
+    """
+    days_ahead = (weekday - reference_date.weekday() - 1) % 7 + 1
+    return reference_date + datetime.timedelta(days=days_ahead)
+
+
 def get_appropriate_year(month, day, reference_date):
     """For date formats where the year is unspecified, determine the
     appropriate year by ensuring that the resulting date is in the future.
@@ -108,122 +141,128 @@ def get_appropriate_year(month, day, reference_date):
         return reference_date.year
 
 
-def parse_dateformat1(date_string, reference_date=None):
+def parse_dateformat1(date_string, reference_date=None, groups=None):
     """Parse date format
         MONTH DD, YYYY (w optional space or comma or both)
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (month, day, year) = dateformat1.search(date_string).groups()
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    (month, day, year) = groups or dateformat1.search(date_string).groups()
+    date = datetime.date(int(year), _month_number(month), int(day))
     period = Day
     return date, period
 
 
-def parse_dateformat2(date_string, reference_date=None):
+def parse_dateformat2(date_string, reference_date=None, groups=None):
     """Parse date format
         DD MONTH, YYYY (w optional space or comma or both)
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (day, month, year) = dateformat2.search(date_string).groups()
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    (day, month, year) = groups or dateformat2.search(date_string).groups()
+    date = datetime.date(int(year), _month_number(month), int(day))
     period = Day
     return date, period
 
 
-def parse_dateformat3(date_string, reference_date=None):
+def parse_dateformat3(date_string, reference_date=None, groups=None):
     """Parse date format
         MONTH DD
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    (month, day) = dateformat3.search(date_string).groups()
-    (monthn, dayn) = (get_month_number(month), int(day))
-    year = str(get_appropriate_year(monthn, dayn, reference_date))
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    (month, day) = groups or dateformat3.search(date_string).groups()
+    (monthn, dayn) = (_month_number(month), int(day))
+    year = get_appropriate_year(monthn, dayn, reference_date)
+    date = datetime.date(year, monthn, dayn)
     period = Day
     return date, period
 
 
-def parse_dateformat4(date_string, reference_date=None):
+def parse_dateformat4(date_string, reference_date=None, groups=None):
     """Parse date format
         DD MONTH
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    (day, month) = dateformat4.search(date_string).groups()
-    (monthn, dayn) = (get_month_number(month), int(day))
-    year = str(get_appropriate_year(monthn, dayn, reference_date))
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    (day, month) = groups or dateformat4.search(date_string).groups()
+    (monthn, dayn) = (_month_number(month), int(day))
+    year = get_appropriate_year(monthn, dayn, reference_date)
+    date = datetime.date(year, monthn, dayn)
     period = Day
     return date, period
 
 
-def parse_dateformat5(date_string, reference_date=None):
+def parse_dateformat5(date_string, reference_date=None, groups=None):
     """Parse date format
         WEEK OF MONTH DD, YYYY (w optional space or comma or both)
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     # std = Week of Month dd(sunday/1), yyyy
-    (month, day, year) = dateformat5.search(date_string).groups()
-    (monthn, dayn, yearn) = (get_month_number(month), int(day), int(year))
+    (month, day, year) = groups or dateformat5.search(date_string).groups()
+    (monthn, dayn, yearn) = (_month_number(month), int(day), int(year))
     date = datetime.date(yearn, monthn, dayn)
     date = Week.get_start_date(date)
     period = Week
     return date, period
 
 
-def parse_dateformat6(date_string, reference_date=None):
+def parse_dateformat6(date_string, reference_date=None, groups=None):
     """Parse date format
         WEEK OF DD MONTH, YYYY (w optional space or comma or both)
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (day, month, year) = dateformat6.search(date_string).groups()
-    (monthn, dayn, yearn) = (get_month_number(month), int(day), int(year))
+    (day, month, year) = groups or dateformat6.search(date_string).groups()
+    (monthn, dayn, yearn) = (_month_number(month), int(day), int(year))
     date = datetime.date(yearn, monthn, dayn)
     date = Week.get_start_date(date)
     period = Week
     return date, period
 
 
-def parse_dateformat7(date_string, reference_date=None):
+def parse_dateformat7(date_string, reference_date=None, groups=None):
     """Parse date format
         WEEK OF MONTH DD
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    (month, day) = dateformat7.search(date_string).groups()
-    (monthn, dayn) = (get_month_number(month), int(day))
+    (month, day) = groups or dateformat7.search(date_string).groups()
+    (monthn, dayn) = (_month_number(month), int(day))
     yearn = get_appropriate_year(monthn, dayn, reference_date)
     date = datetime.date(yearn, monthn, dayn)
     date = Week.get_start_date(date)
@@ -231,19 +270,21 @@ def parse_dateformat7(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat8(date_string, reference_date=None):
+def parse_dateformat8(date_string, reference_date=None, groups=None):
     """Parse date format
         WEEK OF DD MONTH
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    (day, month) = dateformat8.search(date_string).groups()
-    (monthn, dayn) = (get_month_number(month), int(day))
+    (day, month) = groups or dateformat8.search(date_string).groups()
+    (monthn, dayn) = (_month_number(month), int(day))
     yearn = get_appropriate_year(monthn, dayn, reference_date)
     date = datetime.date(yearn, monthn, dayn)
     date = Week.get_start_date(date)
@@ -251,77 +292,83 @@ def parse_dateformat8(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat9(date_string, reference_date=None):
+def parse_dateformat9(date_string, reference_date=None, groups=None):
     """Parse date format
         MONTH YYYY (w optional space or comma or both)
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (month, year) = dateformat9.search(date_string).groups()
-    day = str(1)
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    (month, year) = groups or dateformat9.search(date_string).groups()
+    date = datetime.date(int(year), _month_number(month), 1)
     period = Month
     return date, period
 
 
-def parse_dateformat10(date_string, reference_date=None):
+def parse_dateformat10(date_string, reference_date=None, groups=None):
     """Parse date format
         MONTH
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    month = dateformat10.search(date_string).groups()[0]
-    (monthn, dayn) = (get_month_number(month), 1)
-    (day, year) = (
-        str(dayn),
-        str(get_appropriate_year(monthn, dayn, reference_date)),
-    )
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    (month,) = groups or dateformat10.search(date_string).groups()
+    (monthn, dayn) = (_month_number(month), 1)
+    year = get_appropriate_year(monthn, dayn, reference_date)
+    date = datetime.date(year, monthn, dayn)
     period = Month
     return date, period
 
 
-def parse_dateformat11(date_string, reference_date=None):
+def parse_dateformat11(date_string, reference_date=None, groups=None):
     """Parse date format
         MM/DD/YYYY
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (monthn, dayn, yearn) = map(int, dateformat11.search(date_string).groups())
+    (monthn, dayn, yearn) = map(
+        int, groups or dateformat11.search(date_string).groups()
+    )
     date = datetime.date(yearn, monthn, dayn)
     period = Day
     return date, period
 
 
-def parse_dateformat12(date_string, reference_date=None):
+def parse_dateformat12(date_string, reference_date=None, groups=None):
     """Parse date format
         MM-DD-YYYY
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (monthn, dayn, yearn) = map(int, dateformat12.search(date_string).groups())
+    (monthn, dayn, yearn) = map(
+        int, groups or dateformat12.search(date_string).groups()
+    )
     date = datetime.date(yearn, monthn, dayn)
     period = Day
     return date, period
 
 
-def parse_dateformat13(date_string, reference_date=None):
+def parse_dateformat13(date_string, reference_date=None, groups=None):
     """Parse date format
         TOMORROW
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
@@ -333,25 +380,36 @@ def parse_dateformat13(date_string, reference_date=None):
     return date, period
 
 
+def _following_period_start(period, reference_date):
+    """The start of the period following the one containing the reference
+    date, unless that is tomorrow, in which case the start of the period after
+    that. E.g. on Saturday, "next week" means a week later.
+
+    :param :class:`~composer.timeperiod.Period` period: The time period
+    :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :returns :class:`datetime.date`: The start of the following period
+    """
+    date = period_calendar.next_boundary(reference_date, period)
+    if date == reference_date + datetime.timedelta(days=1):
+        date = period_calendar.next_boundary(date, period)
+    return date
+
+
 def _weeks_from(how_many, reference_date):
     date = reference_date
     while how_many > 0:
-        week_end_date = Week.get_end_date(date)
-        if week_end_date == date:
-            # on Saturday, "next week" means a week later
-            week_end_date = Week.get_end_date(
-                date + datetime.timedelta(days=1)
-            )
-        date = week_end_date + datetime.timedelta(days=1)
+        date = _following_period_start(Week, date)
         how_many -= 1
     return date
 
 
-def parse_dateformat14(date_string, reference_date=None):
+def parse_dateformat14(date_string, reference_date=None, groups=None):
     """Parse date format
         NEXT WEEK
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
@@ -363,122 +421,126 @@ def parse_dateformat14(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat15(date_string, reference_date=None):
+def parse_dateformat15(date_string, reference_date=None, groups=None):
     """Parse date format
         NEXT MONTH
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    month_end = Month.get_end_date(reference_date)
-    date = month_end + datetime.timedelta(days=1)
-    if month_end == reference_date:
-        # on the last day of the month, we mean the following month,
-        # not tomorrow. although, maybe we should broaden this handling
-        # to the last week of the month and not just the last day
-        date = Month.get_end_date(date) + datetime.timedelta(days=1)
+    # on the last day of the month, we mean the following month,
+    # not tomorrow. although, maybe we should broaden this handling
+    # to the last week of the month and not just the last day
+    date = _following_period_start(Month, reference_date)
     period = Month
     return date, period
 
 
-def parse_dateformat16(date_string, reference_date=None):
+def parse_dateformat16(date_string, reference_date=None, groups=None):
     """Parse date format
         <DOW>
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    dowToSchedule = dateformat16.search(date_string).groups()[0]
-    upcomingweek = [
-        reference_date + datetime.timedelta(days=d) for d in range(1, 8)
-    ]
-    dow = [d.strftime("%A").upper() for d in upcomingweek]
-    date = upcomingweek[dow.index(dowToSchedule)]
+    (dowToSchedule,) = groups or dateformat16.search(date_string).groups()
+    date = _upcoming_weekday(DAYS_OF_WEEK.index(dowToSchedule), reference_date)
     period = Day
     return date, period
 
 
-def parse_dateformat17(date_string, reference_date=None):
+def parse_dateformat17(date_string, reference_date=None, groups=None):
     """Parse date format
         <DOW> (abbrv.)
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    dowToSchedule = dateformat17.search(date_string).groups()[0]
-    upcomingweek = [
-        reference_date + datetime.timedelta(days=d) for d in range(1, 8)
-    ]
-    dow = [d.strftime("%a").upper() for d in upcomingweek]
-    date = upcomingweek[dow.index(dowToSchedule)]
+    (dowToSchedule,) = groups or dateformat17.search(date_string).groups()
+    date = _upcoming_weekday(
+        DAYS_OF_WEEK_ABBREVIATED.index(dowToSchedule), reference_date
+    )
     period = Day
     return date, period
 
 
-def parse_dateformat18(date_string, reference_date=None):
+def parse_dateformat18(date_string, reference_date=None, groups=None):
     """Parse date format
         QN YYYY
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    (quarter, year) = dateformat18.search(date_string).groups()
+    (quarter, year) = groups or dateformat18.search(date_string).groups()
     month = month_for_quarter(quarter)
-    month = get_month_name(month)
-    day = str(1)
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+    if month is None:
+        raise ValueError("Unknown quarter {}".format(quarter))
+    date = datetime.date(int(year), month, 1)
     period = Quarter
     return date, period
 
 
-def parse_dateformat19(date_string, reference_date=None):
+def parse_dateformat19(date_string, reference_date=None, groups=None):
     """Parse date format
         NEXT YEAR
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    date = Year.get_end_date(reference_date) + datetime.timedelta(days=1)
+    date = period_calendar.next_boundary(reference_date, Year)
     period = Year
     return date, period
 
 
-def parse_dateformat20(date_string, reference_date=None):
+def parse_dateformat20(date_string, reference_date=None, groups=None):
     """Parse date format
         YYYY
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
-    year = int(dateformat20.search(date_string).groups()[0])
+    (year,) = groups or dateformat20.search(date_string).groups()
+    year = int(year)
     date = datetime.date(year, 1, 1)
     period = Year
     return date, period
 
 
-def parse_dateformat21(date_string, reference_date=None):
+def parse_dateformat21(date_string, reference_date=None, groups=None):
     """Parse date format
         THIS WEEKEND
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
@@ -493,11 +555,13 @@ def parse_dateformat21(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat22(date_string, reference_date=None):
+def parse_dateformat22(date_string, reference_date=None, groups=None):
     """Parse date format
         NEXT WEEKEND
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
@@ -511,50 +575,56 @@ def parse_dateformat22(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat23(date_string, reference_date=None):
+def parse_dateformat23(date_string, reference_date=None, groups=None):
     """Parse date format
         NEXT QUARTER
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    date = Quarter.get_end_date(reference_date) + datetime.timedelta(days=1)
+    date = period_calendar.next_boundary(reference_date, Quarter)
     period = Quarter
     return date, period
 
 
-def parse_dateformat24(date_string, reference_date=None):
+def parse_dateformat24(date_string, reference_date=None, groups=None):
     """Parse date format
         QN
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    quarter = dateformat24.search(date_string).groups()[0]
+    (quarter,) = groups or dateformat24.search(date_string).groups()
     # start date of next quarter
-    date = Quarter.get_end_date(reference_date) + datetime.timedelta(days=1)
+    date = period_calendar.next_boundary(reference_date, Quarter)
     next_quarter = quarter_for_month(date.month)
     # find the specified quarter
     while next_quarter != quarter:
-        date = Quarter.get_end_date(date) + datetime.timedelta(days=1)
+        date = period_calendar.next_boundary(date, Quarter)
         next_quarter = quarter_for_month(date.month)
     period = Quarter
     return date, period
 
 
-def parse_dateformat25(date_string, reference_date=None):
+def parse_dateformat25(date_string, reference_date=None, groups=None):
     """Parse date format
         DAY AFTER TOMORROW
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
@@ -566,7 +636,7 @@ def parse_dateformat25(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat26(date_string, reference_date=None):
+def parse_dateformat26(date_string, reference_date=None, groups=None):
     """Parse date format
         SOMEDAY
     This is a special date format indicating a "suspended" task. For the
@@ -575,6 +645,8 @@ def parse_dateformat26(date_string, reference_date=None):
 
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     date = Eternity.get_end_date()
@@ -582,62 +654,54 @@ def parse_dateformat26(date_string, reference_date=None):
     return date, period
 
 
-def parse_dateformat27(date_string, reference_date=None):
+def parse_dateformat27(date_string, reference_date=None, groups=None):
     """Parse date format
         WEEK AFTER NEXT
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    week_end_date = Week.get_end_date(reference_date)
-    if week_end_date == reference_date:
-        # on Saturday, "next week" means a week later
-        week_end_date = Week.get_end_date(
-            reference_date + datetime.timedelta(days=1)
-        )
-    next_week_start = week_end_date + datetime.timedelta(days=1)
-    date = Week.get_end_date(next_week_start) + datetime.timedelta(days=1)
+    next_week_start = _weeks_from(1, reference_date)
+    date = period_calendar.next_boundary(next_week_start, Week)
     period = Week
     return date, period
 
 
-def parse_dateformat28(date_string, reference_date=None):
+def parse_dateformat28(date_string, reference_date=None, groups=None):
     """Parse date format
         (FIRST|SECOND|THIRD|FOURTH|LAST) WEEK OF <MONTH|THE MONTH>
     :param str date_string: The string representation of the date
     :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :param tuple groups: The groups captured by the pattern for this format,
+        if the date string has already been matched against it
     :returns tuple: The parsed date, together with the relevant time period.
     """
     if not reference_date:
         raise RelativeDateError(
             "Relative date found, but no context available"
         )
-    which_week = dateformat28.search(date_string).groups()[0]
-    month_string = dateformat28.search(date_string).groups()[1]
+    (which_week, month_string) = (
+        groups or dateformat28.search(date_string).groups()
+    )
     if month_string == "THE MONTH":
         (monthn, dayn) = (reference_date.month, 1)
-        month = get_month_name(monthn)
     else:
-        month = month_string
-        (monthn, dayn) = (get_month_number(month), 1)
-    (day, year) = (
-        str(dayn),
-        str(get_appropriate_year(monthn, dayn, reference_date)),
-    )
-    date = datetime.datetime.strptime(
-        month + "-" + day + "-" + year, "%B-%d-%Y"
-    ).date()
+        (monthn, dayn) = (_month_number(month_string), 1)
+    year = get_appropriate_year(monthn, dayn, reference_date)
+    date = datetime.date(year, monthn, dayn)
     if (
         month_string == "THE MONTH"
         and date - reference_date > datetime.timedelta(weeks=5)
     ):
         # eg. "first week of the month" in the last week
         # of the month means the following month
-        date = get_next_month(reference_date)
+        date = period_calendar.next_boundary(reference_date, Month)
     if which_week == "FIRST":
         how_many_weeks = 0
     elif which_week == "SECOND":
@@ -655,3 +719,217 @@ def parse_dateformat28(date_string, reference_date=None):
             date = following_week_start
     period = Week
     return date, period
+
+
+# All of the supported date formats, in order of precedence, for date strings
+# that match more than one format (e.g. "SOMEDAY" would also match MONTH)
+DATE_FORMATS = (
+    (dateformat28, parse_dateformat28),
+    (dateformat27, parse_dateformat27),
+    (dateformat26, parse_dateformat26),
+    (dateformat1, parse_dateformat1),
+    (dateformat2, parse_dateformat2),
+    (dateformat18, parse_dateformat18),
+    (dateformat3, parse_dateformat3),
+    (dateformat4, parse_dateformat4),
+    (dateformat5, parse_dateformat5),
+    (dateformat6, parse_dateformat6),
+    (dateformat7, parse_dateformat7),
+    (dateformat8, parse_dateformat8),
+    (dateformat9, parse_dateformat9),
+    (dateformat13, parse_dateformat13),
+    (dateformat25, parse_dateformat25),
+    (dateformat16, parse_dateformat16),
+    (dateformat17, parse_dateformat17),
+    (dateformat10, parse_dateformat10),
+    (dateformat11, parse_dateformat11),
+    (dateformat12, parse_dateformat12),
+    (dateformat14, parse_dateformat14),
+    (dateformat15, parse_dateformat15),
+    (dateformat19, parse_dateformat19),
+    (dateformat23, parse_dateformat23),
+    (dateformat24, parse_dateformat24),
+    (dateformat21, parse_dateformat21),
+    (dateformat22, parse_dateformat22),
+    (dateformat20, parse_dateformat20),
+)
+
+
+def _combine_date_formats(formats):
+    """Combine the patterns for all of the date formats into a single
+    pattern that is an alternation of each of them, in order of precedence.
+    As each alternative is anchored at both ends, the first alternative to
+    match is the same format that trying each pattern in turn would find.
+
+    :param tuple formats: The (pattern, parser) pairs in order of precedence
+    :returns tuple: The combined pattern, and a mapping of the name of the
+        group for each alternative to the parser for that format together with
+        the span of its groups in the combined match
+    """
+    alternatives = []
+    for index, (pattern, _) in enumerate(formats):
+        # strip the anchors from each pattern -- the combined pattern is
+        # anchored instead
+        source = pattern.pattern[1:-1]
+        alternatives.append("(?P<format{}>{})".format(index, source))
+    grammar = re.compile(
+        r"^(?:" + "|".join(alternatives) + r")$", re.IGNORECASE
+    )
+    dispatch = {}
+    for index, (pattern, parse) in enumerate(formats):
+        name = "format{}".format(index)
+        # the groups within an alternative immediately follow the group for
+        # the alternative itself
+        start = grammar.groupindex[name]
+        dispatch[name] = (parse, start, start + pattern.groups)
+    return grammar, dispatch
+
+
+DATE_GRAMMAR, _DATE_DISPATCH = _combine_date_formats(DATE_FORMATS)
+
+# formats that consist of fixed words, e.g. TOMORROW or (MON|TUE|...)
+LITERAL_FORMAT_PATTERN = re.compile(r"^\^\(?([A-Z |]+)\)?\$$")
+
+
+def _literal_date_formats(formats):
+    """Build a lookup table for date strings that are fixed words (e.g.
+    "NEXT WEEK"), mapping each of them to the parser for the first format (in
+    order of precedence) that it matches.
+
+    :param tuple formats: The (pattern, parser) pairs in order of precedence
+    :returns dict: A mapping of (upper case) date strings to the parser for
+        the format and whether the parser expects the string as a group
+    """
+    literals = {}
+    for pattern, parse in formats:
+        match = LITERAL_FORMAT_PATTERN.match(pattern.pattern)
+        if not match:
+            continue
+        for literal in match.group(1).split("|"):
+            first_match = next(
+                parser for (p, parser) in formats if p.search(literal)
+            )
+            if first_match is parse:
+                literals[literal] = (parse, pattern.groups > 0)
+    return literals
+
+
+_LITERAL_DATES = _literal_date_formats(DATE_FORMATS)
+
+# the "standard" formats in which dates are written by
+# :func:`~composer.backend.filesystem.scheduling.date_to_string`, which
+# account for the vast majority of dates parsed
+STANDARD_DATE_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<week>WEEK OF )?(?P<month>[A-Z]+) (?P<day>\d\d?), (?P<year>\d{4})"
+    r"|(?P<month_of_month>[A-Z]+) (?P<year_of_month>\d{4})"
+    r"|Q(?P<quarter>[1-4]) (?P<year_of_quarter>\d{4})"
+    r"|(?P<year_of_year>\d{4})"
+    r")$"
+)
+
+
+def _parse_standard_date(date_string):
+    """Parse a date string that is in one of the standard formats, building
+    the date directly from the captured fields.
+
+    :param str date_string: The string representation of the date
+    :returns tuple: The parsed date, together with the relevant time period,
+        or None if the string is not in a standard format
+    """
+    match = STANDARD_DATE_PATTERN.match(date_string)
+    if not match:
+        return None
+    fields = match.groupdict()
+    if fields['day']:
+        month = MONTH_NUMBERS.get(fields['month'])
+        if not month:
+            return None
+        date = datetime.date(int(fields['year']), month, int(fields['day']))
+        if fields['week']:
+            return Week.get_start_date(date), Week
+        return date, Day
+    elif fields['month_of_month']:
+        month = MONTH_NUMBERS.get(fields['month_of_month'])
+        if not month:
+            return None
+        return datetime.date(int(fields['year_of_month']), month, 1), Month
+    elif fields['quarter']:
+        month = 3 * (int(fields['quarter']) - 1) + 1
+        return datetime.date(int(fields['year_of_quarter']), month, 1), Quarter
+    return datetime.date(int(fields['year_of_year']), 1, 1), Year
+
+
+# formats whose dates are specified relative to a reference date
+RELATIVE_DATE_PARSERS = frozenset(
+    (
+        parse_dateformat3,
+        parse_dateformat4,
+        parse_dateformat7,
+        parse_dateformat8,
+        parse_dateformat10,
+        parse_dateformat13,
+        parse_dateformat14,
+        parse_dateformat15,
+        parse_dateformat16,
+        parse_dateformat17,
+        parse_dateformat19,
+        parse_dateformat21,
+        parse_dateformat22,
+        parse_dateformat23,
+        parse_dateformat24,
+        parse_dateformat25,
+        parse_dateformat27,
+        parse_dateformat28,
+    )
+)
+
+
+def match_date_format(date_string):
+    """Identify the format of a date string.
+
+    :param str date_string: The string representation of the date
+    :returns tuple: The parser for the format together with the groups
+        captured from the date string, or None if the string does not match
+        any format
+    """
+    literal = _LITERAL_DATES.get(date_string.upper())
+    if literal:
+        parse, takes_group = literal
+        return parse, (date_string,) if takes_group else ()
+    match = DATE_GRAMMAR.match(date_string)
+    if not match:
+        return None
+    parse, start, end = _DATE_DISPATCH[match.lastgroup]
+    return parse, match.groups()[start:end]
+
+
+def is_relative_date_string(date_string):
+    """Whether a date string specifies a date relative to some reference
+    date (e.g. "TOMORROW") rather than an absolute one (e.g. "2025").
+
+    :param str date_string: The string representation of the date
+    :returns bool: Whether the date is relative
+    """
+    matched = match_date_format(date_string)
+    return bool(matched) and matched[0] in RELATIVE_DATE_PARSERS
+
+
+def parse_date_string(date_string, reference_date=None):
+    """Parse a string representing a date in any of the supported formats.
+    The format is identified by a single lookup or match against the combined
+    date grammar, with a fast path for dates in the standard formats.
+
+    :param str date_string: The string representation of the date
+    :param :class:`datetime.date` reference_date: Date to be treated as "today"
+    :returns tuple: The parsed date, together with the relevant time period,
+        or None if the string does not match any format
+    """
+    result = _parse_standard_date(date_string)
+    if result:
+        return result
+    matched = match_date_format(date_string)
+    if not matched:
+        return None
+    parse, groups = matched
+    return parse(date_string, reference_date, groups=groups)
@@ -1,8 +1,8 @@
 import os
-from datetime import timedelta
 from ...timeperiod import get_next_period, Day
 from ...errors import LogfileAlreadyExistsError
 
+from .catalog import WikiCatalog
 from .primitives import get_log_filename, read_file
 
 try:  # py3
@@ -27,7 +27,8 @@ def get_log_for_date(period, for_date, planner_root):
         for which we want the log file
     :param :class:`datetime.date` for_date: The date of interest
     :param str planner_root: The root path of the planner wiki
-    :returns :class:`io.StringIO`: The log file
+    :returns :class:`~composer.backend.filesystem.primitives.LogicalFile`:
+        The log file
     """
     if period < Day:
         return None
@@ -40,39 +41,71 @@ def get_log_for_date(period, for_date, planner_root):
     return log
 
 
-def get_constituent_logs(period, for_date, planner_root):
+class LogRecord(object):
+    """A log in the wiki, identified by its time period and start date. The
+    contents of the log are only read from disk when they are first asked
+    for.
+    """
+
+    def __init__(self, period, start_date, path):
+        """
+        :param :class:`~composer.timeperiod.Period` period: The time period
+            of the log
+        :param :class:`datetime.date` start_date: The start date of the log
+        :param str path: The path to the log file
+        """
+        self.period = period
+        self.start_date = start_date
+        self.path = path
+        self._contents = None
+
+    @property
+    def contents(self):
+        """The log file, read from disk the first time it is accessed.
+
+        :returns :class:`~composer.backend.filesystem.primitives.LogicalFile`:
+            The log file
+        """
+        if self._contents is None:
+            self._contents = read_file(self.path)
+        return self._contents
+
+    def __repr__(self):
+        return "LogRecord({period}, {start_date}, {path!r})".format(
+            period=self.period, start_date=self.start_date, path=self.path
+        )
+
+
+def get_constituent_logs(period, for_date, planner_root, catalog=None):
     """Get logfiles for the smaller time period constituting the specified
     time period, e.g. all of the day logfiles for the week.
 
+    The logs are found from a listing of the wiki rather than by looking for
+    each one on disk, and are only read as they are consumed. Missing logs,
+    e.g. those for the remainder of an in-progress period, are skipped.
+
     :param :class:`~composer.timeperiod.Period` period: The time period
         for which we want constituent log files
     :param :class:`datetime.date` for_date: The date of interest
     :param str planner_root: The root path of the planner wiki
-    :returns list: The constituent logs
+    :param :class:`~composer.backend.filesystem.catalog.WikiCatalog` catalog:
+        A catalog of the wiki to use, if one is already at hand
+    :returns iterator: The constituent logs, as :class:`LogRecord` instances
+        in order of their start dates
     """
     if period <= Day:
-        return []
+        return
+    if catalog is None:
+        catalog = WikiCatalog(planner_root)
     start_date = period.get_start_date(for_date)
     end_date = period.get_end_date(for_date)
     constituent_period = get_next_period(period, decreasing=True)
-    logs = []
-    current_date = start_date
-    constituent_end_date = constituent_period.get_end_date(current_date)
-    while constituent_end_date <= end_date:
-        try:
-            log = get_log_for_date(
-                constituent_period, current_date, planner_root
-            )
-        except FileNotFoundError:
-            # could be an in-progress period, i.e. no log yet exists
-            # or just a missing log. we just skip over it and continue until we
-            # hit the end date of the higher period to be sure
-            pass
-        else:
-            logs.append(log)
-        current_date = constituent_end_date + timedelta(days=1)
-        constituent_end_date = constituent_period.get_end_date(current_date)
-    return logs
+    # each period is composed exactly of the constituent periods beginning
+    # within it
+    for (log_start_date, path) in catalog.get_paths(
+        constituent_period, start_date, end_date
+    ):
+        yield LogRecord(constituent_period, log_start_date, path)
 
 
 def ensure_file_does_not_exist(filename, period):
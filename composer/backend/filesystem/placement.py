@@ -0,0 +1,280 @@
+import bisect
+import datetime
+import hashlib
+import json
+from collections import defaultdict, namedtuple
+
+from ...timeperiod import get_time_periods, Day
+from .primitives import entries_to_string, is_scheduled_task
+from .scheduling import get_due_date, has_relative_due_date
+
+# Scheduled tasks in the tasklist are filed under the section for the
+# smallest period (relative to some reference date) that contains their due
+# date. As the reference date advances, period end dates only ever move
+# later, so tasks only ever move to lower sections, and each section's tasks
+# need to move no sooner than the date at which the end of the next lower
+# period catches up with the earliest of their due dates -- the "horizon"
+# for the section. Keeping track of these horizons allows the tasklist to be
+# advanced by touching only those sections whose tasks are due to move,
+# rather than re-placing every scheduled task in the tasklist.
+
+# A record of the placement of scheduled tasks in a tasklist as of a
+# particular reference date. The sections are digests of those of the
+# tasklist immediately after placement, so that any sections that have since
+# been modified can be identified, even in a tasklist freshly read from disk.
+# The horizons are the earliest due dates among the scheduled tasks in each
+# section, indexed by position
+TaskPlacement = namedtuple(
+    "TaskPlacement", ["reference_date", "sections", "horizons"]
+)
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _section_digest(section):
+    return hashlib.sha1(section.render().encode("utf-8")).hexdigest()
+
+
+def _section_digests(document):
+    return tuple(_section_digest(section) for section in document.sections)
+
+
+def placement_to_string(placement):
+    """A text representation of a placement, so that it can be kept on disk
+    alongside the tasklist.
+
+    :param :class:`TaskPlacement` placement: The placement
+    :returns str: The text representation
+    """
+    return json.dumps(
+        {
+            "reference_date": placement.reference_date.strftime(DATE_FORMAT),
+            "sections": list(placement.sections),
+            "horizons": dict(
+                (str(position), horizon.strftime(DATE_FORMAT))
+                for position, horizon in placement.horizons.items()
+            ),
+        },
+        sort_keys=True,
+    )
+
+
+def placement_from_string(text):
+    """Read a placement from its text representation.
+
+    :param str text: The text representation (see
+        :func:`placement_to_string`)
+    :returns :class:`TaskPlacement`: The placement, or None if the text
+        isn't a valid placement
+    """
+
+    def to_date(datestr):
+        return datetime.datetime.strptime(datestr, DATE_FORMAT).date()
+
+    try:
+        record = json.loads(text)
+        return TaskPlacement(
+            to_date(record["reference_date"]),
+            tuple(record["sections"]),
+            dict(
+                (int(position), to_date(horizon))
+                for position, horizon in record["horizons"].items()
+            ),
+        )
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def get_period_end_dates(periods, reference_date):
+    """The end dates of the given periods relative to a reference date, in a
+    form suitable for bisection.
+
+    A task is filed under the first period whose window it falls within.
+    Taking the running maximum of the end dates leaves that unchanged but
+    ensures that they are ordered, so that the right period can be found by
+    bisection.
+
+    :param list periods: The periods, in increasing order
+    :param :class:`datetime.date` reference_date: The reference date
+    :returns list: The end dates of the periods
+    """
+    end_dates = [period.get_end_date(reference_date) for period in periods]
+    for position in range(1, len(end_dates)):
+        end_dates[position] = max(
+            end_dates[position - 1], end_dates[position]
+        )
+    return end_dates
+
+
+def bucket_tasks(dated_tasks, periods, end_dates):
+    """Group scheduled tasks by the period that they are to be filed under.
+
+    :param list dated_tasks: Pairs of due dates and tasks, in the order in
+        which they are to be placed
+    :param list periods: The periods, in increasing order
+    :param list end_dates: The end dates of the periods (see
+        :func:`get_period_end_dates`)
+    :returns dict: The tasks for each period
+    """
+    tasks = defaultdict(list)
+    for due_date, entry in dated_tasks:
+        position = bisect.bisect_left(end_dates, due_date)
+        if position < len(periods):
+            tasks[periods[position]].append(entry)
+    return tasks
+
+
+def _section_positions(document, section_names, periods):
+    return [document.index(section_names[period]) for period in periods]
+
+
+def record_placement(document, section_names, reference_date):
+    """Record the placement of scheduled tasks in a tasklist that has just
+    been placed relative to the given reference date.
+
+    :param :class:`~composer.backend.filesystem.primitives.LogDocument`
+        document: The tasklist
+    :param dict section_names: The name of the tasklist section for each
+        period
+    :param :class:`datetime.date` reference_date: The reference date
+    :returns :class:`TaskPlacement`: The placement, or None if the tasklist
+        can't be advanced incrementally, e.g. if any due dates are relative
+    """
+    periods = get_time_periods(Day)
+    try:
+        positions = set(_section_positions(document, section_names, periods))
+    except ValueError:
+        return None
+    horizons = {}
+    for position, section in enumerate(document.sections):
+        for entry in section.entries:
+            if not is_scheduled_task(entry):
+                continue
+            if position not in positions or has_relative_due_date(entry):
+                return None
+            due_date, _ = get_due_date(entry, reference_date)
+            horizons[position] = min(
+                due_date, horizons.get(position, due_date)
+            )
+    return TaskPlacement(
+        reference_date, _section_digests(document), horizons
+    )
+
+
+def advance_placement(document, placement, section_names, to_date):
+    """Advance the placement of scheduled tasks in a tasklist to a later
+    date, touching only those sections that have changed since they were
+    placed, or whose tasks are due to move to a lower section. The resulting
+    tasklist is the same as if all scheduled tasks had been re-placed.
+
+    :param :class:`~composer.backend.filesystem.primitives.LogDocument`
+        document: The tasklist
+    :param :class:`TaskPlacement` placement: The placement of tasks in the
+        tasklist as of some earlier date
+    :param dict section_names: The name of the tasklist section for each
+        period
+    :param :class:`datetime.date` to_date: The date to advance to
+    :returns tuple: The advanced tasklist and its placement, or None if the
+        tasklist can't be advanced incrementally
+    """
+    if placement is None or to_date < placement.reference_date:
+        return None
+    sections = document.sections
+    if len(sections) != len(placement.sections):
+        return None
+    digests = _section_digests(document)
+    periods = get_time_periods(Day)
+    try:
+        positions = _section_positions(document, section_names, periods)
+    except ValueError:
+        return None
+    period_at = dict(zip(positions, periods))
+    period_index = dict((position, i) for i, position in enumerate(positions))
+    end_dates = get_period_end_dates(periods, to_date)
+
+    touched = set()
+    for position, section in enumerate(sections):
+        if digests[position] == placement.sections[position]:
+            # tasks move once the next lower period reaches the horizon
+            horizon = placement.horizons.get(position)
+            index = period_index.get(position)
+            if horizon and index and horizon <= end_dates[index - 1]:
+                touched.add(position)
+        elif position in period_at:
+            touched.add(position)
+        elif any(is_scheduled_task(entry) for entry in section.entries):
+            return None
+    if not touched:
+        return document, placement._replace(reference_date=to_date)
+
+    dated = _dated_entries(sections, touched, to_date)
+    if dated is None:
+        return None
+    # tasks may move into sections that are otherwise unaffected
+    destinations = set(
+        positions[bisect.bisect_left(end_dates, due_date)]
+        for due_date, _, _, _ in dated
+        if due_date <= end_dates[-1]
+    )
+    more_dated = _dated_entries(sections, destinations - touched, to_date)
+    if more_dated is None:
+        return None
+    dated.extend(more_dated)
+    touched |= destinations
+    # sort them first so that they are placed in chronological order within
+    # each section, and otherwise in the order they appear in the tasklist
+    dated.sort(key=lambda item: item[:3])
+
+    tasks = defaultdict(list)
+    horizons = dict(
+        (position, horizon)
+        for position, horizon in placement.horizons.items()
+        if position not in touched
+    )
+    for due_date, _, _, entry in dated:
+        index = bisect.bisect_left(end_dates, due_date)
+        if index < len(periods):
+            position = positions[index]
+            tasks[position].append(entry)
+            horizons.setdefault(position, due_date)
+
+    names = dict(
+        (position, section_names[period_at[position]]) for position in touched
+    )
+    _, remaining = document.partition_entries(
+        is_scheduled_task, names.values()
+    )
+    updated = remaining.add_to_sections(
+        dict(
+            (names[position], entries_to_string(tasks[position]))
+            for position in touched
+        ),
+        above=False,
+    )
+    if len(updated.sections) != len(sections):
+        return None
+    return updated, TaskPlacement(
+        to_date, _section_digests(updated), horizons
+    )
+
+
+def _dated_entries(sections, positions, reference_date):
+    """The scheduled tasks in the given sections, together with their due
+    dates and positions in the tasklist.
+
+    :param tuple sections: The sections of the tasklist
+    :param set positions: The positions of the sections of interest
+    :param :class:`datetime.date` reference_date: The reference date
+    :returns list: Tuples of the due date, section position, position in
+        the section, and the task, or None if any due dates are relative
+    """
+    dated = []
+    for position in positions:
+        for index, entry in enumerate(sections[position].entries):
+            if not is_scheduled_task(entry):
+                continue
+            if has_relative_due_date(entry):
+                return None
+            due_date, _ = get_due_date(entry, reference_date)
+            dated.append((due_date, position, index, entry))
+    return dated
@@ -1,12 +1,24 @@
+from .document import LogDocument, parse_document  # noqa
 from .entries import (  # noqa
     add_to_section,
     get_entries,
+    group_entries,
+    iter_entries,
     entries_to_string,
     partition_entries,
     read_section,
 )
-from .files import make_file, read_file, write_file, append_files  # noqa
+from .files import (  # noqa
+    LogicalFile,
+    make_file,
+    read_file,
+    read_files,
+    write_file,
+    append_files,
+)
 from .parsing import (  # noqa
+    Entry,
+    make_entry,
     is_blank_line,
     is_completed,
     is_not_completed,
@@ -20,21 +32,34 @@ from .parsing import (  # noqa
 from .storage import (
     full_file_path,
     get_log_filename,
+    parse_log_filename,
+    list_files,
     bare_filename,
     strip_extension,
+    file_fingerprint,
+    DirectoryListing,
+    WriteBatch,
 )  # noqa
 
 
 __all__ = (
+    "LogDocument",
+    "parse_document",
     "add_to_section",
     "get_entries",
+    "group_entries",
+    "iter_entries",
     "entries_to_string",
     "partition_entries",
     "read_section",
+    "LogicalFile",
     "make_file",
     "read_file",
+    "read_files",
     "write_file",
     "append_files",
+    "Entry",
+    "make_entry",
     "is_blank_line",
     "is_completed",
     "is_not_completed",
@@ -48,4 +73,9 @@ __all__ = (
     "get_log_filename",
     "bare_filename",
     "strip_extension",
+    "file_fingerprint",
+    "parse_log_filename",
+    "list_files",
+    "DirectoryListing",
+    "WriteBatch",
 )
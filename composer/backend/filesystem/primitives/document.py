@@ -0,0 +1,394 @@
+from .entries import entries_to_string, group_entries
+from .parsing import SECTION_PATTERN, SECTION_SEPARATOR, make_entry
+
+# A parsed representation of a logfile (or the tasklist) as a sequence of
+# sections, each of which is a header line followed by the entries under it.
+# It is parsed once, and thereafter sections can be looked up, read and
+# modified without rescanning the text. Documents are values -- operations
+# that modify a document return a new document, sharing any unmodified
+# sections with the original. The text representation of the document is
+# preserved exactly, so that rendering a parsed document reproduces the
+# original text byte for byte.
+
+
+def _split_lines(text):
+    """Split text into lines (each retaining its line ending), in the same
+    way that reading a file line by line would.
+
+    :param str text: The text to split
+    :returns list: The lines
+    """
+    lines = [line + "\n" for line in text.split("\n")]
+    last = lines.pop()[:-1]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _ends_with_blank_line(text):
+    return text == SECTION_SEPARATOR or text.endswith("\n" + SECTION_SEPARATOR)
+
+
+class Section(object):
+    """A section in a document, i.e. a header line (e.g. "AGENDA:") followed by
+    the entries (:class:`~composer.backend.filesystem.primitives.parsing.Entry`
+    objects) under it. A blank line at the end of the section is not
+    considered part of its contents but is retained separately as a separator
+    from the next section. The lines in a document preceding the first header
+    are represented as a section with an empty header.
+    """
+
+    __slots__ = ("header", "entries", "separator", "_text")
+
+    def __init__(self, header, entries, separator=""):
+        self.header = header
+        self.entries = tuple(entries)
+        self.separator = separator
+        self._text = None
+
+    @classmethod
+    def from_entries(cls, header, entries):
+        """Construct a section from a header and the list of entries following
+        it, treating a trailing blank line as the section separator.
+
+        :param str header: The header line
+        :param list entries: The entries (including any separator)
+        :returns :class:`Section`: The section
+        """
+        entries = list(entries)
+        separator = ""
+        if entries and entries[-1] == SECTION_SEPARATOR:
+            separator = SECTION_SEPARATOR
+            entries.pop()
+        return cls(header, [make_entry(entry) for entry in entries], separator)
+
+    @classmethod
+    def from_lines(cls, header, lines):
+        """Construct a section from a header and the lines following it.
+
+        :param str header: The header line
+        :param iterable lines: The lines following the header
+        :returns :class:`Section`: The section
+        """
+        return cls.from_entries(header, group_entries(lines))
+
+    @property
+    def contents(self):
+        """The contents of the section, excluding the header and separator.
+
+        :returns str: The contents
+        """
+        return entries_to_string(self.entries)
+
+    def render(self):
+        """The text representation of the section.
+
+        :returns str: The text of the section
+        """
+        if self._text is None:
+            self._text = self.header + self.contents + self.separator
+        return self._text
+
+
+def _section_from_body(header, body, is_last):
+    """Construct a section for the given header and body text, if doing so
+    yields the same structure that parsing the rendered document would.
+
+    :param str header: The header line
+    :param str body: The text following the header
+    :param bool is_last: Whether this is the last section in the document
+    :returns :class:`Section`: The section, or None if the body would
+        alter the structure of the document (e.g. if it contains a section
+        header), requiring the document to be parsed afresh
+    """
+    lines = _split_lines(body)
+    if lines and header and not header.endswith("\n"):
+        return None
+    if lines and not lines[-1].endswith("\n") and not is_last:
+        return None
+    if any(SECTION_PATTERN.search(line) for line in lines):
+        return None
+    return Section.from_lines(header, lines)
+
+
+def _separator_entries(section):
+    return (section.separator,) if section.separator else ()
+
+
+class LogDocument(object):
+    """A parsed logfile, indexed by section."""
+
+    __slots__ = ("sections", "_index", "_text")
+
+    def __init__(self, sections, text=None, index=None):
+        self.sections = tuple(sections)
+        self._index = dict(index) if index else {}
+        self._text = text
+
+    @classmethod
+    def parse(cls, text):
+        """Parse text into a document.
+
+        :param str text: The text to parse
+        :returns :class:`LogDocument`: The parsed document
+        """
+        sections = []
+        header, lines = "", []
+        for line in _split_lines(text):
+            if SECTION_PATTERN.search(line):
+                sections.append(Section.from_lines(header, lines))
+                header, lines = line, []
+            else:
+                lines.append(line)
+        sections.append(Section.from_lines(header, lines))
+        return cls(sections, text)
+
+    def render(self):
+        """The text representation of the document.
+
+        :returns str: The text of the document
+        """
+        if self._text is None:
+            self._text = "".join(section.render() for section in self.sections)
+        return self._text
+
+    def _find(self, section):
+        """Find the position of a section in the document, consulting (and
+        populating) the section index.
+
+        :param str section: The name of the section
+        :returns int: The position of the section
+        """
+        try:
+            return self._index[section]
+        except KeyError:
+            pass
+        prefix = section.upper()
+        for position, candidate in enumerate(self.sections):
+            if candidate.header and candidate.header.startswith(prefix):
+                self._index[section] = position
+                return position
+        raise ValueError("Section {} not found in file!".format(section))
+
+    def index(self, section):
+        """The position of a section in the document. Raises ValueError if it
+        isn't present.
+
+        :param str section: The name of the section
+        :returns int: The position of the section
+        """
+        return self._find(section)
+
+    def has_section(self, section):
+        """Whether the document contains the specified section.
+
+        :param str section: The name of the section
+        :returns bool: Whether the section is present
+        """
+        try:
+            self._find(section)
+        except ValueError:
+            return False
+        return True
+
+    def get_section(self, section):
+        """Retrieve a section by name. Raises ValueError if it isn't present.
+
+        :param str section: The name of the section
+        :returns :class:`Section`: The section
+        """
+        return self.sections[self._find(section)]
+
+    def read_section(self, section):
+        """Retrieve the contents of a section by name.
+
+        :param str section: The name of the section
+        :returns str: The contents of the section
+        """
+        return self.get_section(section).contents
+
+    def section_entries(self, section):
+        """Retrieve the entries in a section by name.
+
+        :param str section: The name of the section
+        :returns tuple: The entries in the section
+        """
+        return self.get_section(section).entries
+
+    def get_entries(self, of_type=None):
+        """Retrieve all entries in the document, optionally filtered by type.
+        Note that section headers are not themselves treated as entries.
+
+        :param function of_type: A predicate to filter entries by
+        :returns list: The entries
+        """
+        entries = [
+            entry
+            for section in self.sections
+            for entry in section.entries + _separator_entries(section)
+        ]
+        if of_type:
+            entries = [entry for entry in entries if of_type(entry)]
+        return entries
+
+    def _with_bodies(self, bodies):
+        """Produce a new document in which the sections at the given positions
+        have the given text in place of their existing contents (including
+        any separator). All other sections are shared with this document.
+
+        :param dict bodies: A mapping of section positions to body text
+        :returns :class:`LogDocument`: The new document
+        """
+        if not bodies:
+            return self
+        sections = list(self.sections)
+        last = len(sections) - 1
+        well_formed = True
+        for position, body in bodies.items():
+            header = sections[position].header
+            section = _section_from_body(header, body, position == last)
+            if section is None:
+                well_formed = False
+                section = Section(header, [body])
+            sections[position] = section
+        if not well_formed:
+            # the new contents change the layout of the document
+            text = "".join(section.render() for section in sections)
+            return LogDocument.parse(text)
+        return LogDocument(sections, index=self._index)
+
+    def _with_entries(self, entries):
+        """Produce a new document in which the sections at the given positions
+        are composed of the given entries. All other sections are shared with
+        this document.
+
+        :param dict entries: A mapping of section positions to entries
+            (including any separator)
+        :returns :class:`LogDocument`: The new document
+        """
+        return self._with_bodies(
+            {
+                position: entries_to_string(items)
+                for position, items in entries.items()
+            }
+        )
+
+    def add_to_section(
+        self, section, tasks, above=True, ensure_separator=False
+    ):
+        """Insert text into a section, preserving its existing contents.
+        This has the same semantics as
+        :func:`~composer.backend.filesystem.primitives.add_to_section`.
+
+        :param str section: The name of the section
+        :param str tasks: Text to add to the section
+        :param bool above: Whether to add the tasks above the existing contents
+            or below them
+        :param bool ensure_separator: Whether to ensure that a section
+            separator is present after the new contents
+        :returns :class:`LogDocument`: The updated document
+        """
+        return self.add_to_sections({section: tasks}, above, ensure_separator)
+
+    def add_to_sections(self, additions, above=True, ensure_separator=False):
+        """Insert text into any number of sections at once.
+
+        :param dict additions: A mapping of section names to the text to be
+            added to each
+        :param bool above: Whether to add the tasks above the existing contents
+            or below them
+        :param bool ensure_separator: Whether to ensure that a section
+            separator is present after the new contents
+        :returns :class:`LogDocument`: The updated document
+        """
+        bodies = {}
+        last = len(self.sections) - 1
+        for name, tasks in additions.items():
+            position = self._find(name)
+            if not tasks and not ensure_separator:
+                continue
+            existing = self.sections[position]
+            contents = existing.contents
+            body = tasks + contents if above else contents + tasks
+            if (
+                ensure_separator
+                and body
+                and not _ends_with_blank_line(body)
+                and not existing.separator
+                and position < last
+            ):
+                body += SECTION_SEPARATOR
+            bodies[position] = body + existing.separator
+        return self._with_bodies(bodies)
+
+    def replace_section(self, section, contents):
+        """Replace the contents of a section, retaining its header and any
+        separator.
+
+        :param str section: The name of the section
+        :param str contents: The new contents of the section
+        :returns :class:`LogDocument`: The updated document
+        """
+        position = self._find(section)
+        separator = self.sections[position].separator
+        return self._with_bodies({position: contents + separator})
+
+    def partition_entries(self, filter_fn, sections=None):
+        """Remove all entries satisfying a predicate from the document.
+
+        :param function filter_fn: A predicate function
+        :param list sections: The names of the sections to remove entries
+            from. By default, entries are removed from all sections
+        :returns tuple: A list containing the entries passing the predicate,
+            and a document containing all of the other entries
+        """
+        if sections is None:
+            positions = range(len(self.sections))
+        else:
+            positions = sorted(self._find(section) for section in sections)
+        filtered = []
+        changed = {}
+        for position in positions:
+            section = self.sections[position]
+            entries = section.entries + _separator_entries(section)
+            kept = []
+            for entry in entries:
+                if filter_fn(entry):
+                    filtered.append(entry)
+                else:
+                    kept.append(entry)
+            if len(kept) < len(entries):
+                changed[position] = kept
+        if not changed:
+            return filtered, self
+        return filtered, self._with_entries(changed)
+
+    def map_entries(self, fn):
+        """Transform the entries in the document.
+
+        :param function fn: A function to be applied to each entry, returning
+            the (possibly) transformed entry
+        :returns :class:`LogDocument`: The updated document
+        """
+        changed = {}
+        for position, section in enumerate(self.sections):
+            mapped = [fn(entry) for entry in section.entries]
+            if mapped != list(section.entries):
+                changed[position] = mapped + [section.separator]
+        if not changed:
+            return self
+        return self._with_entries(changed)
+
+
+def parse_document(file):
+    """Get a parsed document for a logical file. Documents are returned as is,
+    while files (or strings) are parsed.
+
+    :param file: A :class:`LogDocument`, :class:`io.StringIO` or str
+    :returns :class:`LogDocument`: The document
+    """
+    if isinstance(file, LogDocument):
+        return file
+    if not isinstance(file, str):
+        file = file.getvalue()
+    return LogDocument.parse(file)
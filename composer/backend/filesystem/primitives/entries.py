@@ -1,5 +1,6 @@
 from .files import make_file, contain_file_mutation, copy_file, partition_at
 from .parsing import (
+    entry_text,
     is_section_separator,
     get_section_pattern,
     SECTION_OR_EOF_PATTERN,
@@ -22,10 +23,12 @@ from .parsing import (
 def entries_to_string(entries):
     """Convert a list of entries to a string.
 
-    :param list entries: A list of entries (strings)
+    :param list entries: A list of entries (strings or
+        :class:`~composer.backend.filesystem.primitives.parsing.Entry`
+        objects)
     :returns str: A string formed by concatenating all of the entries
     """
-    return "".join(entries)
+    return "".join(entry_text(entry) for entry in entries)
 
 
 def string_to_entries(string):
@@ -103,13 +106,36 @@ def read_entry(file):
     return entry, complement
 
 
-def _read_entries(file):
-    entries = []
-    entry, complement = read_entry(file)
-    while entry:
-        entries.append(entry)
-        entry, complement = read_entry(complement)
-    return entries
+def group_entries(lines):
+    """Group a sequence of lines into entries in a single pass, yielding each
+    entry as soon as it is complete. An entry is a line beginning at the 0th
+    position of the line, together with any (tab-indented) subtask lines that
+    immediately follow it (see :func:`read_entry`).
+
+    :param iterable lines: The lines to group, e.g. a file
+    :returns generator: The entries (strings), in order
+    """
+    entry_lines = []
+    for line in lines:
+        if entry_lines and is_subtask(line):
+            entry_lines.append(line)
+            continue
+        if entry_lines:
+            yield "".join(entry_lines)
+        entry_lines = [line]
+    if entry_lines:
+        yield "".join(entry_lines)
+
+
+@contain_file_mutation
+def iter_entries(file):
+    """Walk a file once from start to finish, yielding each entry as soon as
+    it is complete.
+
+    :param :class:`io.StringIO` file: The file to read from
+    :returns generator: The entries (strings) in the file, in order
+    """
+    return group_entries(file)
 
 
 @contain_file_mutation
@@ -124,9 +150,8 @@ def get_entries(file, of_type=None):
         false based on a type determination on the argument.
     """
     if not of_type:
-        of_type = lambda x: True
-    entries = [entry for entry in _read_entries(file) if of_type(entry)]
-    return entries
+        return list(iter_entries(file))
+    return [entry for entry in iter_entries(file) if of_type(entry)]
 
 
 @contain_file_mutation
@@ -1,6 +1,7 @@
 from functools import wraps
 
 from .storage import read_file as _read_file
+from .storage import read_files as _read_files
 from .storage import write_file as _write_file
 
 try:  # py2
@@ -9,6 +10,113 @@ except ImportError:  # py3
     from io import StringIO
 
 
+class LogicalFile(object):
+    """An in-memory text file backed by an immutable string.
+
+    This supports the subset of the :class:`io.StringIO` interface used by the
+    planner (reading, line iteration, writing and seeking). The contents of a
+    logical file are never modified in place -- writing to the file replaces
+    its backing string -- so that any number of logical files may share the
+    same contents. Copying a file thus only entails creating a new "cursor"
+    over the same string, rather than copying the contents themselves.
+    """
+
+    __slots__ = ("_contents", "_pending", "_position", "_length")
+
+    def __init__(self, contents=""):
+        self._contents = contents
+        # text written at the end of the file is accumulated here and only
+        # joined into the backing string when it is next needed
+        self._pending = []
+        self._position = 0
+        self._length = len(contents)
+
+    def _value(self):
+        if self._pending:
+            self._contents = self._contents + "".join(self._pending)
+            self._pending = []
+        return self._contents
+
+    def copy(self):
+        """A new file with the same contents as this one, positioned at the
+        start. The contents are shared rather than copied.
+
+        :returns :class:`LogicalFile`: The new file
+        """
+        return LogicalFile(self._value())
+
+    def getvalue(self):
+        return self._value()
+
+    def read(self, size=-1):
+        contents = self._value()
+        start = self._position
+        if size is None or size < 0:
+            end = self._length
+        else:
+            end = min(start + size, self._length)
+        self._position = max(start, end)
+        return contents[start:end]
+
+    def readline(self, size=-1):
+        contents = self._value()
+        start = self._position
+        end = contents.find("\n", start) + 1 or self._length
+        if size is not None and size >= 0:
+            end = min(end, start + size)
+        self._position = max(start, end)
+        return contents[start:end]
+
+    def readlines(self):
+        return list(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    next = __next__  # py2
+
+    def write(self, text):
+        if self._position == self._length:
+            self._pending.append(text)
+        else:
+            contents = self._value()
+            start = self._position
+            self._contents = (
+                contents[:start] + text + contents[start + len(text):]
+            )
+        self._position += len(text)
+        self._length = max(self._length, self._position)
+        return len(text)
+
+    def seek(self, position, whence=0):
+        if whence == 1:
+            position += self._position
+        elif whence == 2:
+            position += self._length
+        self._position = max(0, position)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        pass
+
+
+def _copy_if_file(value):
+    if isinstance(value, LogicalFile):
+        return value.copy()
+    elif isinstance(value, StringIO):
+        return copy_file(value)
+    return value
+
+
 def contain_file_mutation(fn):
     """For functions that operate on files, this makes is so that these file
     arguments are passed in "by value" rather than "by reference," so that
@@ -18,27 +126,20 @@ def contain_file_mutation(fn):
     calling context. This allows file processing to be done in a "functional"
     way, keeping side-effects contained and eliminating the need for state
     management.
+
+    As logical files share their (immutable) contents, "copying" them here
+    only creates a fresh cursor and does not copy the contents themselves.
     """
 
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        new_args = [
-            copy_file(arg) if isinstance(arg, StringIO) else arg
-            for arg in args
-        ]
-        new_kwargs = {
-            k: (copy_file(v) if isinstance(v, StringIO) else v)
-            for k, v in kwargs.items()
-        }
+        new_args = [_copy_if_file(arg) for arg in args]
+        new_kwargs = {k: _copy_if_file(v) for k, v in kwargs.items()}
         result = fn(*new_args, **new_kwargs)
         if isinstance(result, tuple):
-            new_result = [
-                copy_file(r) if isinstance(r, StringIO) else r for r in result
-            ]
+            new_result = [_copy_if_file(r) for r in result]
         else:
-            new_result = (
-                copy_file(result) if isinstance(result, StringIO) else result
-            )
+            new_result = _copy_if_file(result)
         return new_result
 
     return wrapper
@@ -53,19 +154,19 @@ def make_file(contents=""):
     than the storage and indexing concerns.
 
     :param str contents: A string to be treated as a file
-    :returns :class:`io.StringIO`: A file representation of the input
+    :returns :class:`LogicalFile`: A file representation of the input
     """
-    return StringIO(contents)
+    return LogicalFile(contents)
 
 
 def copy_file(file):
     """Make a logical copy of a file (i.e. at the abstraction level of files
     rather than the filesystem).
 
-    :param :class:`io.StringIO` file: The file to copy
-    :returns :class:`io.StringIO`: A copy of the file
+    :param :class:`LogicalFile` file: The file to copy
+    :returns :class:`LogicalFile`: A copy of the file
     """
-    # we only operate on StringIO files and not actual files
+    # we only operate on in-memory files and not actual files
     # except at the entry and exit points
     return make_file(file.getvalue())
 
@@ -77,19 +178,39 @@ def read_file(filename):
     such processing is complete.
 
     :param filename: Path to a file on disk
-    :returns :class:`io.StringIO`: A logical file mirroring the file on disk
+    :returns :class:`LogicalFile`: A logical file mirroring the file on disk
     """
     contents = _read_file(filename)
     return make_file(contents)
 
 
-def write_file(file, filename):
+def read_files(filenames, workers=1):
+    """Read several files on disk, a number of them at a time, producing an
+    in-memory logical representation of each (see :func:`read_file`).
+
+    :param list filenames: Paths to files on disk
+    :param int workers: The number of files to read at a time
+    :returns list: Logical files mirroring the files on disk, in the same
+        order as the paths
+    """
+    return [
+        make_file(contents) for contents in _read_files(filenames, workers)
+    ]
+
+
+def write_file(file, filename, batch=None):
     """Write a logical file as an actual file on disk.
 
-    :param :class:`io.StringIO` file: The file to write
+    :param :class:`LogicalFile` file: The file to write
     :param filename: Path to write to
+    :param :class:`~composer.backend.filesystem.primitives.storage.WriteBatch`
+        batch: If provided, stage the file to be written along with the rest
+        of this batch rather than writing it immediately
     """
-    _write_file(file.read(), filename)
+    if batch is not None:
+        batch.write(file.read(), filename)
+    else:
+        _write_file(file.read(), filename)
 
 
 @contain_file_mutation
@@ -98,7 +219,7 @@ def partition_at(file, pattern, or_eof=False, inclusive=False):
     first file will contain the contents before the pattern, while the second
     list will contain those after it.
 
-    :param :class:`io.StringIO` file: A text file to partition
+    :param :class:`LogicalFile` file: A text file to partition
     :param :class:`_sre.SRE_Pattern` pattern: A pattern (regex) to find
     :param bool or_eof: If true, then handles missing pattern gracefully
         and does not treat it as an error. Otherwise, raises an error if the
@@ -1,7 +1,5 @@
 import re
 
-from .files import make_file
-
 # TODO: probably best to enforce section names as all caps to avoid
 # parsing ambiguity with arbitrary non-task entries
 SECTION_PATTERN = re.compile(r"^[A-Z][A-Z][A-Za-z ]+:")
@@ -9,21 +7,146 @@ SECTION_OR_EOF_PATTERN = re.compile(r"(^[A-Z][A-Z][A-Za-z ]+:|\A\Z)")
 TASK_PATTERN = re.compile(r"^\t*\[")
 SECTION_SEPARATOR = '\n'
 
+# entry statuses
+DONE = "done"
+INVALID = "invalid"
+SCHEDULED = "scheduled"
+UNDONE = "undone"
+WIP = "wip"
+TASK = "task"  # a task with an unrecognized status marker
+BLANK = "blank"
+NON_TASK = "non-task"
+
+TASK_STATUSES = {
+    "x": DONE,
+    "-": INVALID,
+    "o": SCHEDULED,
+    " ": UNDONE,
+    "\\": WIP,
+}
+TASK_TYPES = frozenset(TASK_STATUSES.values()) | frozenset((TASK,))
+COMPLETED_STATUSES = frozenset((DONE, INVALID, SCHEDULED))
+UNFINISHED_STATUSES = frozenset((UNDONE, WIP, TASK))
+
 
 def get_section_pattern(section):
     return re.compile(r'^' + section.upper())
 
 
+def classify(line):
+    """Determine the status of an entry (or line) from its leading
+    characters.
+
+    :param str line: The entry
+    :returns str: The status of the entry, e.g. DONE or BLANK
+    """
+    if line.startswith("["):
+        return TASK_STATUSES.get(line[1:2], TASK)
+    elif line.startswith("\n"):
+        return BLANK
+    return NON_TASK
+
+
+def _split_header(text):
+    """Split an entry into its first line and the rest."""
+    end = text.find("\n") + 1 or len(text)
+    return text[:end], text[end:]
+
+
+class Entry(object):
+    """An entry in a log file or the tasklist, i.e. a line together with any
+    subtasks under it. It is classified once up front, so that it can be
+    repeatedly queried for its status, header and contents, and due date
+    without reparsing the text. It renders to exactly the original text.
+    """
+
+    __slots__ = ("text", "status", "header", "contents", "_due")
+
+    def __init__(self, text):
+        self.text = text
+        self.status = classify(text)
+        self.header, self.contents = _split_header(text)
+        self._due = None
+
+    def get_due_date(self, reference_date, parse):
+        """Get the due date for the entry, parsing it only the first time it
+        is requested for a given reference date.
+
+        :param :class:`datetime.date` reference_date: A reference date to use
+            in case the due date is specified relatively
+        :param function parse: A function to parse the due date from the
+            header of the entry and the reference date
+        :returns tuple: The due date, together with the implied period
+            for the date
+        """
+        if self._due is None or self._due[0] != reference_date:
+            self._due = (reference_date, parse(self.header, reference_date))
+        return self._due[1]
+
+    def startswith(self, prefix):
+        return self.text.startswith(prefix)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return "Entry({!r})".format(self.text)
+
+    def __eq__(self, other):
+        if isinstance(other, Entry):
+            other = other.text
+        return self.text == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.text)
+
+
+def make_entry(entry):
+    """Get an :class:`Entry` for an entry, which may already be one.
+
+    :param entry: An entry, as a str or :class:`Entry`
+    :returns :class:`Entry`: The entry
+    """
+    if isinstance(entry, Entry):
+        return entry
+    return Entry(entry)
+
+
+def entry_text(entry):
+    """The text of an entry.
+
+    :param entry: An entry, as a str or :class:`Entry`
+    :returns str: The text of the entry
+    """
+    if isinstance(entry, Entry):
+        return entry.text
+    return entry
+
+
+def get_status(entry):
+    """The status of an entry, using the precomputed status if available.
+
+    :param entry: An entry, as a str or :class:`Entry`
+    :returns str: The status of the entry
+    """
+    if isinstance(entry, Entry):
+        return entry.status
+    return classify(entry)
+
+
 # TODO: replace these type predicates with regexes?
 # one advantage is that they would be amenable to pattern-based
 # substitutions via re.sub, which could be used for automatic
 # processing of tasks in terms of their status
 def is_scheduled_task(line):
-    return line.startswith("[o")
+    return get_status(line) == SCHEDULED
 
 
 def is_task(line):
-    return line.startswith("[")
+    return get_status(line) in TASK_TYPES
 
 
 def is_subtask(line):
@@ -38,26 +161,26 @@ def is_section(line, section_name=None):
 
 
 def is_blank_line(line):
-    return line.startswith("\n")
+    return get_status(line) == BLANK
 
 
 is_section_separator = is_blank_line
 
 
 def is_done_task(line):
-    return line.startswith("[x")
+    return get_status(line) == DONE
 
 
 def is_invalid_task(line):
-    return line.startswith("[-")
+    return get_status(line) == INVALID
 
 
 def is_undone_task(line):
-    return line.startswith("[ ")
+    return get_status(line) == UNDONE
 
 
 def is_wip_task(line):
-    return line.startswith("[\\")
+    return get_status(line) == WIP
 
 
 def is_eof(line):
@@ -71,20 +194,16 @@ def is_completed(entry):
     exhaustive, since there are entries for which completeness is not
     applicable.
     """
-    return any(
-        (
-            is_done_task(entry),
-            is_invalid_task(entry),
-            is_scheduled_task(entry),  # handled elsewhere
-        )
-    )
+    # note: scheduled tasks are handled elsewhere
+    return get_status(entry) in COMPLETED_STATUSES
 
 
 def is_not_completed(entry):
     """A predicate function that is true if an entry is not 'complete'. This
     additionally excludes blank lines.
     """
-    return not is_completed(entry) and not is_blank_line(entry)
+    status = get_status(entry)
+    return status not in COMPLETED_STATUSES and status != BLANK
 
 
 def is_unfinished(entry):
@@ -94,7 +213,7 @@ def is_unfinished(entry):
     exhaustive, since there are entries for which completeness is not
     applicable.
     """
-    return is_task(entry) and not is_completed(entry)
+    return get_status(entry) in UNFINISHED_STATUSES
 
 
 def parse_task(task):
@@ -103,10 +222,9 @@ def parse_task(task):
     independently, e.g. to check for scheduled date and ensure that it's
     present in the header specifically, and not just anywhere in the task.
 
-    :param str task: The task to parse
+    :param task: The task to parse, as a str or :class:`Entry`
     :returns tuple: The header and the contents, both strings
     """
-    f = make_file(task)
-    header = f.readline()
-    contents = f.read()
-    return header, contents
+    if isinstance(task, Entry):
+        return task.header, task.contents
+    return _split_header(task)
@@ -1,7 +1,21 @@
+import calendar
+import datetime
+import errno
+import hashlib
 import os
+import re
+import uuid
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
+from ....config import DEFAULT_DURABILITY, DURABILITY
 from ....timeperiod import Day, Week, Month, Quarter, Year, quarter_for_month
 
+try:  # py3
+    from os import scandir
+except ImportError:  # py2
+    scandir = None
+
 PATH_SPECIFICATION = "{prefix}/{filename}"
 FILENAME_TEMPLATE = {
     Day: "{month} {date}, {year}.wiki",
@@ -10,6 +24,29 @@ FILENAME_TEMPLATE = {
     Quarter: "{quarter} {year}.wiki",
     Year: "{year}.wiki",
 }
+# the pattern matching each of the fields in a filename template
+_FILENAME_FIELDS = {
+    "month": r"(?P<month>[^\d\s,]+)",
+    "date": r"(?P<date>\d{1,2})",
+    "quarter": r"Q(?P<quarter>[1-4])",
+    "year": r"(?P<year>\d{4})",
+}
+FILENAME_PATTERN = dict(
+    (
+        period,
+        re.compile(
+            "^"
+            + "".join(
+                _FILENAME_FIELDS[field] if field else re.escape(literal)
+                for literal, field in re.findall(
+                    r"([^{]+)|{(\w+)}", template
+                )
+            )
+            + "$"
+        ),
+    )
+    for period, template in FILENAME_TEMPLATE.items()
+)
 
 
 def get_log_filename(for_date, period, root=None):
@@ -41,6 +78,40 @@ def get_log_filename(for_date, period, root=None):
     return path
 
 
+def parse_log_filename(filename):
+    """Identify the log that a file is for, from its name. This is the
+    reverse of :func:`get_log_filename`.
+
+    :param str filename: The name of the file
+    :returns tuple: The time period and the start date of the log, or None
+        if the file isn't a log
+    """
+    for period, pattern in FILENAME_PATTERN.items():
+        match = pattern.match(filename)
+        if not match:
+            continue
+        fields = match.groupdict()
+        if "month" in fields:
+            try:
+                month = list(calendar.month_name).index(fields["month"])
+            except ValueError:
+                continue
+        elif "quarter" in fields:
+            month = 3 * int(fields["quarter"]) - 2
+        else:
+            month = 1
+        try:
+            start_date = datetime.date(
+                int(fields["year"]), month, int(fields.get("date", 1))
+            )
+        except ValueError:
+            continue
+        # e.g. "December 05, 2012.wiki" isn't a log
+        if get_log_filename(start_date, period) == filename:
+            return (period, start_date)
+    return None
+
+
 def full_file_path(filename, root, dereference=False):
     """Given a path root and a filename, construct an OS-specific filesystem
     path.
@@ -102,6 +173,110 @@ def read_file(path):
     return contents
 
 
+def read_files(paths, workers=1):
+    """Read several files on disk, a number of them at a time. Reading files
+    concurrently saves time when each read entails a round trip, e.g. on
+    network-mounted storage.
+
+    :param list paths: Filesystem paths to the files
+    :param int workers: The number of files to read at a time
+    :returns list: Contents of the files, in the same order as the paths
+    """
+    if workers <= 1 or len(paths) <= 1:
+        return [read_file(path) for path in paths]
+    pool = ThreadPool(min(workers, len(paths)))
+    try:
+        # results (and errors) are produced in order, so that e.g. a missing
+        # file is reported just as it would be if the files were read in turn
+        return list(pool.imap(read_file, paths))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def file_fingerprint(path):
+    """A fingerprint of the contents of a file on disk, to tell whether the
+    file has changed.
+
+    :param str path: Filesystem path to the file
+    :returns str: The fingerprint, or None if the file doesn't exist
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.md5(f.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+
+def list_files(path):
+    """The names of the files (i.e. not directories) in a directory.
+
+    :param str path: Filesystem path to the directory
+    :returns list: The names of the files
+    """
+    if scandir is None:
+        return [
+            name
+            for name in os.listdir(path)
+            if not os.path.isdir(os.path.join(path, name))
+        ]
+    # the type of each entry is known from the listing itself on most
+    # platforms, without going to disk for it
+    return [
+        entry.name
+        for entry in scandir(path)
+        if not entry.is_dir(follow_symlinks=False)
+    ]
+
+
+class DirectoryListing(object):
+    """The names of the files in a directory, listed once and remembered
+    until the directory changes, so that whether a file exists can be told
+    by looking it up in a set rather than by going to disk for it.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: Filesystem path to the directory
+        """
+        self.path = path
+        self._names = frozenset()
+        self._stamp = None
+        # the number of times the directory has actually been listed
+        self.listings = 0
+
+    def _get_stamp(self):
+        # adding or removing entries updates the directory's modification
+        # time and, on most filesystems, its size
+        stat = os.stat(self.path)
+        return (stat.st_ino, stat.st_mtime, stat.st_size)
+
+    @property
+    def names(self):
+        """The names of the files as of the last listing."""
+        return self._names
+
+    def refresh(self):
+        """List the directory again if it has changed since it was last
+        listed.
+
+        :returns bool: Whether the directory was listed again
+        """
+        stamp = self._get_stamp()
+        if stamp == self._stamp:
+            return False
+        # stat before listing, so that any change made in between is caught
+        # the next time
+        self._names = frozenset(list_files(self.path))
+        self._stamp = stamp
+        self.listings += 1
+        return True
+
+    def __contains__(self, filename):
+        self.refresh()
+        return filename in self._names
+
+
 def write_file(contents, path):
     """Write a file to disk (overwrites existing file if present).
 
@@ -110,3 +285,167 @@ def write_file(contents, path):
     """
     with open(path, "w") as f:
         f.write(contents)
+
+
+def _sync_file(path):
+    with open(path, "r") as f:
+        os.fsync(f.fileno())
+
+
+def sync_directory(path):
+    """Ensure that changes to the entries in a directory, e.g. renamed files,
+    have reached the disk.
+
+    :param str path: Filesystem path to the directory
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _file_mode(path):
+    """The permissions of an existing file.
+
+    :param str path: Filesystem path to the file
+    :returns int: The permission bits, or None if there is no such file
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return None
+
+
+class WriteBatch(object):
+    """A set of changes to files in a directory that are written to disk
+    together. Changes are held in memory until the batch is committed, so
+    that a file changed more than once is only written once. On commit, each
+    file is first staged as a temporary file alongside the original, and
+    they are moved into place only once every file has been staged. A
+    failure while staging, which is where most of the work is done, leaves
+    the directory as it was. Moving each file into place is atomic, but a
+    failure partway through moving several files leaves those already moved
+    in place. Symbolic links are swapped last, so that they only ever point
+    to files that have been written.
+
+    Can be used as a context manager, committing the batch on success and
+    discarding it on failure.
+    """
+
+    def __init__(self, directory, durability=DEFAULT_DURABILITY):
+        """
+        :param str directory: Filesystem path to the directory containing
+            the files
+        :param int durability: How much to ensure that the changes have
+            reached the disk (see :data:`~composer.config.DURABILITY`)
+        """
+        self.directory = directory
+        self.durability = durability
+        # the contents of each file and the target of each link, by path,
+        # in the order first staged
+        self.staged = OrderedDict()
+        self.links = OrderedDict()
+
+    def _temporary_path(self, path):
+        # created as any new file would be, with permissions subject to the
+        # umask, rather than readable only by the owner as by tempfile
+        while True:
+            temporary_path = os.path.join(
+                self.directory,
+                ".{name}.{token}.tmp".format(
+                    name=os.path.basename(path), token=uuid.uuid4().hex[:8]
+                ),
+            )
+            try:
+                fd = os.open(
+                    temporary_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                    0o666,
+                )
+            except OSError as err:
+                if err.errno == errno.EEXIST:
+                    continue
+                raise
+            os.close(fd)
+            return temporary_path
+
+    def write(self, contents, path):
+        """Stage the contents of a file to be written, replacing any contents
+        staged for it previously.
+
+        :param str contents: Contents to be written to the file
+        :param str path: Filesystem path to the file
+        """
+        self.staged[path] = contents
+
+    def link(self, target, path):
+        """Stage a symbolic link to be created, replacing any existing link.
+
+        :param str target: The path that the link is to point to
+        :param str path: Filesystem path to the link
+        """
+        self.links[path] = target
+
+    def _stage(self):
+        temporary_paths = []
+        try:
+            for path, contents in self.staged.items():
+                temporary_path = self._temporary_path(path)
+                temporary_paths.append((temporary_path, path))
+                write_file(contents, temporary_path)
+                mode = _file_mode(path)
+                if mode is not None:
+                    # keep the permissions of the file being replaced
+                    os.chmod(temporary_path, mode)
+                if self.durability >= DURABILITY["STRICT"]:
+                    _sync_file(temporary_path)
+        except Exception:
+            for temporary_path, _ in temporary_paths:
+                os.remove(temporary_path)
+            raise
+        return temporary_paths
+
+    def commit(self):
+        """Write all staged files and move them into place, and then update
+        any links.
+        """
+        temporary_paths = self._stage()
+        if self.durability == DURABILITY["BATCH"]:
+            for temporary_path, _ in temporary_paths:
+                _sync_file(temporary_path)
+        for position, (temporary_path, path) in enumerate(temporary_paths):
+            try:
+                os.rename(temporary_path, path)
+            except OSError:
+                for remaining_path, _ in temporary_paths[position:]:
+                    os.remove(remaining_path)
+                raise
+            if self.durability >= DURABILITY["STRICT"]:
+                sync_directory(self.directory)
+        for path, target in self.links.items():
+            temporary_path = self._temporary_path(path)
+            os.remove(temporary_path)
+            os.symlink(target, temporary_path)
+            try:
+                os.rename(temporary_path, path)
+            except OSError:
+                os.remove(temporary_path)
+                raise
+        if self.durability >= DURABILITY["BATCH"]:
+            sync_directory(self.directory)
+        self.discard()
+
+    def discard(self):
+        """Discard all staged changes."""
+        self.staged = OrderedDict()
+        self.links = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
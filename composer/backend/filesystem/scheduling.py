@@ -1,4 +1,7 @@
+import datetime
 import re
+import threading
+from collections import namedtuple, OrderedDict
 
 from ...errors import (
     BlockedTaskNotScheduledError,
@@ -14,69 +17,111 @@ from ...timeperiod import (
     Eternity,
     quarter_for_month,
     get_month_name,
+    get_month_number,
 )
-from .primitives import read_section, parse_task
-from .date_parsers import (
-    dateformat1,
-    dateformat2,
-    dateformat3,
-    dateformat4,
-    dateformat5,
-    dateformat6,
-    dateformat7,
-    dateformat8,
-    dateformat9,
-    dateformat10,
-    dateformat11,
-    dateformat12,
-    dateformat13,
-    dateformat14,
-    dateformat15,
-    dateformat16,
-    dateformat17,
-    dateformat18,
-    dateformat19,
-    dateformat20,
-    dateformat21,
-    dateformat22,
-    dateformat23,
-    dateformat24,
-    dateformat25,
-    dateformat26,
-    dateformat27,
-    dateformat28,
-    parse_dateformat1,
-    parse_dateformat2,
-    parse_dateformat3,
-    parse_dateformat4,
-    parse_dateformat5,
-    parse_dateformat6,
-    parse_dateformat7,
-    parse_dateformat8,
-    parse_dateformat9,
-    parse_dateformat10,
-    parse_dateformat11,
-    parse_dateformat12,
-    parse_dateformat13,
-    parse_dateformat14,
-    parse_dateformat15,
-    parse_dateformat16,
-    parse_dateformat17,
-    parse_dateformat18,
-    parse_dateformat19,
-    parse_dateformat20,
-    parse_dateformat21,
-    parse_dateformat22,
-    parse_dateformat23,
-    parse_dateformat24,
-    parse_dateformat25,
-    parse_dateformat26,
-    parse_dateformat27,
-    parse_dateformat28,
-)
+from .primitives import Entry, parse_document, parse_task
+from .date_parsers import is_relative_date_string, parse_date_string
 
 SCHEDULED_DATE_PATTERN = re.compile(r"\[\$?([^\[\$]*)\$?\]$")
 
+# exactly the date strings produced by date_to_string (for years from 1000 on)
+STANDARD_DATE_STRING_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<week>WEEK OF )?(?P<month>{months}) (?P<day>[1-9]\d?), "
+    r"(?P<year>[1-9]\d{{3}})"
+    r"|(?:{months}) [1-9]\d{{3}}"
+    r"|Q[1-4] [1-9]\d{{3}}"
+    r"|[1-9]\d{{3}}"
+    r"|SOMEDAY"
+    r")\Z".format(
+        months="|".join(get_month_name(n).upper() for n in range(1, 13))
+    )
+)
+
+DATE_CACHE_SIZE = 4096
+
+DateCacheInfo = namedtuple(
+    "DateCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class DateCache(object):
+    """A bounded, least-recently-used cache of parsed date strings.
+
+    Dates in absolute formats (e.g. "MARCH 3, 2025" or "SOMEDAY") are keyed by
+    the date string alone, so that they are shared across reference dates.
+    Dates in relative formats (e.g. "TOMORROW" or "Q3") are keyed by the
+    date string together with the reference date.
+
+    The cache is shared by all wikis processed in the same run, which may be
+    on separate threads, and so its entries are only accessed under a lock.
+    """
+
+    def __init__(self, maxsize=DATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, datestr, reference_date=None):
+        """Look up a parsed date string. Raises KeyError on a cache miss.
+
+        :param str datestr: The date string
+        :param :class:`datetime.date` reference_date: The reference date used
+            in parsing the date string
+        :returns tuple: The cached date and period
+        """
+        with self._lock:
+            for key in ((datestr,), (datestr, reference_date)):
+                try:
+                    value = self._entries.pop(key)
+                except KeyError:
+                    continue
+                # reinsert to mark it as the most recently used
+                self._entries[key] = value
+                self.hits += 1
+                return value
+            self.misses += 1
+        raise KeyError(datestr)
+
+    def put(self, datestr, reference_date, value, relative):
+        """Add a parsed date string to the cache, evicting the least recently
+        used entry if the cache is full.
+
+        :param str datestr: The date string
+        :param :class:`datetime.date` reference_date: The reference date used
+            in parsing the date string
+        :param tuple value: The parsed date and period
+        :param bool relative: Whether the date string is in a relative format
+        """
+        key = (datestr, reference_date) if relative else (datestr,)
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Empty the cache and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Statistics on the use of the cache.
+
+        :returns :class:`DateCacheInfo`: The number of hits and misses, and the
+            maximum and current sizes of the cache
+        """
+        with self._lock:
+            return DateCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._entries)
+            )
+
+
+date_cache = DateCache()
+
 
 def date_to_string(date, period):
     """
@@ -116,10 +161,38 @@ def date_to_string(date, period):
     return date_string.upper()
 
 
+def is_standard_date_string(datestr):
+    """Check whether a date string is already in the standard format (see
+    :func:`date_to_string`), so that standardizing it would leave it
+    unchanged. This is determined without parsing the date, except to check
+    that dates specifying a day are valid (and in the case of weeks, fall on
+    the start of a week).
+
+    :param str datestr: A string representing a date
+    :returns bool: Whether the string is in the standard format
+    """
+    match = STANDARD_DATE_STRING_PATTERN.match(datestr)
+    if not match:
+        return False
+    if not match.group('day'):
+        return True
+    try:
+        date = datetime.date(
+            int(match.group('year')),
+            get_month_number(match.group('month')),
+            int(match.group('day')),
+        )
+    except ValueError:
+        return False
+    return not match.group('week') or Week.is_start_of_period(date)
+
+
 def string_to_date(datestr, reference_date=None):
     """Parse a given string representing a date.
 
-    Tries various acceptable date formats until one works.
+    Matches the string against all of the acceptable date formats at once,
+    and parses it according to the first (in order of precedence) that
+    matches. Parsed dates are cached (see :class:`DateCache`).
 
     :param str datestr: A string representing a follow-up date for a
         blocked/scheduled item
@@ -128,44 +201,20 @@ def string_to_date(datestr, reference_date=None):
     :returns tuple: A python date object, and the relevant time period implied
         by the string representation
     """
-    patterns = (
-        (dateformat28, parse_dateformat28),
-        (dateformat27, parse_dateformat27),
-        (dateformat26, parse_dateformat26),
-        (dateformat1, parse_dateformat1),
-        (dateformat2, parse_dateformat2),
-        (dateformat18, parse_dateformat18),
-        (dateformat3, parse_dateformat3),
-        (dateformat4, parse_dateformat4),
-        (dateformat5, parse_dateformat5),
-        (dateformat6, parse_dateformat6),
-        (dateformat7, parse_dateformat7),
-        (dateformat8, parse_dateformat8),
-        (dateformat9, parse_dateformat9),
-        (dateformat13, parse_dateformat13),
-        (dateformat25, parse_dateformat25),
-        (dateformat16, parse_dateformat16),
-        (dateformat17, parse_dateformat17),
-        (dateformat10, parse_dateformat10),
-        (dateformat11, parse_dateformat11),
-        (dateformat12, parse_dateformat12),
-        (dateformat14, parse_dateformat14),
-        (dateformat15, parse_dateformat15),
-        (dateformat19, parse_dateformat19),
-        (dateformat23, parse_dateformat23),
-        (dateformat24, parse_dateformat24),
-        (dateformat21, parse_dateformat21),
-        (dateformat22, parse_dateformat22),
-        (dateformat20, parse_dateformat20),
-    )
-
-    for pattern, parse in patterns:
-        if pattern.search(datestr):
-            return parse(datestr, reference_date)
+    try:
+        return date_cache.get(datestr, reference_date)
+    except KeyError:
+        pass
 
-    raise DateFormatError(
-        "Date format does not match any acceptable formats! " + datestr
+    result = parse_date_string(datestr, reference_date)
+    if not result:
+        raise DateFormatError(
+            "Date format does not match any acceptable formats! " + datestr
+        )
+    date_cache.put(
+        datestr, reference_date, result, is_relative_date_string(datestr)
     )
+    return result
 
 
 def standardize_entry_date(entry, reference_date=None):
@@ -174,32 +223,73 @@ def standardize_entry_date(entry, reference_date=None):
     relatively specified so that it is unambiguous and time-invariant (e.g.
     dates like "next week").
 
-    :param str entry: The entry with a scheduled date
+    :param entry: The entry with a scheduled date, as a str or
+        :class:`~composer.backend.filesystem.primitives.Entry`
     :param :class:`datetime.date` reference_date: Reference date to use in
         parsing the indicated scheduled date
-    :returns str: The entry, with the scheduled date converted to a standard
-        format
+    :returns: The entry, with the scheduled date converted to a standard
+        format. This is of the same type as the provided entry.
     """
     task_header, task_contents = parse_task(entry)
-    matched_date = get_due_date(task_header, reference_date)
+    match = SCHEDULED_DATE_PATTERN.search(task_header)
+    if (
+        match
+        and match.group(0) == "[$" + match.group(1) + "$]"
+        and is_standard_date_string(match.group(1))
+    ):
+        # already in the standard format
+        return entry
+    matched_date = get_due_date(entry, reference_date)
     datestr = date_to_string(*matched_date)
     task_header = SCHEDULED_DATE_PATTERN.sub(
         "[$" + datestr + "$]", task_header
     )  # replace with standard format
     task = task_header + task_contents
+    if isinstance(entry, Entry):
+        task = Entry(task)
     return task
 
 
 def get_due_date(task, reference_date=None):
     """Get the due date for a task.
 
-    :param str task: The task
+    :param task: The task, as a str or
+        :class:`~composer.backend.filesystem.primitives.Entry`. For the latter,
+        the due date is only parsed once for any given reference date
     :param :class:`datetime.date` reference_date: A reference date to use
         in case the due date is specified relatively
     :returns tuple: The due date, together with the implied period
         for the date
     """
+    if isinstance(task, Entry):
+        return task.get_due_date(reference_date, _parse_due_date)
     header, _ = parse_task(task)
+    return _parse_due_date(header, reference_date)
+
+
+def has_relative_due_date(task):
+    """Check whether the due date for a task is specified relative to some
+    reference date (e.g. "NEXT WEEK"), so that it may differ depending on the
+    reference date used in parsing it.
+
+    :param task: The task, as a str or
+        :class:`~composer.backend.filesystem.primitives.Entry`
+    :returns bool: Whether the due date is relative
+    """
+    header, _ = parse_task(task)
+    match = SCHEDULED_DATE_PATTERN.search(header)
+    return bool(match) and is_relative_date_string(match.groups()[0])
+
+
+def _parse_due_date(header, reference_date=None):
+    """Parse the due date from the header of a task.
+
+    :param str header: The first line of the task
+    :param :class:`datetime.date` reference_date: A reference date to use
+        in case the due date is specified relatively
+    :returns tuple: The due date, together with the implied period
+        for the date
+    """
     if not SCHEDULED_DATE_PATTERN.search(header):
         raise BlockedTaskNotScheduledError(
             "No scheduled date for blocked task -- add a date for it:\n"
@@ -227,10 +317,11 @@ def is_task_due(task, for_day):
 def check_logfile_for_errors(logfile):
     """Check that the logfile includes an agenda section.
 
-    :param :class:`io.StringIO` logfile: The log file
+    :param logfile: The log file, either as a :class:`io.StringIO` file or
+        as a parsed document
     """
     try:
-        read_section(logfile, "AGENDA")
+        parse_document(logfile).get_section("AGENDA")
     except ValueError:
         raise LogfileLayoutError(
             "No AGENDA section found in today's log file!"
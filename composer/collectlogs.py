@@ -8,14 +8,12 @@ import re
 
 import click
 
-from datetime import timedelta
-
 from composer.backend import FilesystemPlanner
 from composer.backend.filesystem.interface import get_constituent_logs
 from composer.backend.filesystem.primitives import get_log_filename
 from composer.backend.filesystem.date_parsers import parse_dateformat12
 from composer.utils import display_message
-from composer.timeperiod import Week, Month, Quarter, Year, get_next_period
+from composer.timeperiod import Week, Month, Quarter, Year
 from composer import config
 
 CONFIG_ROOT = os.getenv("COMPOSER_ROOT", os.path.expanduser("~/.composer"))
@@ -48,27 +46,16 @@ def get_logs_times(wikidir, period, reference_date=None):
     """
     planner = FilesystemPlanner(wikidir)
     reference_date = reference_date or planner.date
-    current_date = period.get_start_date(reference_date)
-    logs = get_constituent_logs(period, current_date, wikidir)
-    constituent_period = get_next_period(period, decreasing=True)
     (logs_string, times) = ("", [])
-    for log in logs:
-        (log, time) = extract_log_time_from_text(log.read())
-        start_date = constituent_period.get_start_date(current_date)
-        # TODO: in case of missing logs, this mislabels the
-        # log period. Instead, rely on get_constituent_logs to
-        # provide source information instead of independently
-        # computing things here
+    for record in get_constituent_logs(period, reference_date, wikidir):
+        (log, time) = extract_log_time_from_text(record.contents.read())
         logs_string += (
-            get_log_filename(start_date, constituent_period)
+            get_log_filename(record.start_date, record.period)
             + "\n"
             + log
             + "\n\n"
         )
         times.append(time)
-        current_date = constituent_period.get_end_date(
-            current_date
-        ) + timedelta(days=1)
     return (logs_string, times)
 
 
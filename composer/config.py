@@ -14,9 +14,32 @@ CONFIG_FILENAME = "config.ini"
 WIKI_CONFIG_FILENAME = CONFIG_FILENAME
 
 LOGFILE_CHECKING = {"STRICT": 1, "LAX": 2}
+# how much to ensure that changes have reached the disk before moving on:
+# not at all, once for all changes saved together, or after every change
+DURABILITY = {"NONE": 0, "BATCH": 1, "STRICT": 2}
+# what to do in place of asking the user to review agendas when catching up
+# on several days at once: accept all agendas as proposed, or only accept
+# agendas for days (i.e. carry over unfinished tasks) and stop at the first
+# longer period that needs review
+CATCH_UP_POLICY = {"ACCEPT": 1, "CARRY_OVER": 2}
+# how to take snapshots of the wiki before and after advancing: as commits in
+# git, or in a journal of the files about to change, kept in the wiki
+SNAPSHOTS = {"GIT": 1, "JOURNAL": 2}
+# which changes to commit into git when advancing: only those to files that
+# the planner is known to have touched, or all changes anywhere in the wiki.
+# Committing all changes, as composer always has, also captures edits made
+# by hand elsewhere in the wiki. Targeted staging is quicker on large wikis,
+# but leaves any other changes uncommitted, for the user to commit
+GIT_STAGING = {"TARGETED": 1, "ALL": 2}
 
 DEFAULT_SCHEDULE = "standard"
 DEFAULT_BULLET_CHARACTER = "*"
+# the number of planner files to read from disk at a time
+DEFAULT_READ_WORKERS = 1
+DEFAULT_DURABILITY = DURABILITY["BATCH"]
+DEFAULT_CATCH_UP_POLICY = CATCH_UP_POLICY["ACCEPT"]
+DEFAULT_SNAPSHOTS = SNAPSHOTS["GIT"]
+DEFAULT_GIT_STAGING = GIT_STAGING["ALL"]
 
 
 def _read_config(config_path):
@@ -1,4 +1,4 @@
-from .base import ComposerError, ConfigError  # noqa
+from .base import ComposerError, ConfigError, SnapshotError  # noqa
 from .state import (  # noqa
     DayStillInProgressError,
     LogfileAlreadyExistsError,
@@ -29,6 +29,7 @@ from .scheduling import (  # noqa
 __all__ = (
     "ComposerError",
     "ConfigError",
+    "SnapshotError",
     "SchedulingError",
     "BlockedTaskNotScheduledError",
     "SchedulingDateError",
@@ -8,3 +8,9 @@ class ConfigError(Exception):
     """  An error in configuration. """
 
     pass
+
+
+class SnapshotError(ComposerError):
+    """  An error in taking or restoring a snapshot of a wiki. """
+
+    pass
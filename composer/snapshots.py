@@ -0,0 +1,354 @@
+import abc
+import base64
+import json
+import os
+import struct
+import subprocess
+import time
+import zlib
+
+from .errors import SnapshotError
+
+ABC = abc.ABCMeta("ABC", (object,), {})  # compatible with Python 2 *and* 3
+
+# the journal is kept in the wiki itself
+JOURNAL_FILENAME = ".composer-journal"
+# each record in the journal is preceded by its size
+RECORD_HEADER = struct.Struct(">I")
+
+# checkpoints of the state of the wiki at the end of the day, prior to
+# advancing it, and at the start of the new day, after advancing it
+END_OF_DAY = "EOD"
+START_OF_DAY = "SOD"
+# the last end of day checkpoint in a git repository, kept outside of its
+# branches
+END_OF_DAY_REF = "refs/composer/end-of-day"
+
+
+class Snapshots(ABC):
+    """Checkpoints of the state of a wiki, taken before and after it is
+    advanced, so that an advance can be rolled back if need be.
+    """
+
+    def __init__(self, wikidir):
+        self.wikidir = wikidir
+
+    @abc.abstractmethod
+    def checkpoint(self, kind, message, paths=None):
+        """Take a snapshot of the wiki.
+
+        :param str kind: The kind of checkpoint, i.e. :data:`END_OF_DAY`,
+            taken before advancing, or :data:`START_OF_DAY`, after advancing
+        :param str message: A description of the checkpoint
+        :param list paths: The paths to the files of interest, i.e. those
+            that the advance touches, or that the user may have edited. If
+            unspecified, the entire wiki is of interest
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rollback(self):
+        """Restore the wiki to the state at the last end of day checkpoint,
+        undoing the advance that followed it.
+
+        :returns str: The message of the checkpoint restored
+        """
+        raise NotImplementedError
+
+
+class GitSnapshots(Snapshots):
+    """Snapshots of a wiki that is a git repository, as git commits."""
+
+    def __init__(self, wikidir, all_changes=True):
+        """
+        :param str wikidir: The path to the wiki
+        :param bool all_changes: Whether to commit all changes in the wiki,
+            rather than only changes to the paths checkpointed
+        """
+        super(GitSnapshots, self).__init__(wikidir)
+        self.all_changes = all_changes
+
+    def _git(self, *args):
+        with open(os.devnull, "w") as null:
+            return subprocess.call(
+                ("git",) + args, cwd=self.wikidir, stdout=null
+            )
+
+    def _is_repository(self):
+        with open(os.devnull, "w") as null:
+            try:
+                return (
+                    subprocess.call(
+                        ("git", "rev-parse", "--git-dir"),
+                        cwd=self.wikidir,
+                        stdout=null,
+                        stderr=null,
+                    )
+                    == 0
+                )
+            except OSError:
+                # git isn't installed
+                return False
+
+    def _git_output(self, *args):
+        try:
+            output = subprocess.check_output(
+                ("git",) + args, cwd=self.wikidir
+            )
+        except (OSError, subprocess.CalledProcessError) as err:
+            raise SnapshotError(
+                "Couldn't read git history at {path}: {err}".format(
+                    path=self.wikidir, err=err
+                )
+            )
+        return output.decode("utf-8")
+
+    def _pathspecs(self, paths):
+        """The paths of interest, as pathspecs relative to the wiki.
+
+        :param list paths: The paths, or None for the entire wiki
+        :returns list: The pathspecs
+        """
+        if paths is None:
+            return ["."]
+        return [
+            os.path.relpath(path, self.wikidir) for path in sorted(set(paths))
+        ]
+
+    def checkpoint(self, kind, message, paths=None):
+        pathspecs = self._pathspecs(paths)
+        if paths is None or self.all_changes:
+            self._git("add", "-A")
+        else:
+            # staging only these paths spares git from scanning the entire
+            # wiki for changes. Paths that don't exist and were never
+            # committed are of no interest, and would be rejected by git
+            existing = [
+                pathspec
+                for pathspec in pathspecs
+                if os.path.lexists(os.path.join(self.wikidir, pathspec))
+            ]
+            if existing:
+                self._git("add", "-A", "--", *existing)
+        subject = "{kind} {message}".format(kind=kind, message=message)
+        self._git("commit", "-m", subject)
+        # not every wiki is a git repository, and committing into one that
+        # isn't simply fails, leaving the advance to go ahead regardless
+        if kind == END_OF_DAY and self._is_repository():
+            self._record_end_of_day(subject, pathspecs)
+
+    def _record_end_of_day(self, subject, pathspecs):
+        """Record the state of the wiki at the end of the day, and the paths
+        that the advance may change, so that they can be restored later even
+        if nothing was committed. The record is a commit of the staged state
+        of the wiki that is kept apart from the history of the wiki, in
+        :data:`END_OF_DAY_REF`, with the paths listed in its message.
+
+        :param str subject: The description of the checkpoint
+        :param list pathspecs: The paths of interest, relative to the wiki
+        """
+        tree = self._git_output("write-tree").strip()
+        record = self._git_output(
+            "commit-tree",
+            tree,
+            "-m",
+            subject,
+            "-m",
+            "\n".join(pathspecs),
+        ).strip()
+        self._git("update-ref", END_OF_DAY_REF, record)
+
+    def _read_end_of_day(self):
+        """The last end of day checkpoint.
+
+        :returns tuple: The commit recording the checkpoint, its description,
+            and the paths of interest, relative to the wiki
+        """
+        try:
+            record = self._git_output(
+                "rev-parse", "--verify", "-q", END_OF_DAY_REF
+            ).strip()
+        except SnapshotError:
+            record = None
+        if not record:
+            raise SnapshotError("No end of day checkpoint to roll back to!")
+        subject, _, body = (
+            self._git_output("log", "-1", "--format=%B", record)
+            .strip()
+            .partition("\n\n")
+        )
+        return record, subject, body.splitlines()
+
+    def _is_within(self, path, pathspecs):
+        return any(
+            pathspec == "."
+            or path == pathspec
+            or path.startswith(pathspec + "/")
+            for pathspec in pathspecs
+        )
+
+    def rollback(self):
+        record, subject, pathspecs = self._read_end_of_day()
+        # changes elsewhere in the wiki would be swept into the rollback
+        # commit, or lost
+        changed = self._git_output(
+            "diff", "--relative", "--name-only", "-z", "HEAD"
+        ).split("\0")
+        others = [
+            path
+            for path in changed
+            if path and not self._is_within(path, pathspecs)
+        ]
+        if others:
+            raise SnapshotError(
+                "Can't roll back with uncommitted changes to: {paths}. "
+                "Commit or stash them first.".format(paths=", ".join(others))
+            )
+        # files created since the checkpoint have no state to restore to
+        added = self._git_output(
+            "diff",
+            "--relative",
+            "--name-only",
+            "-z",
+            "--diff-filter=A",
+            record,
+            "--",
+            *pathspecs
+        ).split("\0")
+        added = [path for path in added if path]
+        if added:
+            self._git("rm", "-q", "-f", "--", *added)
+        # paths that didn't exist at the checkpoint are not in it
+        restored = self._git_output(
+            "ls-tree", "-r", "--name-only", "-z", record, "--", *pathspecs
+        ).split("\0")
+        restored = [path for path in restored if path]
+        if restored:
+            self._git("checkout", record, "--", *restored)
+        self._git("commit", "-m", "Roll back to {}".format(subject))
+        return subject
+
+
+class JournalSnapshots(Snapshots):
+    """Snapshots of a wiki in a journal kept in the wiki. At the end of the
+    day, copies of the files that are about to change are appended to the
+    journal, so that the advance can be undone. This is much quicker than
+    committing into git, and doesn't require the wiki to be a git repository.
+
+    The journal is a sequence of records, each of which is a compressed JSON
+    object preceded by its size. Records are appended, and only the last end
+    of day checkpoint is ever restored, so the journal is kept from growing
+    without bound by discarding the records before the previous end of day
+    checkpoint whenever a new one is added. The journal thus holds at most
+    the last two days' checkpoints.
+    """
+
+    def __init__(self, wikidir):
+        super(JournalSnapshots, self).__init__(wikidir)
+        self.path = os.path.join(wikidir, JOURNAL_FILENAME)
+
+    def _file_state(self, path):
+        """The state of a file, in a form that can be restored later."""
+        if os.path.islink(path):
+            return {"link": os.readlink(path)}
+        try:
+            with open(path, "rb") as f:
+                contents = f.read()
+        except (IOError, OSError):
+            # it doesn't exist yet
+            return {}
+        return {"contents": base64.b64encode(contents).decode("ascii")}
+
+    def _append(self, record):
+        data = zlib.compress(json.dumps(record).encode("utf-8"))
+        with open(self.path, "ab") as f:
+            f.write(RECORD_HEADER.pack(len(data)) + data)
+
+    def _read(self):
+        """Read the journal.
+
+        :returns tuple: The contents of the journal, and the position in it
+            at which each complete record begins and ends, along with the
+            record itself
+        """
+        try:
+            with open(self.path, "rb") as f:
+                journal = f.read()
+        except (IOError, OSError):
+            return b"", []
+        entries = []
+        position = 0
+        while position + RECORD_HEADER.size <= len(journal):
+            (size,) = RECORD_HEADER.unpack_from(journal, position)
+            start = position + RECORD_HEADER.size
+            data = journal[start : start + size]
+            if len(data) < size:
+                # the last record was never completely written
+                break
+            record = json.loads(zlib.decompress(data).decode("utf-8"))
+            entries.append((position, start + size, record))
+            position = start + size
+        return journal, entries
+
+    def records(self):
+        """Read the records in the journal, in the order they were added.
+
+        :returns list: The records
+        """
+        _, entries = self._read()
+        return [record for _, _, record in entries]
+
+    def _compact(self):
+        """Discard the records before the last end of day checkpoint, and any
+        record that was never completely written.
+        """
+        journal, entries = self._read()
+        starts = [
+            start
+            for start, _, record in entries
+            if record["kind"] == END_OF_DAY
+        ]
+        first = starts[-1] if starts else 0
+        last = entries[-1][1] if entries else 0
+        if first == 0 and last == len(journal):
+            return
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(journal[first:last])
+        os.rename(temporary_path, self.path)
+
+    def checkpoint(self, kind, message, paths=None):
+        record = {"kind": kind, "message": message, "time": time.time()}
+        if kind == END_OF_DAY:
+            if paths is None:
+                raise SnapshotError(
+                    "The journal needs to know which files are to change!"
+                )
+            record["files"] = dict(
+                (os.path.relpath(path, self.wikidir), self._file_state(path))
+                for path in set(paths)
+            )
+            # the previous end of day checkpoint is kept, and all before it
+            # discarded
+            self._compact()
+        self._append(record)
+
+    def rollback(self):
+        checkpoints = [
+            record
+            for record in self.records()
+            if record["kind"] == END_OF_DAY
+        ]
+        if not checkpoints:
+            raise SnapshotError("No end of day checkpoint to roll back to!")
+        checkpoint = checkpoints[-1]
+        for filename, state in checkpoint["files"].items():
+            path = os.path.join(self.wikidir, filename)
+            if os.path.lexists(path):
+                os.remove(path)
+            if "link" in state:
+                os.symlink(state["link"], path)
+            elif "contents" in state:
+                with open(path, "wb") as f:
+                    f.write(base64.b64decode(state["contents"]))
+        return "{kind} {message}".format(**checkpoint)
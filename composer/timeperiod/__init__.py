@@ -4,6 +4,7 @@ from .week import Week
 from .month import Month
 from .quarter import Quarter
 from .year import Year
+from .periodcalendar import PeriodCalendar, period_calendar
 from .utils import get_next_day, get_next_month
 from .interface import (
     get_next_period,
@@ -31,6 +32,8 @@ __all__ = (
     "day_of_week",
     "upcoming_dow_to_date",
     "Period",
+    "PeriodCalendar",
+    "period_calendar",
     "Zero",
     "Eternity",
     "Day",
@@ -72,6 +72,23 @@ class Period(ABC):
             next_date += timedelta(days=1)
         return current_date
 
+    def get_boundaries(self, year):
+        """Return the start dates of all periods (e.g. Weeks) beginning in
+        the given calendar year.
+
+        :param int year: The calendar year
+        :returns list: The start dates, in order
+        """
+        current_date = datetime.date(year, 1, 1)
+        boundaries = []
+        while current_date.year == year:
+            if self.is_start_of_period(current_date):
+                boundaries.append(current_date)
+            if current_date == datetime.date.max:
+                break
+            current_date += timedelta(days=1)
+        return boundaries
+
 
 class _Zero(Period):
 
@@ -1,3 +1,5 @@
+import datetime
+
 from .base import Period
 
 
@@ -13,6 +15,38 @@ class _Day(Period):
         """
         return True
 
+    def get_start_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        start of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The start date of the concerned period
+        """
+        return for_date
+
+    def get_end_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        end of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The end date of the concerned period
+        """
+        return for_date
+
+    def get_boundaries(self, year):
+        """Return the start dates of all periods (e.g. Weeks) beginning in
+        the given calendar year.
+
+        :param int year: The calendar year
+        :returns list: The start dates, in order
+        """
+        first = datetime.date(year, 1, 1).toordinal()
+        last = datetime.date(year, 12, 31).toordinal()
+        return [
+            datetime.date.fromordinal(ordinal)
+            for ordinal in range(first, last + 1)
+        ]
+
     def get_name(self):
         return "day"
 
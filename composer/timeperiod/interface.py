@@ -11,6 +11,15 @@ from .utils import get_next_day
 
 TIME_PERIODS = (Zero, Day, Week, Month, Quarter, Year, Eternity)
 
+# the calendar module computes these names afresh on each access,
+# so look them up once
+DAY_NAMES = tuple(calendar.day_name)
+MONTH_NUMBER_TO_NAME = dict(enumerate(calendar.month_name))
+MONTH_NAME_TO_NUMBER = dict(
+    (v.lower(), k) for k, v in MONTH_NUMBER_TO_NAME.items()
+)
+WEEKEND = {5, 6}  # Saturday and Sunday, as numbered by date.weekday
+
 
 def get_next_period(current_period, decreasing=False):
     """Return the next time period in sequence among the tracked
@@ -52,11 +61,7 @@ def is_weekend(date):
 
     :param :class:`datetime.date` date: The date to check
     """
-    dow = date.strftime('%A')
-    if dow.lower() in ('saturday', 'sunday'):
-        return True
-    else:
-        return False
+    return date.weekday() in WEEKEND
 
 
 def quarter_for_month(month):
@@ -97,10 +102,7 @@ def get_month_number(monthname):
     :param str monthname: The name of the month
     :returns int: The number of the month
     """
-    month_name_to_number = dict(
-        (v.lower(), k) for k, v in enumerate(calendar.month_name)
-    )
-    return month_name_to_number[monthname.lower()]
+    return MONTH_NAME_TO_NUMBER[monthname.lower()]
 
 
 def get_month_name(monthnumber):
@@ -109,10 +111,7 @@ def get_month_name(monthnumber):
     :param int monthnumber: The number of the month
     :returns str: The name of the month
     """
-    month_number_to_name = dict(
-        (k, v) for k, v in enumerate(calendar.month_name)
-    )
-    return month_number_to_name[monthnumber]
+    return MONTH_NUMBER_TO_NAME[monthnumber]
 
 
 def day_of_week(date):
@@ -120,7 +119,7 @@ def day_of_week(date):
 
     :param :class:`datetime.date` date: The date to check
     """
-    return date.strftime("%A")
+    return DAY_NAMES[date.weekday()]
 
 
 def upcoming_dow_to_date(dow, reference_date=None):
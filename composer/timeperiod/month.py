@@ -1,5 +1,10 @@
+import calendar
+import datetime
+
 from .base import Period
 
+MONTHS_IN_YEAR = 12
+
 
 class _Month(Period):
 
@@ -16,6 +21,37 @@ class _Month(Period):
         else:
             return False
 
+    def get_start_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        start of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The start date of the concerned period
+        """
+        return for_date.replace(day=1)
+
+    def get_end_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        end of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The end date of the concerned period
+        """
+        month_length = calendar.monthrange(for_date.year, for_date.month)[1]
+        return for_date.replace(day=month_length)
+
+    def get_boundaries(self, year):
+        """Return the start dates of all periods (e.g. Weeks) beginning in
+        the given calendar year.
+
+        :param int year: The calendar year
+        :returns list: The start dates, in order
+        """
+        return [
+            datetime.date(year, month, 1)
+            for month in range(1, MONTHS_IN_YEAR + 1)
+        ]
+
     def get_name(self):
         return "month"
 
@@ -0,0 +1,85 @@
+import bisect
+import datetime
+import threading
+from array import array
+from collections import OrderedDict
+
+# the number of calendar years to hold in the cache at any one time
+CALENDAR_CACHE_YEARS = 64
+
+
+class PeriodCalendar(object):
+    """A table of the boundaries of time periods, from which questions like
+    "when does the next month begin?" can be answered by lookup rather than
+    by computation.
+
+    For each calendar year, the start dates of each time period beginning in
+    that year are stored as a compact, ordered array of date ordinals, which
+    is consulted by bisection. Years are tabulated on demand and the least
+    recently used years are evicted once the cache is full. The cache may be
+    consulted from several threads at once, and so is only changed under a
+    lock.
+    """
+
+    def __init__(self, max_years=CALENDAR_CACHE_YEARS):
+        self.max_years = max_years
+        self._years = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _starts(self, year, period):
+        """The start dates of all periods of a kind that begin in a given
+        year, tabulating them if necessary.
+
+        :param int year: The calendar year
+        :param :class:`~composer.timeperiod.Period` period: The time period
+        :returns :class:`array.array`: The start dates, as ordinals
+        """
+        with self._lock:
+            try:
+                table = self._years.pop(year)
+            except KeyError:
+                table = {}
+            # (re)insert to mark it as the most recently used
+            self._years[year] = table
+            while len(self._years) > self.max_years:
+                self._years.popitem(last=False)
+            try:
+                return table[period]
+            except KeyError:
+                starts = array(
+                    'l',
+                    (
+                        date.toordinal()
+                        for date in period.get_boundaries(year)
+                    ),
+                )
+                table[period] = starts
+                return starts
+
+    def next_boundary(self, for_date, period):
+        """The start of the period of the given kind following the one that
+        contains a date.
+
+        :param :class:`datetime.date` for_date: The date of interest
+        :param :class:`~composer.timeperiod.Period` period: The time period
+        :returns :class:`datetime.date`: The start of the next period
+        """
+        ordinal = for_date.toordinal()
+        starts = self._starts(for_date.year, period)
+        index = bisect.bisect_right(starts, ordinal)
+        if index < len(starts):
+            return datetime.date.fromordinal(starts[index])
+        if for_date.year == datetime.MAXYEAR:
+            raise OverflowError("date value out of range")
+        # the next period begins in the following year
+        return datetime.date.fromordinal(
+            self._starts(for_date.year + 1, period)[0]
+        )
+
+    def clear(self):
+        """Empty the cache."""
+        with self._lock:
+            self._years.clear()
+
+
+period_calendar = PeriodCalendar()
@@ -1,7 +1,15 @@
+import calendar
+import datetime
+
 from .base import Period
 from .month import Month
 
 FIRST_MONTH_IN_QUARTER = {1, 4, 7, 10}
+MONTHS_IN_QUARTER = 3
+
+
+def _first_month_in_quarter(month):
+    return month - (month - 1) % MONTHS_IN_QUARTER
 
 
 class _Quarter(Period):
@@ -22,6 +30,39 @@ class _Quarter(Period):
         else:
             return False
 
+    def get_start_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        start of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The start date of the concerned period
+        """
+        month = _first_month_in_quarter(for_date.month)
+        return datetime.date(for_date.year, month, 1)
+
+    def get_end_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        end of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The end date of the concerned period
+        """
+        year = for_date.year
+        month = _first_month_in_quarter(for_date.month) + MONTHS_IN_QUARTER - 1
+        return datetime.date(year, month, calendar.monthrange(year, month)[1])
+
+    def get_boundaries(self, year):
+        """Return the start dates of all periods (e.g. Weeks) beginning in
+        the given calendar year.
+
+        :param int year: The calendar year
+        :returns list: The start dates, in order
+        """
+        return [
+            datetime.date(year, month, 1)
+            for month in sorted(FIRST_MONTH_IN_QUARTER)
+        ]
+
     def get_name(self):
         return "quarter"
 
@@ -1,10 +1,27 @@
 import calendar
+import datetime
 
 from .base import Period
-from .day import Day
-from .month import Month
+from .month import MONTHS_IN_YEAR
 
 MIN_WEEK_LENGTH = 5
+DAYS_IN_WEEK = 7
+SUNDAY = 6  # as numbered by datetime.date.weekday
+
+
+def _is_week_boundary(day, month_length):
+    """Whether a Sunday falling on the given day of the month begins a new
+    week. It does so only if both the days preceding it in the month and the
+    days remaining in the month are long enough to count as weeks in their own
+    right -- otherwise, the short stretch is merged into the adjacent week.
+
+    :param int day: The day of the month on which the Sunday falls
+    :param int month_length: The number of days in the month
+    :returns bool: Whether a new week begins on that day
+    """
+    return (
+        day > MIN_WEEK_LENGTH and month_length - day + 1 >= MIN_WEEK_LENGTH
+    )
 
 
 class _Week(Period):
@@ -17,19 +34,72 @@ class _Week(Period):
         :param :class:`datetime.date` to_date: The date to advance to
         :returns bool: Whether the criteria have been met
         """
-        dow = to_date.strftime("%A")
-        year = to_date.year
-        day_criteria_met = Day.is_start_of_period(to_date)
-        if Month.is_start_of_period(to_date) or (
-            day_criteria_met
-            and dow.lower() == "sunday"
-            and to_date.day > MIN_WEEK_LENGTH
-            and calendar.monthrange(year, to_date.month)[1] - to_date.day + 1
-            >= MIN_WEEK_LENGTH
-        ):
+        if to_date.day == 1:
             return True
-        else:
-            return False
+        month_length = calendar.monthrange(to_date.year, to_date.month)[1]
+        return to_date.weekday() == SUNDAY and _is_week_boundary(
+            to_date.day, month_length
+        )
+
+    def get_start_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        start of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The start date of the concerned period
+        """
+        month_length = calendar.monthrange(for_date.year, for_date.month)[1]
+        # the most recent Sunday, which may fall before the start of the month
+        sunday = for_date.day - (for_date.weekday() - SUNDAY) % DAYS_IN_WEEK
+        if not _is_week_boundary(sunday, month_length):
+            # if it's too close to the end of the month, the week began
+            # on the Sunday before
+            sunday -= DAYS_IN_WEEK
+        if _is_week_boundary(sunday, month_length):
+            return for_date.replace(day=sunday)
+        return for_date.replace(day=1)
+
+    def get_end_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        end of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The end date of the concerned period
+        """
+        month_length = calendar.monthrange(for_date.year, for_date.month)[1]
+        # the next Sunday, which may fall after the end of the month
+        sunday = (
+            for_date.day
+            + DAYS_IN_WEEK
+            - (for_date.weekday() - SUNDAY) % DAYS_IN_WEEK
+        )
+        if sunday <= MIN_WEEK_LENGTH:
+            # too close to the start of the month, so the week continues
+            # until the Sunday after
+            sunday += DAYS_IN_WEEK
+        if sunday <= month_length and _is_week_boundary(sunday, month_length):
+            return for_date.replace(day=sunday - 1)
+        return for_date.replace(day=month_length)
+
+    def get_boundaries(self, year):
+        """Return the start dates of all periods (e.g. Weeks) beginning in
+        the given calendar year.
+
+        :param int year: The calendar year
+        :returns list: The start dates, in order
+        """
+        boundaries = []
+        for month in range(1, MONTHS_IN_YEAR + 1):
+            first_weekday, month_length = calendar.monthrange(year, month)
+            # the first Sunday of the month
+            sunday = 1 + (SUNDAY - first_weekday) % DAYS_IN_WEEK
+            boundaries.append(datetime.date(year, month, 1))
+            boundaries.extend(
+                datetime.date(year, month, day)
+                for day in range(sunday, month_length + 1, DAYS_IN_WEEK)
+                if _is_week_boundary(day, month_length)
+            )
+        return boundaries
 
     def get_name(self):
         return "week"
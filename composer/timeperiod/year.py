@@ -1,7 +1,11 @@
+import datetime
+
 from .base import Period
 from .quarter import Quarter
 
 FIRST_MONTH_OF_YEAR = 1
+LAST_MONTH_OF_YEAR = 12
+LAST_DAY_OF_YEAR = 31
 
 
 class _Year(Period):
@@ -22,6 +26,35 @@ class _Year(Period):
         else:
             return False
 
+    def get_start_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        start of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The start date of the concerned period
+        """
+        return datetime.date(for_date.year, FIRST_MONTH_OF_YEAR, 1)
+
+    def get_end_date(self, for_date):
+        """Given a date, return the date corresponding to the
+        end of the present period (e.g. Week) encompassing that date.
+
+        :param :class:`datetime.date` for_date: The reference date
+        :returns :class:`datetime.date`: The end date of the concerned period
+        """
+        return datetime.date(
+            for_date.year, LAST_MONTH_OF_YEAR, LAST_DAY_OF_YEAR
+        )
+
+    def get_boundaries(self, year):
+        """Return the start dates of all periods (e.g. Weeks) beginning in
+        the given calendar year.
+
+        :param int year: The calendar year
+        :returns list: The start dates, in order
+        """
+        return [datetime.date(year, FIRST_MONTH_OF_YEAR, 1)]
+
     def get_name(self):
         return "year"
 
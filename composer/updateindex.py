@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import bisect
+import json
 import os
 import platform
 
@@ -6,18 +8,30 @@ import click
 
 from collections import namedtuple
 from functools import partial
+from operator import itemgetter
 
+from composer.config import DURABILITY
 from composer.utils import display_message
-from composer.backend.filesystem.primitives import bare_filename
+from composer.backend.filesystem.primitives import bare_filename, WriteBatch
+
+try:  # py3
+    from os import scandir
+except ImportError:  # py2
+    scandir = None
 
 # TODO: need to improve this script to do regex matching on wiki page names,
 # and sort the pages by type and in chronological order + Misc/uncategorized
 
 INDEX_FILE_PREFIX = "pages"
 INDEX_TITLE = "index"
+# a record of the pages in the wiki as of the last update to the index, kept
+# in the wiki itself
+MANIFEST_FILENAME = ".composer-index"
+MANIFEST_VERSION = 1
 
 PreIndex = namedtuple('Index', 'name sort sort_order')
 Index = namedtuple('Index', 'name title entries filename')
+PageOrder = namedtuple('PageOrder', 'name time sort_order')
 
 
 def is_wiki(filename):
@@ -43,16 +57,52 @@ def creation_date(path_to_file):
     last modified if that isn't possible.
     See http://stackoverflow.com/a/39501288/1709587 for explanation.
     """
+    return _creation_time(os.stat(path_to_file))
+
+
+def _creation_time(stat):
     if platform.system() == 'Windows':
-        return os.path.getctime(path_to_file)
-    else:
-        stat = os.stat(path_to_file)
-        try:
-            return stat.st_birthtime
-        except AttributeError:
-            # We're probably on Linux. No easy way to get creation dates here,
-            # so we'll settle for when its content was last modified.
-            return stat.st_mtime
+        return stat.st_ctime
+    try:
+        return stat.st_birthtime
+    except AttributeError:
+        # We're probably on Linux. No easy way to get creation dates here,
+        # so we'll settle for when its content was last modified.
+        return stat.st_mtime
+
+
+def _modified_time(stat):
+    # in whole nanoseconds, which are quicker to record than fractional
+    # seconds
+    try:
+        return stat.st_mtime_ns
+    except AttributeError:  # py2
+        return int(stat.st_mtime * 1e9)
+
+
+def _created_time(stat):
+    return int(_creation_time(stat) * 1e9)
+
+
+def scan_pages(path):
+    """Get all wiki pages at the specified path, along with the status of each
+    on disk.
+
+    :param str path: The location of the wiki
+    :returns dict: The status (as returned by :func:`os.stat`) of each wiki
+        page, by filename
+    """
+    if scandir is None:
+        return dict(
+            (filename, os.stat(os.path.join(path, filename)))
+            for filename in os.listdir(path)
+            if is_wiki(filename)
+        )
+    return dict(
+        (entry.name, entry.stat())
+        for entry in scandir(path)
+        if is_wiki(entry.name)
+    )
 
 
 def write_index(path_to_file, title, entries):
@@ -93,6 +143,23 @@ def format_for_display(page):
     return wikify(bare_filename(page))
 
 
+def index_filename(path, file_prefix, index_name=None):
+    """The path to an index file.
+
+    :param str path: The location of the wiki
+    :param str file_prefix: The filename prefix used for the index files
+    :param str index_name: The name of the index, or None for the root index
+    :returns str: The path to the index file
+    """
+    if index_name is None:
+        filename = "{}.wiki".format(file_prefix.capitalize())
+    else:
+        filename = "{prefix}_{name}.wiki".format(
+            prefix=file_prefix.capitalize(), name=index_name.capitalize()
+        )
+    return os.path.join(path, filename)
+
+
 def prepare_root_index(contents, path, file_prefix, title):
     """Prepare the root wiki index page linking to the provided contents
 
@@ -105,7 +172,7 @@ def prepare_root_index(contents, path, file_prefix, title):
 
     :returns Index: The prepared index
     """
-    filename = os.path.join(path, "{}.wiki".format(file_prefix.capitalize()))
+    filename = index_filename(path, file_prefix)
     title = "= {} =".format(title).upper()
     prefix = file_prefix.capitalize()
     _wikify = partial(wikify, prefix=prefix)
@@ -126,59 +193,305 @@ def prepare_index(contents, path, file_prefix, root_title, preindex):
     :returns Index: The prepared index
     """
     index_name, sort_fn, is_reversed = preindex
-    entries = list(
-        map(
-            format_for_display,
-            sorted(contents, key=sort_fn, reverse=is_reversed),
-        )
+    pages = sorted(contents, key=sort_fn, reverse=is_reversed)
+    entries = list(map(format_for_display, pages))
+    return prepare_sorted_index(
+        entries, path, file_prefix, root_title, index_name
     )
-    title = "= {} ({}) =".format(root_title, index_name).upper()
 
-    filename = os.path.join(
-        path,
-        "{prefix}_{name}.wiki".format(
-            prefix=file_prefix.capitalize(), name=index_name.capitalize()
-        ),
-    )
+
+def prepare_sorted_index(entries, path, file_prefix, root_title, index_name):
+    """Prepare a wiki index page listing the provided entries in the order
+    given.
+
+    :param list entries: The entries (str) for the pages to be included in
+        the index, in order, formatted for display
+    :param str path: The path to the location where the index is to be saved
+    :param str file_prefix: The filename prefix to use for the index file.
+    :param str root_title: The title used for the root index page
+    :param str index_name: The name of the index
+
+    :returns Index: The prepared index
+    """
+    title = "= {} ({}) =".format(root_title, index_name).upper()
+    filename = index_filename(path, file_prefix, index_name)
     return Index(index_name, title, entries, filename)
 
 
-def update_index(path, file_prefix=None, title=None):
+# the orders in which pages are listed in the indexes: by filename, or by a
+# time recorded for each page (when it was last modified, or created), and
+# whether in reverse
+ALPHABETICAL = PageOrder('alphabetical', None, False)
+BY_DATE_MODIFIED = PageOrder('by date modified', _modified_time, True)
+BY_DATE_CREATED = PageOrder('by date created', _created_time, False)
+PAGE_ORDERS = [ALPHABETICAL, BY_DATE_MODIFIED, BY_DATE_CREATED]
+
+
+class IndexManifest(object):
+    """A record of the pages in a wiki as of the last update to its index:
+    the order in which the pages are listed in each index, and when each
+    page was last modified and created. Comparing this with the pages
+    presently in the wiki tells which pages have been added, removed or
+    modified since, so that only those need to be placed in the indexes, and
+    only the indexes whose contents have changed need to be written.
+
+    On platforms that don't record when a file was created, the time that a
+    page was last modified when it was first seen is taken to be when it was
+    created.
+    """
+
+    def __init__(self, file_prefix, title):
+        """
+        :param str file_prefix: The filename prefix of the index files
+        :param str title: The title of the index
+        """
+        self.file_prefix = file_prefix
+        self.title = title
+        # the sort keys of the pages, in order, for each index. Pages are
+        # sorted by filename, or by a time and then by filename
+        self.orders = dict((order.name, []) for order in PAGE_ORDERS)
+        # the time of each page, by filename, for each order by time
+        self.times = dict(
+            (order.name, {}) for order in PAGE_ORDERS if order.time
+        )
+        # the time each index file was last modified, as of when it was
+        # written, by filename
+        self.indexes = {}
+
+    @classmethod
+    def load(cls, path, file_prefix, title):
+        """Read a manifest from disk.
+
+        :param str path: The path to the manifest file
+        :param str file_prefix: The filename prefix of the index files
+        :param str title: The title of the index
+        :returns :class:`IndexManifest`: The manifest, or None if there is no
+            usable manifest for an index with this prefix and title
+        """
+        try:
+            with open(path) as f:
+                record = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if record.get("version") != MANIFEST_VERSION or (
+            record.get("file_prefix"),
+            record.get("title"),
+        ) != (file_prefix, title):
+            return None
+        manifest = cls(file_prefix, title)
+        for order in PAGE_ORDERS:
+            if order.time is None:
+                manifest.orders[order.name] = record["orders"][order.name]
+            else:
+                (times, names) = record["orders"][order.name]
+                manifest.orders[order.name] = list(zip(times, names))
+                manifest.times[order.name] = dict(zip(names, times))
+        manifest.indexes = record["indexes"]
+        return manifest
+
+    def save(self, path):
+        """Write the manifest to disk.
+
+        :param str path: The path to the manifest file
+        """
+        orders = {}
+        for order in PAGE_ORDERS:
+            keys = self.orders[order.name]
+            if order.time is None:
+                orders[order.name] = keys
+            else:
+                # as a list of times and a list of filenames, which are much
+                # quicker to read and write than a pair for each page
+                orders[order.name] = [
+                    list(map(itemgetter(0), keys)),
+                    list(map(itemgetter(1), keys)),
+                ]
+        record = {
+            "version": MANIFEST_VERSION,
+            "file_prefix": self.file_prefix,
+            "title": self.title,
+            "orders": orders,
+            "indexes": self.indexes,
+        }
+        # the manifest can always be rebuilt, so there's no need to wait for
+        # it to reach the disk
+        with WriteBatch(os.path.dirname(path), DURABILITY["NONE"]) as batch:
+            batch.write(json.dumps(record), path)
+
+    def _insert(self, order, name, stat):
+        if order.time is None:
+            key = name
+        else:
+            time = order.time(stat)
+            self.times[order.name][name] = time
+            key = (time, name)
+        bisect.insort(self.orders[order.name], key)
+
+    def _remove(self, order, name):
+        if order.time is None:
+            key = name
+        else:
+            key = (self.times[order.name].pop(name), name)
+        keys = self.orders[order.name]
+        del keys[bisect.bisect_left(keys, key)]
+
+    def update(self, pages):
+        """Bring the manifest up to date with the pages presently in the
+        wiki.
+
+        :param dict pages: The status of each page in the wiki, by filename
+            (see :func:`scan_pages`)
+        :returns set: The names of the indexes whose contents have changed
+        """
+        modified_times = self.times[BY_DATE_MODIFIED.name]
+        if not modified_times:
+            # there's nothing to place the pages among, so sort them all at
+            # once
+            for order in PAGE_ORDERS:
+                if order.time is None:
+                    self.orders[order.name] = sorted(pages)
+                    continue
+                times = dict(
+                    (name, order.time(stat)) for name, stat in pages.items()
+                )
+                self.times[order.name] = times
+                self.orders[order.name] = sorted(
+                    zip(times.values(), times.keys())
+                )
+            return set(self.orders)
+        removed = [name for name in modified_times if name not in pages]
+        added = [name for name in pages if name not in modified_times]
+        modified = [
+            name
+            for name, stat in pages.items()
+            if name in modified_times
+            and _modified_time(stat) != modified_times[name]
+        ]
+        for name in removed:
+            for order in PAGE_ORDERS:
+                self._remove(order, name)
+        previous_order = self.ordered_pages(BY_DATE_MODIFIED)
+        for name in modified:
+            self._remove(BY_DATE_MODIFIED, name)
+            self._insert(BY_DATE_MODIFIED, name, pages[name])
+        for name in added:
+            for order in PAGE_ORDERS:
+                self._insert(order, name, pages[name])
+        if removed or added:
+            return set(self.orders)
+        # pages modified in turn may remain in the same order
+        if self.ordered_pages(BY_DATE_MODIFIED) != previous_order:
+            return set([BY_DATE_MODIFIED.name])
+        return set()
+
+    def ordered_pages(self, order):
+        """The pages in the order that they are listed in an index.
+
+        :param :class:`PageOrder` order: The order of the index
+        :returns list: The filenames of the pages
+        """
+        keys = self.orders[order.name]
+        if order.time is None:
+            pages = list(keys)
+        else:
+            pages = list(map(itemgetter(1), keys))
+        if order.sort_order:
+            pages.reverse()
+        return pages
+
+    def is_stale(self, filename):
+        """Whether an index file has been removed or modified since it was
+        last written, e.g. in rolling back an advance.
+
+        :param str filename: The path to the index file
+        :returns bool: Whether the index file needs to be written again
+        """
+        try:
+            modified = _modified_time(os.stat(filename))
+        except OSError:
+            return True
+        return self.indexes.get(os.path.basename(filename)) != modified
+
+    def record_written(self, filenames):
+        """Note that index files have been written.
+
+        :param list filenames: The paths to the index files
+        """
+        for filename in filenames:
+            self.indexes[os.path.basename(filename)] = _modified_time(
+                os.stat(filename)
+            )
+
+
+def update_index(path, file_prefix=None, title=None, full=False):
     """Generate the index from all .wiki files present at the provided
     path. Use the provided filename and title string, if any, or use defaults.
-    This generates the index from scratch and overwrites any existing index
-    files that may be present. It generates a root index linking to actual
-    index files, each of which are sorted according to different criteria.
+    It generates a root index linking to actual index files, each of which
+    are sorted according to different criteria.
+
+    Unless a full update is requested, only the pages that have been added,
+    removed or modified since the index was last updated, according to the
+    manifest kept in the wiki, are placed in the indexes, and only the index
+    files whose contents have changed are written. A full update generates
+    the index from scratch and overwrites any existing index files that may
+    be present.
 
     :param str path: The location of the wiki
     :param str file_prefix: The file prefix (not including extension) to
         use in the filenames for the generated indexes
     :param str title: A title string to use at the top of the file
+    :param bool full: Whether to generate the index from scratch rather than
+        only updating it with changes to the wiki
+    :returns list: The paths to the index files written
     """
     if not file_prefix:
         file_prefix = INDEX_FILE_PREFIX
     if not title:
         title = INDEX_TITLE
-    files = get_files(path, is_wiki)
-
-    preindexes = [
-        PreIndex('alphabetical', identity, False),
-        PreIndex('by date modified', os.path.getmtime, True),
-        PreIndex('by date created', creation_date, False),
-    ]
+    manifest_path = os.path.join(path, MANIFEST_FILENAME)
+    manifest = None
+    if not full:
+        manifest = IndexManifest.load(manifest_path, file_prefix, title)
+    if manifest is None:
+        manifest = IndexManifest(file_prefix, title)
+    changed = manifest.update(scan_pages(path))
 
     # prepare the individual indexes according to whatever sorting order
-    prepare = partial(prepare_index, files, path, file_prefix, title)
-    indexes = list(map(prepare, preindexes))
+    indexes = []
+    entries = {}
+    for order in PAGE_ORDERS:
+        filename = index_filename(path, file_prefix, order.name)
+        if order.name in changed or manifest.is_stale(filename):
+            if not entries:
+                # every page is listed in each index, but only needs to be
+                # formatted once
+                entries = dict(
+                    (name, format_for_display(name))
+                    for name in manifest.ordered_pages(ALPHABETICAL)
+                )
+            indexes.append(
+                prepare_sorted_index(
+                    [entries[name] for name in manifest.ordered_pages(order)],
+                    path,
+                    file_prefix,
+                    title,
+                    order.name,
+                )
+            )
 
     # prepare main index file
-    index_names = [i.name.capitalize() for i in indexes]
-    root_index = prepare_root_index(index_names, path, file_prefix, title)
-    indexes.append(root_index)
+    if manifest.is_stale(index_filename(path, file_prefix)):
+        index_names = [order.name.capitalize() for order in PAGE_ORDERS]
+        root_index = prepare_root_index(index_names, path, file_prefix, title)
+        indexes.append(root_index)
 
-    # write all of the index files
+    # write all of the index files that have changed
     for _, title, entries, filename in indexes:
         write_index(filename, title, entries)
+    written = [filename for _, _, _, filename in indexes]
+    manifest.record_written(written)
+    manifest.save(manifest_path)
+    return written
 
 
 @click.command(
@@ -203,10 +516,18 @@ def update_index(path, file_prefix=None, title=None):
     "--title",
     help=("Title for the index page (default '{}')".format(INDEX_TITLE)),
 )
-def main(wikipath, file_prefix=None, title=None):
+@click.option(
+    "--full",
+    is_flag=True,
+    help=(
+        "Regenerate the entire index rather than only updating it with "
+        "pages added, removed or modified since it was last updated."
+    ),
+)
+def main(wikipath, file_prefix=None, title=None, full=False):
     wikipath = wikipath.rstrip("/")
     display_message()
     display_message(">>> Operating on wiki at location: %s <<<" % wikipath)
     display_message()
 
-    update_index(wikipath, file_prefix, title)
+    update_index(wikipath, file_prefix, title, full)
@@ -1,4 +1,6 @@
 import sys
+import threading
+from contextlib import contextmanager
 from time import sleep
 
 try:  # py2
@@ -8,8 +10,16 @@ except NameError:  # py3
 
 PROGRESS_DELAY = 0
 
+# when tasks share the console (see :class:`ConsoleQueue`), each thread's
+# output is held here until it is that task's turn at the console
+_console = threading.local()
+
 
 def _write_out(message):
+    output = getattr(_console, 'output', None)
+    if output is not None:
+        output.append(str(message))
+        return
     sys.stdout.write(str(message))
     sys.stdout.flush()
 
@@ -58,4 +68,78 @@ def ask_input(message=''):
     :param str message: The message to prompt the user with
     :returns str: The input from the user
     """
-    return raw_input(message)
+    queue = getattr(_console, 'queue', None)
+    if queue is None:
+        return raw_input(message)
+    with queue.turn():
+        _flush_output()
+        return raw_input(message)
+
+
+def _flush_output():
+    """Write any output held for the current task to the console. Must only
+    be called during the task's turn at the console.
+    """
+    output, _console.output = _console.output, []
+    if output:
+        _console.queue.show(_console.label, "".join(output))
+
+
+class ConsoleQueue(object):
+    """A queue for tasks running concurrently to take turns at the console,
+    so that prompts from different tasks are never interleaved. Output from
+    each task is held back until the task asks for input or completes, and
+    is then shown together with any prompt, in the order in which the tasks
+    asked for their turn.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._now_serving = 0
+        self._last_label = None
+
+    @contextmanager
+    def turn(self):
+        """Wait for a turn at the console, and hold it for the duration of
+        the context.
+        """
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            while ticket != self._now_serving:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._now_serving += 1
+                self._condition.notify_all()
+
+    def show(self, label, text):
+        """Write output for a task to the console. Must only be called during
+        the task's turn at the console.
+
+        :param str label: A label identifying the task
+        :param str text: The output
+        """
+        if label != self._last_label:
+            sys.stdout.write("\n[{label}]\n".format(label=label))
+            self._last_label = label
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    @contextmanager
+    def task(self, label):
+        """Run a task on the current thread, with its output held back and
+        its prompts queued for a turn at the console.
+
+        :param str label: A label identifying the task in its output
+        """
+        _console.queue, _console.label, _console.output = self, label, []
+        try:
+            yield
+        finally:
+            with self.turn():
+                _flush_output()
+            _console.queue = _console.label = _console.output = None
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
+import datetime
 import os
-from subprocess import call
+import timeit
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
 
 import click
 
@@ -9,6 +12,8 @@ from . import advice
 from . import config
 from . import updateindex
 from .backend import FilesystemPlanner, FilesystemTasklist
+from .backend.filesystem.base import PLANNERDAYFILELINK
+from .backend.filesystem.primitives import WriteBatch, file_fingerprint
 from .timeperiod import (
     Zero,
     Day,
@@ -20,10 +25,17 @@ from .timeperiod import (
     quarter_for_month,
     get_month_name,
 )
-from .utils import display_message, ask_input
+from .snapshots import (
+    END_OF_DAY,
+    START_OF_DAY,
+    GitSnapshots,
+    JournalSnapshots,
+)
+from .utils import ConsoleQueue, display_message, ask_input
 
 from .errors import (
     AgendaNotReviewedError,
+    ConfigError,
     SchedulingError,
     LayoutError,
     LogfileNotCompletedError,
@@ -39,11 +51,86 @@ except ImportError:  # py3
 CONFIG_ROOT = os.getenv("COMPOSER_ROOT", os.path.expanduser("~/.composer"))
 CONFIG_FILE = os.path.join(CONFIG_ROOT, config.CONFIG_FILENAME)
 
+# the outcome of processing a wiki, as reported once all wikis are done
+WikiSummary = namedtuple(
+    "WikiSummary", ["wikidir", "advanced_to", "error", "seconds"]
+)
+
+
+def _get_option(preferences, name, options, default):
+    """Get a preference that is one of a set of named options, e.g. the
+    durability of changes to the wiki on disk.
+
+    :param dict preferences: User preferences e.g. from a config file
+    :param str name: The name of the preference
+    :param dict options: The value of each option, by name
+    :param default: The value to use if the preference isn't set
+    :returns: The value of the option
+    """
+    option = preferences.get(name)
+    if not option:
+        return default
+    try:
+        return options[option.upper().replace("-", "_")]
+    except KeyError:
+        raise ConfigError(
+            "Unknown {name} '{option}' -- expected one of: "
+            "{options}".format(
+                name=name.replace("_", " "),
+                option=option,
+                options=", ".join(
+                    key.lower().replace("_", "-") for key in sorted(options)
+                ),
+            )
+        )
+
+
+def _get_durability(preferences):
+    """The durability of changes to the wiki on disk, as configured.
+
+    :param dict preferences: User preferences e.g. from a config file
+    :returns int: The durability (see :data:`~composer.config.DURABILITY`)
+    """
+    return _get_option(
+        preferences,
+        "durability",
+        config.DURABILITY,
+        config.DEFAULT_DURABILITY,
+    )
 
-def _make_git_commit(wikidir, message):
-    with open(os.devnull, "w") as null:
-        call(["git", "add", "-A"], cwd=wikidir, stdout=null)
-        call(["git", "commit", "-m", message], cwd=wikidir, stdout=null)
+
+def _fingerprint_files(paths):
+    """Fingerprint files on disk, to tell later whether they have changed.
+
+    :param list paths: Paths to the files
+    :returns dict: The fingerprint of each file
+    """
+    return dict((path, file_fingerprint(path)) for path in paths)
+
+
+def _files_have_changed(fingerprints):
+    """Whether any of the fingerprinted files have changed on disk.
+
+    :param dict fingerprints: The fingerprint of each file, as produced by
+        :func:`_fingerprint_files`
+    :returns bool: Whether any of the files have changed
+    """
+    return any(
+        file_fingerprint(path) != fingerprint
+        for path, fingerprint in fingerprints.items()
+    )
+
+
+def _report_saved_files(paths):
+    """Show the files that were written to disk, e.g. upon advancing the
+    planner. Files that were unchanged aren't written and aren't shown.
+
+    :param list paths: Paths to the files written
+    """
+    display_message()
+    display_message("Saved {} file(s):".format(len(paths)))
+    for path in paths:
+        display_message("  " + os.path.basename(path))
 
 
 def _show_advice(wikidir, preferences):
@@ -63,14 +150,55 @@ def _show_advice(wikidir, preferences):
     display_message(advice.get_advice(lessons_files))
 
 
+def _get_baton_file(wikidir, preferences):
+    """The path to the "baton" file, if one is configured."""
+    baton_file = preferences.get('baton_file')
+    return os.path.join(wikidir, baton_file) if baton_file else None
+
+
+def _get_snapshots(wikidir, preferences):
+    """The snapshots of the wiki taken before and after advancing, as
+    configured.
+
+    :param str wikidir: The path to the wiki
+    :param dict preferences: User preferences e.g. from a config file
+    :returns :class:`~composer.snapshots.Snapshots`: The snapshots
+    """
+    snapshots = _get_option(
+        preferences,
+        "snapshots",
+        config.SNAPSHOTS,
+        config.DEFAULT_SNAPSHOTS,
+    )
+    if snapshots == config.SNAPSHOTS["JOURNAL"]:
+        return JournalSnapshots(wikidir)
+    staging = _get_option(
+        preferences,
+        "git_staging",
+        config.GIT_STAGING,
+        config.DEFAULT_GIT_STAGING,
+    )
+    return GitSnapshots(
+        wikidir, all_changes=staging == config.GIT_STAGING["ALL"]
+    )
+
+
+def _get_datestr(plannerdate):
+    (date, month, year) = (
+        plannerdate.day,
+        plannerdate.strftime("%B"),
+        plannerdate.year,
+    )
+    return "%s %d, %d" % (month, date, year)
+
+
 def _pass_baton(wikidir, preferences):
     """Display the contents of the "baton" file (usually Baton.wiki)
     as the strands in progress / next steps to pick up on. Then clear
     the file.
     """
     try:
-        baton_file = preferences.get('baton_file')
-        baton_file = os.path.join(wikidir, baton_file) if baton_file else None
+        baton_file = _get_baton_file(wikidir, preferences)
         if baton_file:
             # display its contents
             with open(baton_file, 'r') as f:
@@ -87,26 +215,27 @@ def _pass_baton(wikidir, preferences):
         pass
 
 
-def _post_advance_tasks(wikidir, plannerdate, preferences):
+def _post_advance_tasks(wikidir, plannerdate, preferences, written=()):
     """Update the index to include any newly created files,
     Commit the post-advance state into git, and display a
     thought for the day.
+
+    :param list written: The paths to the files saved in advancing
     """
     # update index after making changes
     display_message()
     display_message("Updating planner wiki index", interactive=True)
-    updateindex.update_index(wikidir)
-    # git commit "after"
+    index_files = updateindex.update_index(wikidir)
+    # snapshot "after"
     display_message()
     display_message("Committing all changes", interactive=True)
-    (date, month, year) = (
-        plannerdate.day,
-        plannerdate.strftime("%B"),
-        plannerdate.year,
+    # the index manifest is rewritten along with the indexes
+    manifest = os.path.join(wikidir, updateindex.MANIFEST_FILENAME)
+    _get_snapshots(wikidir, preferences).checkpoint(
+        START_OF_DAY,
+        _get_datestr(plannerdate),
+        list(written) + index_files + [manifest],
     )
-    datestr = "%s %d, %d" % (month, date, year)
-    message = "SOD %s" % datestr
-    _make_git_commit(wikidir, message)
 
     _pass_baton(wikidir, preferences)
 
@@ -119,6 +248,8 @@ def process_wiki(wikidir, preferences):
 
     :param str wikidir: The path to the wiki
     :param dict preferences: User preferences e.g. from a config file
+    :returns :class:`datetime.date`: The date advanced to, or None if the
+        planner didn't advance
     """
     # simulate the changes first and then when it's all OK, make the necessary
     # preparations (e.g. git commit) and actually perform the changes
@@ -130,12 +261,30 @@ def process_wiki(wikidir, preferences):
     )  # mutates preferences
 
     period_prompted = Zero
+    # the advance, which is resumed after each prompt rather than started
+    # over, unless the user edits their planner in the meantime
+    advance = None
+    user_files = {}
     while True:
         display_message()
         try:
-            tasklist = FilesystemTasklist(wikidir)
-            planner = FilesystemPlanner(wikidir, tasklist, preferences)
-            status, next_day_planner = planner.advance()
+            if advance is not None and _files_have_changed(user_files):
+                advance = None
+            if advance is None:
+                tasklist = FilesystemTasklist(wikidir)
+                planner = FilesystemPlanner(wikidir, tasklist, preferences)
+                advance = planner.start_advance()
+                needs_input = advance.run()
+            else:
+                needs_input = advance.resume(preferences)
+            if needs_input is not None:
+                # note the state of any files the user may edit when prompted
+                user_files = _fingerprint_files(
+                    advance.planner.get_current_files()
+                )
+                raise needs_input
+            planner = advance.planner
+            status, next_day_planner = advance.status, advance.next_day_planner
         except LogfileNotCompletedError as err:
             display_message(
                 "Looks like you haven't completed your %s's log"
@@ -165,6 +314,8 @@ def process_wiki(wikidir, preferences):
         except SchedulingError as err:
             display_message(err.value, newline=False, prompt=True)
             ask_input()
+            # the advance can't be resumed past the error, so start over
+            advance = None
         except LayoutError:
             raise
         except MissingThemeError as err:
@@ -250,22 +401,29 @@ def process_wiki(wikidir, preferences):
             # print "DEV: simulation passed. let's do this thing
             # ... for real."
             if status >= Day:
-                # git commit a "before", now that we know changes
+                # snapshot a "before", now that we know changes
                 # are about to be written to planner
                 display_message()
                 display_message(
                     "Saving EOD planner state before making changes",
                     interactive=True,
                 )
-                plannerdate = planner.date
-                (date, month, year) = (
-                    plannerdate.day,
-                    plannerdate.strftime("%B"),
-                    plannerdate.year,
+                # the files the user may have edited over the course of the
+                # day, including notes left for tomorrow, and the files that
+                # are about to change
+                paths = (
+                    planner.get_current_files()
+                    + next_day_planner.get_current_files()
+                    + [
+                        os.path.join(wikidir, PLANNERDAYFILELINK),
+                        _get_baton_file(wikidir, preferences),
+                    ]
+                )
+                _get_snapshots(wikidir, preferences).checkpoint(
+                    END_OF_DAY,
+                    _get_datestr(planner.date),
+                    [path for path in paths if path],
                 )
-                datestr = "%s %d, %d" % (month, date, year)
-                message = "EOD %s" % datestr
-                _make_git_commit(wikidir, message)
 
                 # actually make the changes on disk. No changes should
                 # have been persisted up to this point
@@ -286,17 +444,23 @@ def process_wiki(wikidir, preferences):
                 next_period = (
                     get_next_period(status) if status < Year else status
                 )
-                planner.save(next_period)
+                # all changes are written to disk together, so that a
+                # failure partway through doesn't leave the wiki half-advanced
+                durability = _get_durability(preferences)
+                with WriteBatch(wikidir, durability) as batch:
+                    written = planner.save(next_period, batch)
 
-                # save all newly advanced periods
-                next_day_planner.save(status)
+                    # save all newly advanced periods
+                    written += next_day_planner.save(status, batch)
 
-                # save the (common) tasklist
-                planner.tasklist.save()
+                    # save the (common) tasklist
+                    written += planner.tasklist.save(batch)
+                _report_saved_files(written)
 
                 _post_advance_tasks(
-                    wikidir, next_day_planner.date, preferences
+                    wikidir, next_day_planner.date, preferences, written
                 )
+                return next_day_planner.date
             else:
                 display_message(
                     "Current day is still in progress! Try again after 6pm."
@@ -304,6 +468,238 @@ def process_wiki(wikidir, preferences):
             break
 
 
+def _catch_up(planner, batch, policy, to_date=None):
+    """Advance the planner a day at a time up to the given date (by default,
+    the present day), without prompting for input. Each day's planner is
+    advanced from the state in memory at the end of the previous day, and all
+    changes are staged in the batch rather than written to disk along the
+    way.
+
+    :param :class:`~composer.backend.FilesystemPlanner` planner: The planner
+    :param :class:`~composer.backend.filesystem.primitives.WriteBatch`
+        batch: The batch of changes to stage the files in
+    :param int policy: What to do in place of asking the user to review
+        agendas (see :data:`~composer.config.CATCH_UP_POLICY`)
+    :param :class:`datetime.date` to_date: The date to catch up to
+    :returns tuple: The planner for the last day advanced to, the paths to
+        the files written, and the input needed from the user to advance
+        any further, if any
+    """
+    # logs for the days caught up on are never completed
+    planner.logfile_completion_checking = config.LOGFILE_CHECKING["LAX"]
+    if policy == config.CATCH_UP_POLICY["ACCEPT"]:
+        planner.agenda_reviewed = Year
+        if planner.week_theme is None:
+            planner.week_theme = ""
+    else:
+        planner.agenda_reviewed = Day
+    to_date = to_date or datetime.date.today()
+    (written, needs_input) = ([], None)
+    while planner.date < to_date:
+        advance = planner.start_advance()
+        needs_input = advance.run()
+        if needs_input is not None or advance.status == Zero:
+            break
+        status, next_day_planner = advance.status, advance.next_day_planner
+        next_day_planner.is_ok_to_advance(status)
+        next_period = get_next_period(status) if status < Year else status
+        written += planner.save(next_period, batch)
+        written += next_day_planner.save(status, batch)
+        planner = planner.following_planner(status)
+    written += planner.tasklist.save(batch)
+    # files written more than once are only written once, at the end
+    return planner, sorted(set(written)), needs_input
+
+
+def catch_up_wiki(wikidir, preferences):
+    """Advance the wiki at the specified path a day at a time up to the
+    present day in a single pass, e.g. after some time away. In place of
+    prompting for input, agendas are reviewed according to the configured
+    catch-up policy. All changes are written to disk together at the end and
+    committed at once.
+
+    :param str wikidir: The path to the wiki
+    :param dict preferences: User preferences e.g. from a config file
+    :returns :class:`datetime.date`: The date caught up to, or None if there
+        was nothing to catch up on
+    """
+    display_message()
+    display_message(">>> Catching up planner at location: %s <<<" % wikidir)
+
+    config.update_wiki_specific_preferences(
+        wikidir, preferences
+    )  # mutates preferences
+    policy = _get_option(
+        preferences,
+        "catch_up_policy",
+        config.CATCH_UP_POLICY,
+        config.DEFAULT_CATCH_UP_POLICY,
+    )
+
+    tasklist = FilesystemTasklist(wikidir)
+    planner = FilesystemPlanner(wikidir, tasklist, preferences)
+    start_date = planner.date
+    # the files the user may have edited since the wiki was last advanced
+    start_paths = planner.get_current_files() + [
+        os.path.join(wikidir, PLANNERDAYFILELINK),
+        _get_baton_file(wikidir, preferences),
+    ]
+    with WriteBatch(wikidir, _get_durability(preferences)) as batch:
+        planner, written, needs_input = _catch_up(planner, batch, policy)
+        if written:
+            # snapshot a "before", now that we know changes are about to be
+            # written to the planner
+            display_message()
+            display_message(
+                "Saving planner state before catching up", interactive=True
+            )
+            # including the files about to change, so that catching up can
+            # be rolled back like any other advance
+            paths = start_paths + list(batch.staged) + list(batch.links)
+            _get_snapshots(wikidir, preferences).checkpoint(
+                END_OF_DAY,
+                _get_datestr(start_date),
+                [path for path in paths if path],
+            )
+
+    display_message()
+    caught_up_to = None
+    if planner.date == start_date:
+        display_message("Nothing to catch up on!")
+    else:
+        caught_up_to = planner.date
+        display_message(
+            "Caught up from {start} to {end}".format(
+                start=start_date.strftime("%B %d, %Y"),
+                end=planner.date.strftime("%B %d, %Y"),
+            )
+        )
+        _report_saved_files(written)
+        _post_advance_tasks(wikidir, planner.date, preferences, written)
+    if needs_input is not None:
+        display_message()
+        display_message(
+            "Stopped catching up at {date}: {needs_input} Run whats-next "
+            "to continue.".format(
+                date=planner.date.strftime("%B %d, %Y"),
+                needs_input=needs_input.value,
+            )
+        )
+    return caught_up_to
+
+
+def rollback_wiki(wikidir, preferences):
+    """Undo the last advance of the wiki at the specified path, restoring it
+    to the state at the end of the day before the advance.
+
+    :param str wikidir: The path to the wiki
+    :param dict preferences: User preferences e.g. from a config file
+    """
+    display_message()
+    display_message(">>> Rolling back planner at location: %s <<<" % wikidir)
+
+    config.update_wiki_specific_preferences(
+        wikidir, preferences
+    )  # mutates preferences
+    checkpoint = _get_snapshots(wikidir, preferences).rollback()
+    # the index may refer to logs that no longer exist
+    updateindex.update_index(wikidir)
+    display_message()
+    display_message("Rolled back to {}".format(checkpoint))
+
+
+def _run_wiki_task(process, queue, wikidir, preferences):
+    """Process a wiki as one of several running concurrently, timing it and
+    noting any error rather than raising it.
+
+    :param callable process: The function to process the wiki with, e.g.
+        :func:`process_wiki`
+    :param :class:`~composer.utils.ConsoleQueue` queue: The queue for turns
+        at the console
+    :param str wikidir: The path to the wiki
+    :param dict preferences: User preferences e.g. from a config file
+    :returns :class:`WikiSummary`: The outcome
+    """
+    start = timeit.default_timer()
+    (advanced_to, error) = (None, None)
+    with queue.task(wikidir):
+        try:
+            advanced_to = process(wikidir, preferences)
+        except Exception as err:
+            error = err
+    return WikiSummary(
+        wikidir, advanced_to, error, timeit.default_timer() - start
+    )
+
+
+def _report_summaries(summaries):
+    """Show a table of the outcome of processing each wiki.
+
+    :param list summaries: The :class:`WikiSummary` for each wiki
+    """
+    rows = [("WIKI", "RESULT", "TIME")]
+    for summary in summaries:
+        if summary.error is not None:
+            result = "Failed: {error}".format(error=summary.error)
+        elif summary.advanced_to is None:
+            result = "Not advanced"
+        else:
+            result = "Advanced to {date}".format(
+                date=summary.advanced_to.strftime("%B %d, %Y")
+            )
+        rows.append(
+            (summary.wikidir, result, "%.2fs" % summary.seconds)
+        )
+    widths = [max(len(row[column]) for row in rows) for column in (0, 1)]
+    display_message()
+    for wikidir, result, seconds in rows:
+        display_message(
+            "{wikidir}  {result}  {seconds}".format(
+                wikidir=wikidir.ljust(widths[0]),
+                result=result.ljust(widths[1]),
+                seconds=seconds.rjust(6),
+            )
+        )
+
+
+def process_wikis(process, wikidirs, preferences, jobs=1):
+    """Process several wikis, up to the given number at a time.
+
+    When processing wikis concurrently, everything short of asking the user
+    for input proceeds in parallel, while prompts are queued for the console
+    so that only one wiki at a time prompts the user. A summary of the
+    outcome for each wiki is shown at the end.
+
+    :param callable process: The function to process each wiki with, e.g.
+        :func:`process_wiki`
+    :param list wikidirs: The paths to the wikis
+    :param dict preferences: User preferences e.g. from a config file
+    :param int jobs: The number of wikis to process at a time
+    """
+    if jobs <= 1 or len(wikidirs) <= 1:
+        for wikidir in wikidirs:
+            # contain any wiki-specific modifications
+            process(wikidir, preferences.copy())
+        return
+
+    queue = ConsoleQueue()
+    pool = ThreadPool(min(jobs, len(wikidirs)))
+    try:
+        summaries = pool.map(
+            lambda wikidir: _run_wiki_task(
+                process, queue, wikidir, preferences.copy()
+            ),
+            wikidirs,
+        )
+    finally:
+        pool.close()
+        pool.join()
+    _report_summaries(summaries)
+    for summary in summaries:
+        if summary.error is not None:
+            raise summary.error
+
+
 # TODO: support version
 # TODO: help text for jump and other flags
 @click.command(
@@ -317,7 +713,25 @@ def process_wiki(wikidir, preferences):
 )
 @click.argument("wikipath", required=False)
 @click.option("-j", "--jump", is_flag=True, help="Jump to present day.")
-def main(wikipath=None, jump=False):
+@click.option(
+    "-c",
+    "--catch-up",
+    is_flag=True,
+    help="Advance a day at a time up to the present day, without prompting.",
+)
+@click.option(
+    "-r",
+    "--rollback",
+    is_flag=True,
+    help="Undo the last advance.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of wikis to process at a time.",
+)
+def main(wikipath=None, jump=False, catch_up=False, rollback=False, jobs=1):
     # could try: [Display score for today]
 
     preferences = config.read_user_preferences(CONFIG_FILE)
@@ -328,6 +742,11 @@ def main(wikipath=None, jump=False):
     else:
         wikidirs = preferences["wikis"]
 
+    if jump + catch_up + rollback > 1:
+        raise click.UsageError(
+            "Can only do one of jump, catch up, or roll back at a time!"
+        )
+
     if jump:
         preferences['jump'] = jump
         display_message()
@@ -335,11 +754,13 @@ def main(wikipath=None, jump=False):
         display_message()
         ask_input()
 
-    for wikidir in wikidirs:
-        process_wiki(
-            wikidir,
-            preferences.copy(),  # contain any wiki-specific modifications
-        )
+    if catch_up:
+        process = catch_up_wiki
+    elif rollback:
+        process = rollback_wiki
+    else:
+        process = process_wiki
+    process_wikis(process, wikidirs, preferences, jobs)
 
 
 if __name__ == "__main__":
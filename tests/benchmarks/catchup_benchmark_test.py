@@ -0,0 +1,159 @@
+import datetime
+import os
+import timeit
+
+from mock import patch
+
+from composer import config, whatsnext
+from composer.backend import FilesystemPlanner, FilesystemTasklist
+from composer.backend.filesystem.base import (
+    PLANNERDAYFILELINK,
+    PLANNERDAYTHEMESFILE,
+    PLANNERPLACEMENTFILE,
+    PLANNERTASKLISTFILE,
+)
+from composer.backend.filesystem.primitives import (
+    WriteBatch,
+    get_log_filename,
+    make_file,
+)
+from composer.backend.filesystem.templates import get_template
+from composer.timeperiod import Day, Week, Month, Quarter, Year
+
+START_DATE = datetime.date(2012, 12, 5)
+NUMBER_OF_DAYS = 14
+
+TASKLIST = (
+    "TOMORROW:\n"
+    "[ ] a task for tomorrow\n"
+    "THIS WEEK:\n"
+    "[ ] a task for this week\n"
+    "[o] a scheduled task [$DECEMBER 28, 2012$]\n"
+    "THIS MONTH:\n"
+    "[o] another scheduled task [$JANUARY 15, 2013$]\n"
+    "THIS QUARTER:\n"
+    "THIS YEAR:\n"
+    "SOMEDAY:\n"
+    "[ ] a task for someday\n"
+)
+DAYTHEMES = (
+    "SUNDAY: Groceries Day\n"
+    "MONDAY: Cleanup Day\n"
+    "TUESDAY: Financial Review Day\n"
+    "WEDNESDAY: Wellness Day\n"
+    "THURSDAY: Laundry Day\n"
+    "FRIDAY: Wellness Day\n"
+    "SATURDAY: Errands Day\n"
+)
+PLANNER_FILES = {
+    'checkpoints_weekday_file': "Checkpoints_Weekday_Standard.wiki",
+    'checkpoints_weekend_file': "Checkpoints_Weekend_Standard.wiki",
+    'checkpoints_week_file': "Checkpoints_Week.wiki",
+    'checkpoints_month_file': "Checkpoints_Month.wiki",
+    'checkpoints_quarter_file': "Checkpoints_Quarter.wiki",
+    'checkpoints_year_file': "Checkpoints_Year.wiki",
+    'periodic_day_file': "Periodic_Daily_Standard.wiki",
+    'periodic_week_file': "Periodic_Weekly.wiki",
+    'periodic_month_file': "Periodic_Monthly.wiki",
+    'periodic_quarter_file': "Periodic_Quarterly.wiki",
+    'periodic_year_file': "Periodic_Yearly.wiki",
+}
+PREFERENCES = {
+    'agenda_reviewed': Year,
+    'week_theme': '',
+    'logfile_completion_checking': config.LOGFILE_CHECKING['LAX'],
+}
+
+
+def _write(directory, filename, contents):
+    with open(os.path.join(directory, filename), "w") as f:
+        f.write(contents)
+
+
+def _make_wiki(directory):
+    """A wiki as of the start date, with logs created from templates."""
+    directory = str(directory)
+    os.makedirs(directory)
+    _write(directory, PLANNERTASKLISTFILE, TASKLIST)
+    _write(directory, PLANNERDAYTHEMESFILE, DAYTHEMES)
+    planner = FilesystemPlanner()
+    planner.tasklist = FilesystemTasklist()
+    planner.tasklist.file = make_file(TASKLIST)
+    planner.daythemesfile = make_file(DAYTHEMES)
+    for attr, filename in PLANNER_FILES.items():
+        contents = "[ ] {}\n".format(attr)
+        _write(directory, filename, contents)
+        setattr(planner, attr, make_file(contents))
+    for period in (Day, Week, Month, Quarter, Year):
+        setattr(planner, planner._logfile_attribute(period), make_file(""))
+        contents = get_template(planner, period, START_DATE).build()
+        filename = get_log_filename(period.get_start_date(START_DATE), period)
+        _write(directory, filename, contents)
+    os.symlink(
+        get_log_filename(START_DATE, Day),
+        os.path.join(directory, PLANNERDAYFILELINK),
+    )
+    return directory
+
+
+def _contents(directory):
+    contents = {}
+    for filename in os.listdir(directory):
+        if filename == PLANNERPLACEMENTFILE:
+            # the reference date recorded may differ, to no effect
+            continue
+        with open(os.path.join(directory, filename)) as f:
+            contents[filename] = f.read()
+    contents[PLANNERDAYFILELINK] = os.readlink(
+        os.path.join(directory, PLANNERDAYFILELINK)
+    )
+    return contents
+
+
+def _advance_day_by_day(wikidir):
+    for _ in range(NUMBER_OF_DAYS):
+        whatsnext.process_wiki(wikidir, dict(PREFERENCES))
+
+
+def _catch_up(wikidir):
+    tasklist = FilesystemTasklist(wikidir)
+    planner = FilesystemPlanner(wikidir, tasklist, dict(PREFERENCES))
+    to_date = START_DATE + datetime.timedelta(days=NUMBER_OF_DAYS)
+    with WriteBatch(wikidir) as batch:
+        planner, _, needs_input = whatsnext._catch_up(
+            planner, batch, config.CATCH_UP_POLICY['ACCEPT'], to_date
+        )
+    assert needs_input is None
+    assert planner.date == to_date
+
+
+@patch('composer.whatsnext._post_advance_tasks')
+@patch('composer.snapshots.GitSnapshots.checkpoint')
+class TestCatchUp(object):
+    def test_same_results_as_advancing_day_by_day(
+        self, mock_commit, mock_post_advance, tmp_path
+    ):
+        day_by_day = _make_wiki(tmp_path / "day_by_day")
+        caught_up = _make_wiki(tmp_path / "caught_up")
+        _advance_day_by_day(day_by_day)
+        _catch_up(caught_up)
+        assert _contents(caught_up) == _contents(day_by_day)
+        assert len(os.listdir(caught_up)) > len(PLANNER_FILES) + 5
+
+    def test_faster_than_advancing_day_by_day(
+        self, mock_commit, mock_post_advance, tmp_path
+    ):
+        runs = iter(range(100))
+
+        def new_wiki():
+            return _make_wiki(tmp_path / str(next(runs)))
+
+        def day_by_day():
+            _advance_day_by_day(new_wiki())
+
+        def caught_up():
+            _catch_up(new_wiki())
+
+        separately = min(timeit.repeat(day_by_day, number=1, repeat=3))
+        together = min(timeit.repeat(caught_up, number=1, repeat=3))
+        assert together < separately, (together, separately)
@@ -0,0 +1,50 @@
+import timeit
+
+from composer.backend.filesystem.primitives.entries import get_entries
+from composer.backend.filesystem.primitives.files import make_file
+
+SIZES = (100, 1000, 10000, 100000)
+
+
+def _entry(i):
+    if i % 3 == 0:
+        return (
+            "[ ] task number {i}\n"
+            "\t[x] first thing\n"
+            "\t[ ] second thing\n".format(i=i)
+        )
+    elif i % 3 == 1:
+        return "[o] scheduled task {i} [$MARCH 3, 2025$]\n".format(i=i)
+    return "\n"
+
+
+def _contents(number_of_entries):
+    return "".join(_entry(i) for i in range(number_of_entries))
+
+
+def _time_per_entry(number_of_entries):
+    contents = _contents(number_of_entries)
+    repeat = max(1, 10000 // number_of_entries)
+    timings = timeit.repeat(
+        lambda: get_entries(make_file(contents)), number=repeat, repeat=3
+    )
+    return min(timings) / (repeat * number_of_entries)
+
+
+class TestGetEntriesScaling(object):
+    def test_entries_are_preserved_at_all_sizes(self):
+        for size in SIZES:
+            contents = _contents(size)
+            entries = get_entries(make_file(contents))
+            assert len(entries) == size
+            assert "".join(entries) == contents
+
+    def test_growth_is_linear(self):
+        """The cost per entry should stay (roughly) flat from 100 to 100k
+        entries. A quadratic parser would be ~1000x slower per entry at the
+        top end than at the bottom.
+        """
+        per_entry = [_time_per_entry(size) for size in SIZES]
+        baseline = min(per_entry)
+        for size, cost in zip(SIZES, per_entry):
+            assert cost < 5 * baseline, (size, cost, baseline)
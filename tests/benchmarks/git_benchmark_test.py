@@ -0,0 +1,105 @@
+import os
+import subprocess
+import timeit
+
+import pytest
+
+from composer.snapshots import (
+    END_OF_DAY,
+    START_OF_DAY,
+    GitSnapshots,
+    JournalSnapshots,
+)
+
+NUMBER_OF_FILES = 5000
+
+
+def _has_git():
+    try:
+        subprocess.check_output(["git", "--version"])
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def _git(wikidir, *args):
+    return subprocess.check_output(("git",) + args, cwd=wikidir).decode()
+
+
+def _write(path, contents):
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+@pytest.fixture
+def wikidir(tmp_path):
+    """A wiki with many years' worth of logs committed into git."""
+    wikidir = str(tmp_path)
+    for i in range(NUMBER_OF_FILES):
+        _write(os.path.join(wikidir, "log {}.wiki".format(i)), str(i))
+    _git(wikidir, "init", "-q")
+    _git(wikidir, "config", "user.name", "test")
+    _git(wikidir, "config", "user.email", "test@example.com")
+    _git(wikidir, "add", "-A")
+    _git(wikidir, "commit", "-q", "-m", "initial")
+    return wikidir
+
+
+def _advance(wikidir, n):
+    """Make changes like those of an advance, returning the files touched."""
+    paths = [
+        os.path.join(wikidir, "log {}.wiki".format(i)) for i in range(3)
+    ]
+    paths.append(os.path.join(wikidir, "new log {}.wiki".format(n)))
+    for path in paths:
+        _write(path, "advanced {}".format(n))
+    return paths
+
+
+@pytest.mark.skipif(not _has_git(), reason="git is not available")
+class TestGitCommit(object):
+    def test_as_quick_as_committing_everything(
+        self, wikidir, record_property
+    ):
+        runs = iter(range(100))
+
+        def everything():
+            _advance(wikidir, next(runs))
+            GitSnapshots(wikidir).checkpoint(START_OF_DAY, "today")
+
+        def targeted():
+            paths = _advance(wikidir, next(runs))
+            GitSnapshots(wikidir, all_changes=False).checkpoint(
+                START_OF_DAY, "today", paths
+            )
+
+        full = min(timeit.repeat(everything, number=1, repeat=5))
+        only_touched = min(timeit.repeat(targeted, number=1, repeat=5))
+        record_property("git_add_all", full)
+        record_property("git_add_paths", only_touched)
+        # git keeps a cache of the state of each file, so that even in a
+        # large wiki, finding the changes to commit is quick. Staging only
+        # the files touched should be no slower, but needn't be faster
+        assert only_touched < full * 2, (only_touched, full)
+
+    def test_journal_is_faster_than_git(self, wikidir):
+        runs = iter(range(100))
+
+        def snapshot(snapshots):
+            paths = _advance(wikidir, next(runs))
+            snapshots.checkpoint(END_OF_DAY, "today", paths)
+            snapshots.checkpoint(START_OF_DAY, "tomorrow", paths)
+
+        git = min(
+            timeit.repeat(
+                lambda: snapshot(GitSnapshots(wikidir)), number=1, repeat=5
+            )
+        )
+        journal = min(
+            timeit.repeat(
+                lambda: snapshot(JournalSnapshots(wikidir)),
+                number=1,
+                repeat=5,
+            )
+        )
+        assert journal * 10 < git, (journal, git)
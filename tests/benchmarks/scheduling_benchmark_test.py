@@ -0,0 +1,101 @@
+import datetime
+import timeit
+
+from composer.backend.filesystem.date_parsers import (
+    DATE_FORMATS,
+    match_date_format,
+)
+from composer.backend.filesystem.scheduling import string_to_date
+
+REFERENCE_DATE = datetime.date(2025, 2, 12)
+
+# one example of each of the supported date formats
+DATE_STRINGS = (
+    "MARCH 3, 2025",
+    "3 MARCH, 2025",
+    "MARCH 3",
+    "3 MARCH",
+    "WEEK OF MARCH 3, 2025",
+    "WEEK OF 3 MARCH, 2025",
+    "WEEK OF MARCH 3",
+    "WEEK OF 3 MARCH",
+    "MARCH 2025",
+    "MARCH",
+    "03/03/2025",
+    "03-03-2025",
+    "TOMORROW",
+    "NEXT WEEK",
+    "NEXT MONTH",
+    "MONDAY",
+    "MON",
+    "Q2 2025",
+    "NEXT YEAR",
+    "2025",
+    "THIS WEEKEND",
+    "NEXT WEEKEND",
+    "NEXT QUARTER",
+    "Q3",
+    "DAY AFTER TOMORROW",
+    "SOMEDAY",
+    "WEEK AFTER NEXT",
+    "SECOND WEEK OF APRIL",
+)
+
+
+def _sequential_string_to_date(datestr, reference_date=None):
+    """Parse a date string by trying each format in turn."""
+    for pattern, parse in DATE_FORMATS:
+        if pattern.search(datestr):
+            return parse(datestr, reference_date)
+
+
+def _outcome(fn, datestr):
+    try:
+        return fn(datestr, REFERENCE_DATE)
+    except Exception as e:
+        return type(e)
+
+
+def _identify_sequentially(datestr):
+    """Identify the format of a date string by trying each in turn."""
+    for pattern, parse in DATE_FORMATS:
+        if pattern.search(datestr):
+            return parse
+
+
+def _time(fn, date_strings):
+    def identify_all():
+        for datestr in date_strings:
+            fn(datestr)
+
+    return min(timeit.repeat(identify_all, number=500, repeat=5))
+
+
+class TestStringToDate(object):
+    def test_all_formats_are_covered(self):
+        matched = set()
+        for datestr in DATE_STRINGS:
+            for index, (pattern, _) in enumerate(DATE_FORMATS):
+                if pattern.search(datestr):
+                    matched.add(index)
+                    break
+        assert len(matched) == len(DATE_FORMATS)
+
+    def test_same_results_as_trying_each_format(self):
+        for datestr in DATE_STRINGS:
+            for variant in (datestr, datestr.title(), datestr + "\n"):
+                expected = _outcome(_sequential_string_to_date, variant)
+                assert _outcome(string_to_date, variant) == expected
+
+    def test_identifies_the_same_formats(self):
+        for datestr in DATE_STRINGS:
+            parse, _ = match_date_format(datestr)
+            assert parse is _identify_sequentially(datestr)
+
+    def test_faster_than_trying_each_format(self):
+        """Identifying the format with a single lookup or match should be
+        faster than trying each pattern in turn.
+        """
+        sequential = _time(_identify_sequentially, DATE_STRINGS)
+        combined = _time(match_date_format, DATE_STRINGS)
+        assert combined < sequential, (combined, sequential)
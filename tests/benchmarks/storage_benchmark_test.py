@@ -0,0 +1,43 @@
+import time
+
+from mock import patch
+
+from composer.backend.filesystem.primitives import storage
+from composer.backend.filesystem.primitives.storage import read_files
+
+NUMBER_OF_FILES = 18
+# simulated round trip to (e.g. network-mounted) storage for each read
+READ_LATENCY = 0.01
+
+
+def _slow_read_file(path):
+    time.sleep(READ_LATENCY)
+    with open(path, "r") as f:
+        return f.read()
+
+
+def _write_files(directory):
+    paths = []
+    for n in range(NUMBER_OF_FILES):
+        path = directory / "file{}.wiki".format(n)
+        path.write_text(u"AGENDA:\n[ ] task {}\n".format(n))
+        paths.append(str(path))
+    return paths
+
+
+def _wall_clock_time(paths, workers):
+    start = time.time()
+    contents = read_files(paths, workers)
+    return time.time() - start, contents
+
+
+class TestReadFiles(object):
+    @patch.object(storage, 'read_file', _slow_read_file)
+    def test_faster_than_reading_in_turn_on_slow_storage(self, tmp_path):
+        paths = _write_files(tmp_path)
+        sequential, expected = _wall_clock_time(paths, 1)
+        concurrent, contents = _wall_clock_time(paths, 8)
+        assert contents == expected
+        # reads overlap, so a handful of round trips rather than one per file
+        assert sequential >= NUMBER_OF_FILES * READ_LATENCY
+        assert concurrent < sequential / 2, (concurrent, sequential)
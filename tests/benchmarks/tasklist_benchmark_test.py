@@ -0,0 +1,94 @@
+import datetime
+import timeit
+from collections import defaultdict
+
+from composer.backend.filesystem.base import FilesystemTasklist
+from composer.backend.filesystem.primitives import (
+    add_to_section,
+    entries_to_string,
+    make_file,
+)
+from composer.backend.filesystem.scheduling import get_due_date
+from composer.timeperiod import get_time_periods, Day
+
+from ..unit.fixtures import _tasklistfile
+
+REFERENCE_DATE = datetime.date(2013, 2, 14)
+NUMBER_OF_TASKS = 3000
+
+
+def _scheduled_tasks(how_many):
+    tasks = []
+    for n in range(how_many):
+        due_date = REFERENCE_DATE + datetime.timedelta(days=(n * 37) % 900)
+        datestr = "{month} {day}, {year}".format(
+            month=due_date.strftime("%B").upper(),
+            day=due_date.day,
+            year=due_date.year,
+        )
+        if n % 50 == 0:
+            datestr = "SOMEDAY"
+        tasks.append("[o] task number {} [${}$]\n".format(n, datestr))
+    return tasks
+
+
+def _tasklist():
+    tasklist = FilesystemTasklist()
+    tasklist.location = ''
+    tasklist.file = _tasklistfile()
+    return tasklist
+
+
+def _place_tasks_sequentially(tasklist_file, scheduled_tasks, reference_date):
+    """Place tasks by checking each against each period in turn, and adding
+    them to the tasklist one section at a time.
+    """
+    scheduled_tasks = sorted(
+        scheduled_tasks,
+        key=lambda entry: get_due_date(entry, reference_date)[0],
+    )
+    tasks = defaultdict(list)
+    for entry in scheduled_tasks:
+        due_date, _ = get_due_date(entry, reference_date)
+        for period in get_time_periods(Day):
+            if due_date <= period.get_end_date(reference_date):
+                tasks[period].append(entry)
+                break
+    for period in get_time_periods(Day):
+        tasklist_file = add_to_section(
+            tasklist_file,
+            FilesystemTasklist.section_name[period],
+            entries_to_string(tasks[period]),
+            above=False,
+        )
+    return tasklist_file
+
+
+class TestPlaceTasks(object):
+    def test_same_results_as_placing_sequentially(self):
+        scheduled_tasks = _scheduled_tasks(NUMBER_OF_TASKS)
+        expected = _place_tasks_sequentially(
+            make_file(_tasklistfile().getvalue()),
+            scheduled_tasks,
+            REFERENCE_DATE,
+        )
+        tasklist = _tasklist()
+        tasklist.place_tasks(scheduled_tasks, REFERENCE_DATE)
+        assert tasklist.file.getvalue() == expected.getvalue()
+
+    def test_faster_than_placing_sequentially(self):
+        scheduled_tasks = _scheduled_tasks(NUMBER_OF_TASKS)
+
+        def place_sequentially():
+            _place_tasks_sequentially(
+                make_file(_tasklistfile().getvalue()),
+                scheduled_tasks,
+                REFERENCE_DATE,
+            )
+
+        def place():
+            _tasklist().place_tasks(scheduled_tasks, REFERENCE_DATE)
+
+        sequential = min(timeit.repeat(place_sequentially, number=1, repeat=3))
+        indexed = min(timeit.repeat(place, number=1, repeat=3))
+        assert indexed < sequential, (indexed, sequential)
@@ -0,0 +1,61 @@
+import os
+import time
+
+import pytest
+
+from composer.updateindex import update_index
+
+NUMBER_OF_PAGES = 20000
+REPEATS = 3
+
+
+def _write(path, contents):
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+@pytest.fixture(scope="module")
+def wikidir(tmp_path_factory):
+    """A wiki with many years' worth of pages."""
+    wikidir = str(tmp_path_factory.mktemp("wiki"))
+    for i in range(NUMBER_OF_PAGES):
+        _write(os.path.join(wikidir, "page {}.wiki".format(i)), str(i))
+    update_index(wikidir, full=True)
+    return wikidir
+
+
+def _advance(wikidir, n):
+    """Make changes like those of an advance: a couple of new logs, and
+    changes to existing pages.
+    """
+    for name in ("new day {}", "new week {}"):
+        _write(os.path.join(wikidir, name.format(n) + ".wiki"), str(n))
+    _write(os.path.join(wikidir, "page 0.wiki"), "advanced {}".format(n))
+
+
+def _update_time(wikidir, full):
+    """The quickest of several updates to the index, each following an
+    advance.
+    """
+    times = []
+    for _ in range(REPEATS):
+        _advance(wikidir, len(os.listdir(wikidir)))
+        start = time.time()
+        update_index(wikidir, full=full)
+        times.append(time.time() - start)
+    return min(times)
+
+
+class TestUpdateIndex(object):
+    def test_incremental_quicker_than_full(self, wikidir):
+        full = _update_time(wikidir, True)
+        incremental = _update_time(wikidir, False)
+        assert incremental < full, (incremental, full)
+
+    def test_unchanged_indexes_are_not_written(self, wikidir):
+        update_index(wikidir)
+        _write(os.path.join(wikidir, "page 0.wiki"), "edited")
+        written = update_index(wikidir)
+        assert [os.path.basename(filename) for filename in written] == [
+            "Pages_By date modified.wiki"
+        ]
@@ -307,9 +307,9 @@ class PlannerIntegrationTest(unittest.TestCase):
         self.planner.location = ''
         self.planner.next_day_planner = FilesystemPlanner()
         self.planner.agenda_reviewed = Year
-        mock_get_log = MagicMock()
-        mock_get_log.return_value = True
-        self.planner.get_log = mock_get_log
+        mock_has_log = MagicMock()
+        mock_has_log.return_value = True
+        self.planner.has_log = mock_has_log
 
 
 class PlannerAdvanceTester(PlannerIntegrationTest):
@@ -751,7 +751,7 @@ class PlannerAdvanceTester(PlannerIntegrationTest):
         mock_read_file.return_value = StringIO('')
         next_day = datetime.date(2013, 8, 20)
         daytemplate = self._day_template(next_day)
-        self.planner.get_log.return_value = False
+        self.planner.has_log.return_value = False
         self.planner.date = today
         self.planner.jump_to_date = next_day
         self.planner.logfile_completion_checking = config.LOGFILE_CHECKING[
@@ -4,9 +4,13 @@ import pytest
 from datetime import timedelta
 
 from composer.backend.filesystem.primitives.files import make_file
+from composer.backend.filesystem.primitives.storage import DirectoryListing
 from composer.config import LOGFILE_CHECKING
 from composer.errors import LogfileAlreadyExistsError, LogfileLayoutError
-from composer.backend.filesystem.base import PLANNERTASKLISTFILE
+from composer.backend.filesystem.base import (
+    FilesystemPlanner,
+    PLANNERTASKLISTFILE,
+)
 from composer.timeperiod import Zero, Day, Month, Week, Quarter, Year, Eternity
 from composer.timeperiod.interface import TIME_PERIODS
 
@@ -18,7 +22,7 @@ class TestFilesystemBase(object):
     def note_filename(self):
         self.filenames = []
 
-        def make_note(contents, filename):
+        def make_note(contents, filename, batch=None):
             name_index = filename.rfind('/')
             name = filename[name_index + 1 :]
             self.filenames.append(name)
@@ -172,6 +176,154 @@ class TestOkToAdvance(TestPlanner):
             planner.is_ok_to_advance()
 
 
+class TestFork(TestPlanner):
+    def test_shares_files(self, planner):
+        forked = planner.fork()
+        assert forked._dayfile is planner._dayfile
+        assert forked._checkpoints_week_file is planner._checkpoints_week_file
+
+    def test_reassigned_files_diverge(self, planner):
+        original = planner.dayfile.getvalue()
+        forked = planner.fork()
+        forked.dayfile = make_file("AGENDA:\n[ ] something new\n")
+        assert planner.dayfile.getvalue() == original
+        assert forked._weekfile is planner._weekfile
+
+
+class TestHasLog(object):
+    def _planner(self, wikidir):
+        planner = FilesystemPlanner()
+        planner.date = datetime.date(2012, 12, 5)
+        planner.location = wikidir
+        planner._listing = DirectoryListing(wikidir)
+        return planner
+
+    def test_from_listing(self, tmp_path):
+        (tmp_path / "Week of December 9, 2012.wiki").write_text(u"")
+        planner = self._planner(str(tmp_path))
+        with patch(
+            'composer.backend.filesystem.base.get_log_for_date'
+        ) as mock_get_log:
+            assert planner.has_log(datetime.date(2012, 12, 12), Week)
+            assert not planner.has_log(datetime.date(2012, 12, 12), Day)
+            assert not planner.has_log(datetime.date(2013, 1, 12), Month)
+            assert not mock_get_log.called
+        assert planner._listing.listings == 1
+
+    def test_own_log(self, tmp_path):
+        planner = self._planner(str(tmp_path))
+        assert planner.has_log(datetime.date(2012, 12, 7), Week)
+        assert not planner.has_log(datetime.date(2012, 12, 7), Zero)
+
+    def test_not_ok_to_advance_if_log_exists(self, tmp_path):
+        (tmp_path / "December 5, 2012.wiki").write_text(u"")
+        planner = self._planner(str(tmp_path))
+        with pytest.raises(LogfileAlreadyExistsError):
+            planner.is_ok_to_advance(Day)
+
+
+def _full_file_path(filename, root, dereference=False):
+    return "{}/{}".format(root, filename)
+
+
+@patch('composer.backend.filesystem.base.full_file_path')
+@patch('composer.backend.filesystem.base.read_file')
+@patch('composer.backend.filesystem.base.string_to_date')
+class TestLazyLoading(TestPlanner):
+    def _planner(self, mock_get_date, mock_read_file, mock_file_path):
+        mock_get_date.return_value = (datetime.date(2012, 12, 5), Day)
+        mock_file_path.side_effect = _full_file_path
+        mock_read_file.side_effect = lambda path: make_file(
+            "AGENDA:\n[ ] {}\n".format(path)
+        )
+        return FilesystemPlanner('/path/to/wiki')
+
+    def test_construct_reads_no_files(
+        self, mock_get_date, mock_read_file, mock_file_path
+    ):
+        planner = self._planner(mock_get_date, mock_read_file, mock_file_path)
+        assert planner.date == datetime.date(2012, 12, 5)
+        assert planner.files_read == 0
+        assert mock_read_file.call_count == 0
+
+    def test_file_is_read_when_accessed(
+        self, mock_get_date, mock_read_file, mock_file_path
+    ):
+        planner = self._planner(mock_get_date, mock_read_file, mock_file_path)
+        dayfile = planner.dayfile.getvalue()
+        assert 'December 5, 2012' in dayfile
+        assert planner.files_read == 1
+
+    def test_file_is_read_only_once(
+        self, mock_get_date, mock_read_file, mock_file_path
+    ):
+        planner = self._planner(mock_get_date, mock_read_file, mock_file_path)
+        planner.dayfile
+        planner.get_agenda(Day)
+        planner.periodic_week_file
+        planner.periodic_week_file
+        assert planner.files_read == 2
+        assert mock_read_file.call_count == 2
+
+    def test_assigned_file_is_not_read(
+        self, mock_get_date, mock_read_file, mock_file_path
+    ):
+        planner = self._planner(mock_get_date, mock_read_file, mock_file_path)
+        planner.weekfile = make_file("AGENDA:\n")
+        assert planner.weekfile.getvalue() == "AGENDA:\n"
+        assert planner.files_read == 0
+
+    def test_forks_share_files_read(
+        self, mock_get_date, mock_read_file, mock_file_path
+    ):
+        planner = self._planner(mock_get_date, mock_read_file, mock_file_path)
+        forked = planner.fork()
+        forked.monthfile
+        planner.monthfile
+        assert planner.files_read == 1
+        assert forked.files_read == 1
+
+    @patch('composer.backend.filesystem.base.read_files')
+    def test_concurrent_reading_reads_all_files(
+        self, mock_read_files, mock_get_date, mock_read_file, mock_file_path
+    ):
+        mock_read_files.side_effect = lambda paths, workers: [
+            make_file("AGENDA:\n[ ] {}\n".format(path)) for path in paths
+        ]
+        mock_get_date.return_value = (datetime.date(2012, 12, 5), Day)
+        mock_file_path.side_effect = _full_file_path
+        planner = FilesystemPlanner(
+            '/path/to/wiki', preferences={'read_workers': '8'}
+        )
+        (paths, workers), _ = mock_read_files.call_args
+        assert workers == 8
+        assert planner.files_read == len(paths) == 17
+        assert 'December 5, 2012' in planner.dayfile.getvalue()
+        assert planner.files_read == 17
+        assert mock_read_file.call_count == 0
+
+    @patch('composer.backend.filesystem.base.os')
+    @patch('composer.backend.filesystem.base.write_file')
+    def test_save_skips_unchanged_logs(
+        self,
+        mock_write_file,
+        mock_os,
+        mock_get_date,
+        mock_read_file,
+        mock_file_path,
+    ):
+        planner = self._planner(mock_get_date, mock_read_file, mock_file_path)
+        mock_os.readlink.return_value = 'December 5, 2012.wiki'
+        planner.get_agenda(Day)
+        planner.get_agenda(Week)
+        planner.update_agenda(Week, "[ ] a new task\n")
+        written = planner.save(Year)
+        assert mock_write_file.call_count == 1
+        assert written == ['/path/to/wiki/Week of December 1, 2012.wiki']
+        # logs that were never read were not written either
+        assert planner.files_read == 2
+
+
 class TestPlannerSave(TestPlanner):
     @patch('composer.backend.filesystem.base.os')
     @patch('composer.backend.filesystem.base.write_file')
@@ -211,6 +363,18 @@ class TestPlannerSave(TestPlanner):
         # because os is mocked, this filename remains 'currentquarter'
         assert not any('Month' in filename for filename in self.filenames)
 
+    @patch('composer.backend.filesystem.base.os')
+    @patch('composer.backend.filesystem.base.write_file')
+    def test_stages_changes_in_batch(self, mock_write_file, mock_os, planner):
+        batch = MagicMock()
+        planner.save(Month, batch)
+        assert all(
+            call_args[0][2] is batch
+            for call_args in mock_write_file.call_args_list
+        )
+        assert batch.link.call_count == 1
+        assert mock_os.symlink.call_count == 0
+
 
 class TestTasklist(TestFilesystemBase):
     def _tasklist(self, task="", period=Day):
@@ -253,6 +417,28 @@ class TestTasklistSave(TestTasklist):
             PLANNERTASKLISTFILE in filename for filename in self.filenames
         )
 
+    @patch('composer.backend.filesystem.base.os')
+    @patch('composer.backend.filesystem.base.write_file')
+    def test_skips_unchanged_tasklist(
+        self, mock_write_file, mock_os, tasklist
+    ):
+        tasklist._saved_contents = tasklist.file.getvalue()
+        assert tasklist.save() == []
+        assert mock_write_file.call_count == 0
+        tasklist.file = make_file(tasklist.file.getvalue() + "[ ] new\n")
+        assert len(tasklist.save()) == 1
+        assert mock_write_file.call_count == 1
+
+    @patch('composer.backend.filesystem.base.os')
+    @patch('composer.backend.filesystem.base.write_file')
+    def test_saving_twice_writes_once(
+        self, mock_write_file, mock_os, tasklist
+    ):
+        tasklist.file = make_file(tasklist.file.getvalue() + "[ ] new\n")
+        assert len(tasklist.save()) == 1
+        assert tasklist.save() == []
+        assert mock_write_file.call_count == 1
+
 
 class TestTasklistPlaceTasks(TestTasklist):
     def test_tomorrow(self, tasklist):
@@ -0,0 +1,103 @@
+import datetime
+import os
+
+from mock import patch
+
+from composer.backend.filesystem.catalog import WikiCatalog
+from composer.backend.filesystem.primitives import parse_log_filename
+from composer.timeperiod import Day, Week, Month, Quarter, Year
+
+FILENAMES = (
+    "December 30, 2012.wiki",
+    "December 31, 2012.wiki",
+    "January 1, 2013.wiki",
+    "Week of December 30, 2012.wiki",
+    "Week of January 6, 2013.wiki",
+    "Month of December, 2012.wiki",
+    "Month of January, 2013.wiki",
+    "Q4 2012.wiki",
+    "Q1 2013.wiki",
+    "2012.wiki",
+    "2013.wiki",
+    "TaskList.wiki",
+    "Checkpoints_Week.wiki",
+)
+
+
+def _wiki(directory):
+    for filename in FILENAMES:
+        (directory / filename).write_text(u"")
+    # directories aren't logs, whatever they are named
+    os.mkdir(str(directory / "2014.wiki"))
+    return str(directory)
+
+
+class TestWikiCatalog(object):
+    def test_logs_for_each_period(self, tmp_path):
+        catalog = WikiCatalog(_wiki(tmp_path))
+        assert catalog.get_start_dates(Day) == [
+            datetime.date(2012, 12, 30),
+            datetime.date(2012, 12, 31),
+            datetime.date(2013, 1, 1),
+        ]
+        assert catalog.get_start_dates(Week) == [
+            datetime.date(2012, 12, 30),
+            datetime.date(2013, 1, 6),
+        ]
+        assert catalog.get_start_dates(Month) == [
+            datetime.date(2012, 12, 1),
+            datetime.date(2013, 1, 1),
+        ]
+        assert catalog.get_start_dates(Quarter) == [
+            datetime.date(2012, 10, 1),
+            datetime.date(2013, 1, 1),
+        ]
+        assert catalog.get_start_dates(Year) == [
+            datetime.date(2012, 1, 1),
+            datetime.date(2013, 1, 1),
+        ]
+
+    def test_range_query(self, tmp_path):
+        wikidir = _wiki(tmp_path)
+        catalog = WikiCatalog(wikidir)
+        paths = catalog.get_paths(
+            Day, datetime.date(2012, 12, 31), datetime.date(2013, 3, 31)
+        )
+        assert paths == [
+            (
+                datetime.date(2012, 12, 31),
+                os.path.join(wikidir, "December 31, 2012.wiki"),
+            ),
+            (
+                datetime.date(2013, 1, 1),
+                os.path.join(wikidir, "January 1, 2013.wiki"),
+            ),
+        ]
+        assert catalog.get_start_dates(
+            Week, end=datetime.date(2013, 1, 5)
+        ) == [datetime.date(2012, 12, 30)]
+
+    def test_has_log(self, tmp_path):
+        catalog = WikiCatalog(_wiki(tmp_path))
+        assert catalog.has_log(Month, datetime.date(2012, 12, 1))
+        assert not catalog.has_log(Month, datetime.date(2013, 2, 1))
+        assert not catalog.has_log(Year, datetime.date(2014, 1, 1))
+
+    def test_refreshed_incrementally(self, tmp_path):
+        catalog = WikiCatalog(_wiki(tmp_path))
+        catalog.refresh()
+        (tmp_path / "January 2, 2013.wiki").write_text(u"")
+        os.remove(str(tmp_path / "December 30, 2012.wiki"))
+        with patch(
+            'composer.backend.filesystem.catalog.parse_log_filename',
+            side_effect=parse_log_filename,
+        ) as mock_parse:
+            assert catalog.get_start_dates(Day) == [
+                datetime.date(2012, 12, 31),
+                datetime.date(2013, 1, 1),
+                datetime.date(2013, 1, 2),
+            ]
+            # only the files added or removed are identified
+            assert mock_parse.call_count == 2
+            catalog.get_start_dates(Day)
+            assert mock_parse.call_count == 2
@@ -1,47 +1,75 @@
-from datetime import date, timedelta
+from datetime import date
+
 from mock import patch
 
+from composer.backend.filesystem.catalog import WikiCatalog
 from composer.backend.filesystem.interface import get_constituent_logs
-from composer.timeperiod import Day, Week
+from composer.timeperiod import Day, Week, Month
 
-try:  # py3
-    FileNotFoundError
-except NameError:  # py2
-    FileNotFoundError = IOError
 
+def _write_logs(wikidir, filenames):
+    for filename in filenames:
+        (wikidir / filename).write_text(u"log for " + filename[:-5])
 
-class LogTimes(object):
 
-    times = 0
+class TestGetConstituentLogs(object):
+    def test_for_day_returns_empty(self, tmp_path):
+        _write_logs(tmp_path, ["October 16, 2012.wiki"])
+        logs = get_constituent_logs(Day, date(2012, 10, 16), str(tmp_path))
+        assert list(logs) == []
 
-    def __init__(self, n):
-        self.n = n
+    def test_for_in_progress_period(self, tmp_path):
+        _write_logs(tmp_path, ["October 14, 2012.wiki"])
+        logs = get_constituent_logs(Week, date(2012, 10, 16), str(tmp_path))
+        assert [log.contents.read() for log in logs] == [
+            "log for October 14, 2012"
+        ]
 
-    def __call__(self, *args, **kwargs):
-        if self.times < self.n:
-            self.times += 1
-            return str(self.times)
-        raise FileNotFoundError
+    def test_for_completed_period(self, tmp_path):
+        _write_logs(
+            tmp_path,
+            [
+                "October 13, 2012.wiki",
+                "October 21, 2012.wiki",
+                "Week of October 14, 2012.wiki",
+            ]
+            + ["October {}, 2012.wiki".format(day) for day in range(14, 21)],
+        )
+        logs = list(
+            get_constituent_logs(Week, date(2012, 10, 16), str(tmp_path))
+        )
+        assert [log.start_date for log in logs] == [
+            date(2012, 10, day) for day in range(14, 21)
+        ]
+        assert all(log.period == Day for log in logs)
 
+    def test_missing_logs_are_skipped(self, tmp_path):
+        _write_logs(
+            tmp_path,
+            [
+                "Week of September 30, 2012.wiki",
+                "Week of October 14, 2012.wiki",
+            ],
+        )
+        logs = list(
+            get_constituent_logs(Month, date(2012, 10, 16), str(tmp_path))
+        )
+        assert [(log.period, log.start_date) for log in logs] == [
+            (Week, date(2012, 10, 14))
+        ]
+        assert logs[0].contents.read() == "log for Week of October 14, 2012"
 
-class TestGetConstituentLogs(object):
-    @patch('composer.backend.filesystem.interface.get_log_for_date')
-    def test_for_day_returns_empty(self, mock_get_log):
-        mock_get_log.side_effect = LogTimes(1)
-        for_date = date.today() - timedelta(days=15)
-        logs = get_constituent_logs(Day, for_date, '/path/to/root')
-        assert logs == []
-
-    @patch('composer.backend.filesystem.interface.get_log_for_date')
-    def test_for_in_progress_period(self, mock_get_log):
-        mock_get_log.side_effect = LogTimes(1)
-        for_date = date.today() - timedelta(days=15)
-        logs = get_constituent_logs(Week, for_date, '/path/to/root')
-        assert logs == ['1']
-
-    @patch('composer.backend.filesystem.interface.get_log_for_date')
-    def test_for_completed_period(self, mock_get_log):
-        mock_get_log.side_effect = LogTimes(10)
-        for_date = date(2012, 10, 16)
-        logs = get_constituent_logs(Week, for_date, '/path/to/root')
-        assert logs == [str(i) for i in range(1, 8)]
+    def test_logs_are_read_only_when_consumed(self, tmp_path):
+        _write_logs(
+            tmp_path,
+            ["October {}, 2012.wiki".format(day) for day in range(14, 21)],
+        )
+        catalog = WikiCatalog(str(tmp_path))
+        with patch(
+            'composer.backend.filesystem.interface.read_file'
+        ) as mock_read:
+            logs = get_constituent_logs(
+                Week, date(2012, 10, 16), str(tmp_path), catalog
+            )
+            next(logs).contents
+            assert mock_read.call_count == 1
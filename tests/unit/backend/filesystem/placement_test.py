@@ -0,0 +1,210 @@
+import datetime
+import random
+
+from mock import patch
+
+from composer.backend.filesystem.base import FilesystemTasklist
+from composer.backend.filesystem.placement import (
+    advance_placement,
+    placement_from_string,
+    placement_to_string,
+    record_placement,
+)
+from composer.backend.filesystem.primitives import parse_document
+
+START_DATE = datetime.date(2013, 2, 14)
+
+SECTIONS = (
+    "TOMORROW",
+    "THIS WEEK",
+    "THIS MONTH",
+    "THIS QUARTER",
+    "THIS YEAR",
+    "SOMEDAY",
+)
+
+
+def _scheduled_task(rng, n, from_date):
+    if rng.random() < 0.05:
+        datestr = "SOMEDAY"
+    else:
+        due_date = from_date + datetime.timedelta(days=rng.randrange(700))
+        datestr = "{month} {day}, {year}".format(
+            month=due_date.strftime("%B").upper(),
+            day=due_date.day,
+            year=due_date.year,
+        )
+    task = "[o] task {n} [${datestr}$]\n".format(n=n, datestr=datestr)
+    if rng.random() < 0.2:
+        task += "\t[ ] a subtask\n"
+    return task
+
+
+def _tasklist_contents(rng, tasks_per_section):
+    contents = ""
+    n = 0
+    for section in SECTIONS:
+        contents += section + ":\n"
+        for _ in range(tasks_per_section):
+            roll = rng.random()
+            if roll < 0.6:
+                contents += _scheduled_task(rng, n, START_DATE)
+            elif roll < 0.9:
+                contents += "[ ] unscheduled task {n}\n".format(n=n)
+            else:
+                contents += "\n"
+            n += 1
+        if rng.random() < 0.7:
+            contents += "\n"
+    return contents
+
+
+def _tasklist(contents):
+    tasklist = FilesystemTasklist()
+    tasklist.location = ''
+    tasklist.file = contents
+    return tasklist
+
+
+def _advance_fully(tasklist, to_date):
+    # forget the previous placement so that every task is re-placed
+    tasklist._placement = None
+    tasklist.advance(to_date)
+
+
+class TestAdvancePlacement(object):
+    def test_same_as_placing_all_tasks(self):
+        for seed in range(3):
+            rng = random.Random(seed)
+            contents = _tasklist_contents(rng, 20)
+            incremental, full = _tasklist(contents), _tasklist(contents)
+            to_date = START_DATE
+            for day in range(400):
+                to_date += datetime.timedelta(days=1)
+                if day % 23 == 0:
+                    # new tasks are scheduled from time to time
+                    new_tasks = [
+                        _scheduled_task(rng, 1000 + day + i, to_date)
+                        for i in range(3)
+                    ]
+                    incremental.place_tasks(new_tasks, to_date)
+                    full.place_tasks(new_tasks, to_date)
+                incremental.advance(to_date)
+                _advance_fully(full, to_date)
+                assert incremental.file.getvalue() == full.file.getvalue()
+
+    def test_untouched_when_nothing_is_due_to_move(self):
+        tasklist = _tasklist(
+            "TOMORROW:\n"
+            "THIS WEEK:\n"
+            "THIS MONTH:\n"
+            "THIS QUARTER:\n"
+            "THIS YEAR:\n"
+            "[o] a task [$DECEMBER 3, 2013$]\n"
+            "SOMEDAY:\n"
+            "[o] another task [$SOMEDAY$]\n"
+        )
+        tasklist.advance(START_DATE)
+        document = tasklist._file
+        tasklist.advance(START_DATE + datetime.timedelta(days=1))
+        assert tasklist._file is document
+
+    def test_relative_dates_are_not_tracked(self):
+        document = parse_document(
+            "TOMORROW:\n"
+            "THIS WEEK:\n"
+            "[o] a task [$NEXT WEEK$]\n"
+            "THIS MONTH:\n"
+            "THIS QUARTER:\n"
+            "THIS YEAR:\n"
+            "SOMEDAY:\n"
+        )
+        placement = record_placement(
+            document, FilesystemTasklist.section_name, START_DATE
+        )
+        assert placement is None
+
+    def test_earlier_date_is_not_advanced(self):
+        document = parse_document(
+            "TOMORROW:\n"
+            "THIS WEEK:\n"
+            "THIS MONTH:\n"
+            "THIS QUARTER:\n"
+            "THIS YEAR:\n"
+            "SOMEDAY:\n"
+        )
+        placement = record_placement(
+            document, FilesystemTasklist.section_name, START_DATE
+        )
+        result = advance_placement(
+            document,
+            placement,
+            FilesystemTasklist.section_name,
+            START_DATE - datetime.timedelta(days=1),
+        )
+        assert result is None
+
+
+class TestSavedPlacement(object):
+    def _wiki(self, tmp_path, contents):
+        (tmp_path / "TaskList.wiki").write_text(contents)
+        return str(tmp_path)
+
+    def test_round_trip(self):
+        rng = random.Random(0)
+        document = parse_document(_tasklist_contents(rng, 20))
+        tasklist = _tasklist(document.render())
+        tasklist.advance(START_DATE)
+        placement = tasklist._placement
+        assert placement_from_string(placement_to_string(placement)) == (
+            placement
+        )
+        assert placement_from_string("not a placement") is None
+
+    def test_fresh_load_advances_incrementally(self, tmp_path):
+        rng = random.Random(1)
+        wikidir = self._wiki(tmp_path, _tasklist_contents(rng, 20))
+        full = FilesystemTasklist(wikidir)
+        tasklist = FilesystemTasklist(wikidir)
+        tasklist.advance(START_DATE)
+        tasklist.save()
+        to_date = START_DATE
+        full.advance(START_DATE)
+        for _ in range(60):
+            to_date += datetime.timedelta(days=1)
+            # each day's advance reads the tasklist afresh, as whatsnext does
+            tasklist = FilesystemTasklist(wikidir)
+            assert tasklist._placement is not None
+            with patch.object(
+                FilesystemTasklist,
+                'place_tasks',
+                side_effect=AssertionError("re-placed every task"),
+            ):
+                tasklist.advance(to_date)
+            tasklist.save()
+            _advance_fully(full, to_date)
+            assert tasklist.file.getvalue() == full.file.getvalue()
+
+    def test_edited_sections_are_re_placed(self, tmp_path):
+        wikidir = self._wiki(
+            tmp_path,
+            "TOMORROW:\n"
+            "THIS WEEK:\n"
+            "THIS MONTH:\n"
+            "THIS QUARTER:\n"
+            "THIS YEAR:\n"
+            "[o] a task [$DECEMBER 3, 2013$]\n"
+            "SOMEDAY:\n",
+        )
+        tasklist = FilesystemTasklist(wikidir)
+        tasklist.advance(START_DATE)
+        tasklist.save()
+        # a task added by hand to the wrong section
+        with open(tmp_path / "TaskList.wiki", "a") as f:
+            f.write("[o] soon [$FEBRUARY 15, 2013$]\n")
+        tasklist = FilesystemTasklist(wikidir)
+        tasklist.advance(START_DATE + datetime.timedelta(days=1))
+        expected = _tasklist((tmp_path / "TaskList.wiki").read_text())
+        _advance_fully(expected, START_DATE + datetime.timedelta(days=1))
+        assert tasklist.file.getvalue() == expected.file.getvalue()
+        assert "TOMORROW:\n[o] soon" in tasklist.file.getvalue()
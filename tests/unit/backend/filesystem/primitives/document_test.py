@@ -0,0 +1,207 @@
+import pytest
+
+from composer.backend.filesystem.primitives.document import (
+    LogDocument,
+    parse_document,
+)
+from composer.backend.filesystem.primitives.entries import (
+    add_to_section,
+    entries_to_string,
+    get_entries,
+    partition_entries,
+    read_section,
+)
+from composer.backend.filesystem.primitives.files import make_file
+from composer.backend.filesystem.primitives.parsing import (
+    is_scheduled_task,
+    is_task,
+)
+
+from ....fixtures import logfile, tasklist_file  # noqa
+
+SECTIONS = (
+    'TOMORROW',
+    'THIS WEEK',
+    'THIS MONTH',
+    'THIS QUARTER',
+    'THIS YEAR',
+    'SOMEDAY',
+)
+
+IRREGULAR_CONTENTS = (
+    "",
+    "\n",
+    "no sections at all\n",
+    "AGENDA:",
+    "AGENDA:\n",
+    "AGENDA:\n\n\n",
+    "preamble\n\tcontinued\nAGENDA:\n\t[ ] subtask only\n\nNOTES:\nend",
+    "AGENDA:\n[ ] one\n\nAGENDA:\n[ ] duplicate\n",
+    "A\rB:\nAGENDA:\n[ ] with\x0ccontrol characters\n",
+)
+
+
+class TestParse(object):
+    def test_round_trip(self, logfile, tasklist_file):
+        for file in (logfile, tasklist_file):
+            contents = file.getvalue()
+            assert LogDocument.parse(contents).render() == contents
+
+    def test_round_trip_irregular(self):
+        for contents in IRREGULAR_CONTENTS:
+            assert LogDocument.parse(contents).render() == contents
+
+    def test_parse_document_accepts_files(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        assert document.render() == tasklist_file.getvalue()
+
+    def test_parse_document_passes_documents_through(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        assert parse_document(document) is document
+
+
+class TestReadSection(object):
+    def test_matches_file_version(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        for section in SECTIONS:
+            contents, _ = read_section(tasklist_file, section)
+            assert document.read_section(section) == contents.read()
+
+    def test_agenda(self, logfile):
+        document = parse_document(logfile)
+        contents, _ = read_section(logfile, 'agenda')
+        assert document.read_section('agenda') == contents.read()
+        assert entries_to_string(document.section_entries('agenda')) == (
+            contents.getvalue()
+        )
+
+    def test_section_missing(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        with pytest.raises(ValueError):
+            document.read_section('THIS DECADE')
+        assert not document.has_section('THIS DECADE')
+
+
+class TestReplaceSection(object):
+    def test_empty_contents_matches_complement(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        for section in SECTIONS:
+            _, complement = read_section(tasklist_file, section)
+            updated = document.replace_section(section, "")
+            assert updated.render() == complement.read()
+
+    def test_original_is_unchanged(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        document.replace_section('THIS WEEK', "")
+        assert document.render() == tasklist_file.getvalue()
+
+    def test_unmodified_sections_are_shared(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        updated = document.replace_section('THIS WEEK', "")
+        assert updated.get_section('SOMEDAY') is document.get_section(
+            'SOMEDAY'
+        )
+
+
+class TestAddToSection(object):
+    new_tasks = "[ ] one more thing to do!\n"
+
+    @pytest.mark.parametrize('above', [True, False])
+    @pytest.mark.parametrize('ensure_separator', [True, False])
+    def test_matches_file_version(
+        self, tasklist_file, above, ensure_separator
+    ):
+        document = parse_document(tasklist_file)
+        for section in SECTIONS:
+            expected = add_to_section(
+                tasklist_file,
+                section,
+                self.new_tasks,
+                above=above,
+                ensure_separator=ensure_separator,
+            )
+            updated = document.add_to_section(
+                section,
+                self.new_tasks,
+                above=above,
+                ensure_separator=ensure_separator,
+            )
+            assert updated.render() == expected.read()
+
+    def test_matches_file_version_for_logfile(self, logfile):
+        document = parse_document(logfile)
+        expected = add_to_section(
+            logfile, 'agenda', self.new_tasks, above=False,
+            ensure_separator=True
+        )
+        updated = document.add_to_section(
+            'agenda', self.new_tasks, above=False, ensure_separator=True
+        )
+        assert updated.render() == expected.read()
+
+    def test_irregular_contents(self):
+        additions = ("\n", self.new_tasks, "no newline", "NOTES:\n")
+        for contents in IRREGULAR_CONTENTS:
+            file = make_file(contents)
+            document = parse_document(contents)
+            if not document.has_section('agenda'):
+                continue
+            for tasks in additions:
+                for above in (True, False):
+                    expected = add_to_section(
+                        file, 'agenda', tasks, above=above,
+                        ensure_separator=True
+                    )
+                    updated = document.add_to_section(
+                        'agenda', tasks, above=above, ensure_separator=True
+                    )
+                    assert updated.render() == expected.read()
+                    # the result should be indistinguishable from a freshly
+                    # parsed document
+                    reparsed = LogDocument.parse(updated.render())
+                    assert updated.get_entries() == reparsed.get_entries()
+
+    def test_add_to_several_sections(self, tasklist_file):
+        expected = tasklist_file
+        for section in SECTIONS:
+            expected = add_to_section(
+                expected, section, self.new_tasks, above=False
+            )
+        updated = parse_document(tasklist_file).add_to_sections(
+            {section: self.new_tasks for section in SECTIONS}, above=False
+        )
+        assert updated.render() == expected.read()
+
+    def test_section_missing(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        with pytest.raises(ValueError):
+            document.add_to_section('THIS DECADE', self.new_tasks)
+
+
+class TestEntries(object):
+    def test_get_entries(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        expected = get_entries(tasklist_file, is_task)
+        assert document.get_entries(is_task) == expected
+
+    def test_partition_entries(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        expected, expected_rest = partition_entries(
+            get_entries(tasklist_file), is_scheduled_task
+        )
+        scheduled, rest = document.partition_entries(is_scheduled_task)
+        assert scheduled == expected
+        assert rest.render() == "".join(expected_rest)
+
+    def test_map_entries(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        updated = document.map_entries(
+            lambda entry: entry.text.replace("[ ]", "[x]")
+        )
+        assert updated.render() == tasklist_file.getvalue().replace(
+            "[ ]", "[x]"
+        )
+
+    def test_map_entries_unchanged(self, tasklist_file):
+        document = parse_document(tasklist_file)
+        assert document.map_entries(lambda entry: entry) is document
@@ -1,8 +1,16 @@
+import datetime
+import os
 import pytest
 import re
 
+from mock import patch
+
+from composer.config import DURABILITY
+from composer.timeperiod import Day, Week, Month, Quarter, Year
+
 from composer.backend.filesystem.primitives.entries import (
     add_to_section,
+    entries_to_string,
     read_section,
     partition_entries,
     get_entries,
@@ -10,10 +18,29 @@ from composer.backend.filesystem.primitives.entries import (
 )
 from composer.backend.filesystem.primitives.files import (
     make_file,
+    copy_file,
+    contain_file_mutation,
     partition_at,
     append_files,
+    read_files,
+)
+from composer.backend.filesystem.primitives.storage import (
+    DirectoryListing,
+    WriteBatch,
+    file_fingerprint,
+    get_log_filename,
+    parse_log_filename,
 )
 from composer.backend.filesystem.primitives.parsing import (
+    Entry,
+    BLANK,
+    DONE,
+    INVALID,
+    NON_TASK,
+    SCHEDULED,
+    TASK,
+    UNDONE,
+    WIP,
     is_done_task,
     is_undone_task,
     is_completed,
@@ -95,6 +122,65 @@ class TestReadEntry(object):
         assert complement.read() == empty_logfile.read()
 
 
+class TestLogicalFile(object):
+    contents = "AGENDA:\n[ ] a task\n\tsubtask\n\nNOTES:\nno newline"
+
+    def test_reads_like_a_file(self):
+        file = make_file(self.contents)
+        assert file.readline() == "AGENDA:\n"
+        assert file.read(3) == "[ ]"
+        assert file.readlines() == [
+            " a task\n",
+            "\tsubtask\n",
+            "\n",
+            "NOTES:\n",
+            "no newline",
+        ]
+        assert file.readline() == ""
+        assert file.read() == ""
+        assert file.getvalue() == self.contents
+
+    def test_iteration(self):
+        file = make_file(self.contents)
+        assert "".join(file) == self.contents
+
+    def test_write(self):
+        file = make_file()
+        file.write("AGENDA:\n")
+        file.write("[ ] a task\n")
+        assert file.read() == ""
+        file.seek(0)
+        assert file.read() == "AGENDA:\n[ ] a task\n"
+
+    def test_overwrite(self):
+        file = make_file("AGENDA:\n")
+        file.write("NOTES")
+        assert file.getvalue() == "NOTESA:\n"
+        assert file.read() == "A:\n"
+
+    def test_copy_shares_contents(self):
+        file = make_file(self.contents)
+        copy = copy_file(file)
+        assert copy.getvalue() is file.getvalue()
+
+    def test_copy_is_unaffected_by_writes(self):
+        file = make_file(self.contents)
+        copy = copy_file(file)
+        file.write("NOTES:\n")
+        assert copy.read() == self.contents
+
+    def test_mutation_is_contained(self):
+        file = make_file(self.contents)
+        file.readline()
+
+        @contain_file_mutation
+        def read_all(file):
+            return file.read()
+
+        assert read_all(file) == self.contents
+        assert file.read() == self.contents[len("AGENDA:\n"):]
+
+
 class TestPartitionAt(object):
     def test_first_part(self, logfile):
         pattern = re.compile(r"^Just")
@@ -206,6 +292,192 @@ class TestAppendFiles(object):
         assert second.read() == ""
 
 
+class TestReadFiles(object):
+    def _write_files(self, directory, how_many):
+        paths = []
+        for n in range(how_many):
+            path = directory / "file{}.wiki".format(n)
+            path.write_text(u"contents of file {}".format(n))
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_contents_in_order(self, tmp_path, workers):
+        paths = self._write_files(tmp_path, 10)
+        result = read_files(paths, workers)
+        assert [f.read() for f in result] == [
+            "contents of file {}".format(n) for n in range(10)
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_first_missing_file_is_reported(self, tmp_path, workers):
+        paths = self._write_files(tmp_path, 10)
+        paths[3] = str(tmp_path / "missing.wiki")
+        paths[7] = str(tmp_path / "also missing.wiki")
+        with pytest.raises(IOError) as excinfo:
+            read_files(paths, workers)
+        assert excinfo.value.filename == paths[3]
+
+
+class TestFileFingerprint(object):
+    def test_changes_with_contents(self, tmp_path):
+        path = tmp_path / "file.wiki"
+        path.write_text(u"contents")
+        fingerprint = file_fingerprint(str(path))
+        assert file_fingerprint(str(path)) == fingerprint
+        path.write_text(u"new contents")
+        assert file_fingerprint(str(path)) != fingerprint
+
+    def test_missing_file(self, tmp_path):
+        assert file_fingerprint(str(tmp_path / "missing.wiki")) is None
+
+
+class TestParseLogFilename(object):
+    def test_reverses_get_log_filename(self):
+        for_date = datetime.date(2013, 2, 28)
+        for period in (Day, Week, Month, Quarter, Year):
+            start_date = period.get_start_date(for_date)
+            filename = get_log_filename(start_date, period)
+            assert parse_log_filename(filename) == (period, start_date)
+
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "TaskList.wiki",
+            "Checkpoints_Week.wiki",
+            "December 05, 2012.wiki",
+            "February 30, 2013.wiki",
+            "Smarch 5, 2012.wiki",
+            "Q5 2012.wiki",
+            "2012.txt",
+        ],
+    )
+    def test_not_a_log(self, filename):
+        assert parse_log_filename(filename) is None
+
+
+class TestDirectoryListing(object):
+    def test_listed_once(self, tmp_path):
+        (tmp_path / "today.wiki").write_text(u"today")
+        listing = DirectoryListing(str(tmp_path))
+        assert "today.wiki" in listing
+        assert "tomorrow.wiki" not in listing
+        assert listing.listings == 1
+
+    def test_relisted_when_directory_changes(self, tmp_path):
+        listing = DirectoryListing(str(tmp_path))
+        assert "tomorrow.wiki" not in listing
+        (tmp_path / "tomorrow.wiki").write_text(u"tomorrow")
+        assert "tomorrow.wiki" in listing
+        os.remove(str(tmp_path / "tomorrow.wiki"))
+        assert "tomorrow.wiki" not in listing
+
+
+class TestWriteBatch(object):
+    def _wiki(self, directory):
+        (directory / "today.wiki").write_text(u"today")
+        (directory / "tomorrow.wiki").write_text(u"")
+        os.symlink("today.wiki", str(directory / "currentday"))
+        return str(directory)
+
+    def test_nothing_written_until_committed(self, tmp_path):
+        wiki = self._wiki(tmp_path)
+        batch = WriteBatch(wiki)
+        batch.write("updated", os.path.join(wiki, "today.wiki"))
+        batch.link("tomorrow.wiki", os.path.join(wiki, "currentday"))
+        assert (tmp_path / "today.wiki").read_text() == "today"
+        assert os.readlink(str(tmp_path / "currentday")) == "today.wiki"
+        batch.commit()
+        assert (tmp_path / "today.wiki").read_text() == "updated"
+        assert os.readlink(str(tmp_path / "currentday")) == "tomorrow.wiki"
+        assert sorted(os.listdir(wiki)) == [
+            "currentday",
+            "today.wiki",
+            "tomorrow.wiki",
+        ]
+
+    def test_failure_leaves_files_as_they_were(self, tmp_path):
+        wiki = self._wiki(tmp_path)
+        with pytest.raises(ValueError):
+            with WriteBatch(wiki) as batch:
+                batch.write("updated", os.path.join(wiki, "today.wiki"))
+                batch.link("tomorrow.wiki", os.path.join(wiki, "currentday"))
+                raise ValueError
+        assert (tmp_path / "today.wiki").read_text() == "today"
+        assert os.readlink(str(tmp_path / "currentday")) == "today.wiki"
+        assert sorted(os.listdir(wiki)) == [
+            "currentday",
+            "today.wiki",
+            "tomorrow.wiki",
+        ]
+
+    @pytest.mark.parametrize(
+        "durability, expected_syncs",
+        [
+            (DURABILITY["NONE"], 0),
+            # each file, and then the directory once
+            (DURABILITY["BATCH"], 3),
+            # each file, and the directory after each change
+            (DURABILITY["STRICT"], 5),
+        ],
+    )
+    def test_durability(self, tmp_path, durability, expected_syncs):
+        wiki = self._wiki(tmp_path)
+        with patch(
+            'composer.backend.filesystem.primitives.storage.os.fsync'
+        ) as mock_fsync:
+            with WriteBatch(wiki, durability) as batch:
+                batch.write("updated", os.path.join(wiki, "today.wiki"))
+                batch.write("", os.path.join(wiki, "tomorrow.wiki"))
+                batch.link("tomorrow.wiki", os.path.join(wiki, "currentday"))
+        assert mock_fsync.call_count == expected_syncs
+        assert (tmp_path / "today.wiki").read_text() == "updated"
+
+    def test_permissions_are_kept(self, tmp_path):
+        wiki = self._wiki(tmp_path)
+        os.chmod(os.path.join(wiki, "today.wiki"), 0o640)
+        with WriteBatch(wiki) as batch:
+            batch.write("updated", os.path.join(wiki, "today.wiki"))
+        today = os.stat(os.path.join(wiki, "today.wiki")).st_mode
+        assert today & 0o7777 == 0o640
+
+    @pytest.mark.parametrize("umask", [0o022, 0o077])
+    def test_new_files_follow_umask(self, tmp_path, umask):
+        wiki = self._wiki(tmp_path)
+        original_umask = os.umask(umask)
+        try:
+            with WriteBatch(wiki) as batch:
+                batch.write("new", os.path.join(wiki, "new.wiki"))
+        finally:
+            os.umask(original_umask)
+        new = os.stat(os.path.join(wiki, "new.wiki")).st_mode
+        assert new & 0o7777 == 0o666 & ~umask
+
+    def test_failure_while_moving_removes_staged_files(self, tmp_path):
+        wiki = self._wiki(tmp_path)
+        rename = os.rename
+        renamed = []
+
+        def fail_after_first(source, destination):
+            if renamed:
+                raise OSError
+            rename(source, destination)
+            renamed.append(destination)
+
+        with patch(
+            'composer.backend.filesystem.primitives.storage.os.rename',
+            side_effect=fail_after_first,
+        ):
+            with pytest.raises(OSError):
+                with WriteBatch(wiki) as batch:
+                    batch.write("updated", os.path.join(wiki, "today.wiki"))
+                    batch.write("updated", os.path.join(wiki, "tomorrow.wiki"))
+        assert not [
+            filename for filename in os.listdir(wiki)
+            if filename.endswith(".tmp")
+        ]
+
+
 class TestReadSection(object):
     def test_read_section(self, tasklist_file):
         contents, _ = read_section(tasklist_file, 'THIS WEEK')
@@ -590,3 +862,66 @@ class TestIsUnfinished(object):
     def test_empty(self):
         entry = ""
         assert not is_unfinished(entry)
+
+
+class TestEntry(object):
+    def test_status(self):
+        cases = (
+            ("[x] do this\n", DONE),
+            ("[-] do this\n", INVALID),
+            ("[o] do this [$TOMORROW$]\n", SCHEDULED),
+            ("[ ] do this\n", UNDONE),
+            ("[\\] do this\n", WIP),
+            ("[?] do this\n", TASK),
+            ("\n", BLANK),
+            ("do this\n", NON_TASK),
+            ("", NON_TASK),
+        )
+        for text, status in cases:
+            assert Entry(text).status == status
+
+    def test_predicates_agree_with_strings(self):
+        texts = (
+            "[x] do this\n",
+            "[-] do this\n",
+            "[o] do this [$TOMORROW$]\n",
+            "[ ] do this\n",
+            "[\\] do this\n",
+            "\n",
+            "do this\n",
+        )
+        predicates = (
+            is_done_task,
+            is_undone_task,
+            is_completed,
+            is_unfinished,
+        )
+        for text in texts:
+            for predicate in predicates:
+                assert predicate(Entry(text)) == predicate(text)
+
+    def test_header_and_contents(self):
+        entry = Entry("[ ] do this\n\t[x] a subtask\n")
+        assert entry.header == "[ ] do this\n"
+        assert entry.contents == "\t[x] a subtask\n"
+
+    def test_renders_original_text(self):
+        text = "[ ] do this\n\t[x] a subtask"
+        entry = Entry(text)
+        assert entry.text == text
+        assert entry == text
+        assert entries_to_string([entry, Entry("\n")]) == text + "\n"
+
+    def test_due_date_is_parsed_once(self):
+        entry = Entry("[o] do this [$TOMORROW$]\n")
+        calls = []
+
+        def parse(header, reference_date):
+            calls.append(header)
+            return reference_date
+
+        assert entry.get_due_date(1, parse) == 1
+        assert entry.get_due_date(1, parse) == 1
+        assert len(calls) == 1
+        assert entry.get_due_date(2, parse) == 2
+        assert len(calls) == 2
@@ -5,11 +5,15 @@ import pytest
 from mock import patch
 
 from composer.backend import FilesystemPlanner, FilesystemTasklist
+from composer.backend.filesystem.primitives import Entry
 from composer.backend.filesystem.scheduling import (
+    DateCache,
+    date_cache,
     standardize_entry_date,
     get_due_date,
     string_to_date,
     is_task_due,
+    is_standard_date_string,
     date_to_string,
 )
 from composer.timeperiod import Day, Week, Month, Quarter, Year, Eternity
@@ -64,6 +68,53 @@ class TestStandardizeEntryDate(object):
         assert standard == expected
 
 
+class TestIsStandardDateString(object):
+    @pytest.mark.parametrize("period", [Day, Week, Month, Quarter, Year])
+    def test_standard_dates(self, period):
+        current_date = datetime.date(2011, 1, 1)
+        while current_date < datetime.date(2014, 1, 1):
+            date = period.get_start_date(current_date)
+            datestr = date_to_string(date, period)
+            assert is_standard_date_string(datestr)
+            assert date_to_string(*string_to_date(datestr)) == datestr
+            current_date += datetime.timedelta(days=1)
+
+    def test_someday(self):
+        assert is_standard_date_string("SOMEDAY")
+
+    @pytest.mark.parametrize(
+        "datestr",
+        [
+            "MARCH 03, 2025",
+            "March 3, 2025",
+            "3 MARCH, 2025",
+            "MARCH 3 2025",
+            "FEBRUARY 30, 2025",
+            "WEEK OF MARCH 3, 2025",
+            "Q5 2025",
+            "0999",
+            "SOMEDAY\n",
+            "NEXT WEEK",
+        ],
+    )
+    def test_nonstandard_dates(self, datestr):
+        assert not is_standard_date_string(datestr)
+
+    def test_standard_entry_is_not_parsed(self):
+        entry = Entry("[o] do this [$WEEK OF DECEMBER 9, 2012$]\n")
+        with patch(
+            "composer.backend.filesystem.scheduling.string_to_date"
+        ) as mock_get_date:
+            standard = standardize_entry_date(entry)
+        assert standard is entry
+        assert not mock_get_date.called
+
+    def test_unbracketed_standard_date_is_standardized(self):
+        entry = "[o] do this [DECEMBER 12, 2012]"
+        expected = "[o] do this [$DECEMBER 12, 2012$]"
+        assert standardize_entry_date(entry) == expected
+
+
 class TestStringToDate(object):
     def test_format1(self):
         date_string = "OCTOBER 12, 2013"
@@ -519,6 +570,66 @@ class TestDueDate(object):
         result, _ = get_due_date(task)
         assert result == expected
 
+    def test_entry_is_parsed_once(self):
+        task = Entry("[o] something [$OCTOBER 12, 2013$]\n")
+        today = datetime.date(2013, 10, 10)
+        with patch(
+            "composer.backend.filesystem.scheduling.string_to_date"
+        ) as mock_string_to_date:
+            mock_string_to_date.return_value = (
+                datetime.date(2013, 10, 12),
+                Day,
+            )
+            first = get_due_date(task, today)
+            second = get_due_date(task, today)
+        assert first == second
+        assert mock_string_to_date.call_count == 1
+
+
+class TestDateCache(object):
+    def setup_method(self):
+        date_cache.clear()
+
+    def teardown_method(self):
+        date_cache.clear()
+
+    def test_absolute_date_is_shared_across_reference_dates(self):
+        first = string_to_date("MARCH 3, 2025", datetime.date(2025, 1, 1))
+        second = string_to_date("MARCH 3, 2025", datetime.date(2025, 2, 1))
+        assert first == second
+        assert date_cache.hits == 1
+        assert date_cache.misses == 1
+
+    def test_relative_date_is_keyed_by_reference_date(self):
+        first = string_to_date("TOMORROW", datetime.date(2025, 1, 1))
+        again = string_to_date("TOMORROW", datetime.date(2025, 1, 1))
+        second = string_to_date("TOMORROW", datetime.date(2025, 2, 1))
+        assert first == again
+        assert first[0] == datetime.date(2025, 1, 2)
+        assert second[0] == datetime.date(2025, 2, 2)
+        assert date_cache.hits == 1
+        assert date_cache.misses == 2
+
+    def test_clear(self):
+        string_to_date("2025")
+        string_to_date("2025")
+        date_cache.clear()
+        info = date_cache.info()
+        assert info.hits == 0
+        assert info.misses == 0
+        assert info.currsize == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = DateCache(maxsize=2)
+        cache.put("2024", None, 1, relative=False)
+        cache.put("2025", None, 2, relative=False)
+        cache.get("2024")
+        cache.put("2026", None, 3, relative=False)
+        assert cache.get("2024") == 1
+        with pytest.raises(KeyError):
+            cache.get("2025")
+        assert cache.info().currsize == 2
+
 
 class TestIsTaskDue(object):
     def test_due_date_in_past(self):
@@ -1,8 +1,13 @@
 import datetime
 import pytest
 
+from composer.backend.base import PlannerAdvance
 from composer.config import LOGFILE_CHECKING
-from composer.errors import AgendaNotReviewedError, PlannerIsInTheFutureError
+from composer.errors import (
+    AgendaNotReviewedError,
+    LogfileNotCompletedError,
+    PlannerIsInTheFutureError,
+)
 from composer.timeperiod import Zero, Day, Week, Month, Quarter, Year
 
 from mock import MagicMock, patch
@@ -85,6 +90,26 @@ class TestAdvance(object):
             planner_base.advance()
 
 
+class TestFork(object):
+    def test_shares_state(self, planner_base):
+        planner_base.week_theme = "revival"
+        forked = planner_base.fork()
+        assert forked is not planner_base
+        assert forked.date == planner_base.date
+        assert forked.week_theme == planner_base.week_theme
+        assert forked.tasklist is planner_base.tasklist
+
+    def test_reassigned_state_diverges(self, planner_base):
+        forked = planner_base.fork()
+        forked.date = planner_base.date + datetime.timedelta(days=1)
+        assert forked.date != planner_base.date
+
+    def test_does_not_carry_next_day_planner(self, planner_base):
+        planner_base.next_day_planner = planner_base.fork()
+        forked = planner_base.fork()
+        assert forked.next_day_planner is None
+
+
 class TestAdvancePeriod(object):
     def _set_up_advance(self, mock_next_period, planner, n=1):
         current_day = datetime.date(2013, 1, 1)
@@ -95,9 +120,9 @@ class TestAdvancePeriod(object):
         mock_next_day = MagicMock()
         mock_next_day.return_value = next_day
         planner.next_day = mock_next_day
-        mock_get_log = MagicMock()
-        mock_get_log.return_value = True
-        planner.get_log = mock_get_log
+        mock_has_log = MagicMock()
+        mock_has_log.return_value = True
+        planner.has_log = mock_has_log
         next_period = (
             Week.__class__()
         )  # patching the singleton directly has global effect
@@ -143,9 +168,9 @@ class TestAdvancePeriod(object):
         planner.date = current_day
         planner.week_theme = ''
         planner.agenda_reviewed = Year
-        mock_get_log = MagicMock()
-        mock_get_log.return_value = True
-        planner.get_log = mock_get_log
+        mock_has_log = MagicMock()
+        mock_has_log.return_value = True
+        planner.has_log = mock_has_log
         planner.begin_period = MagicMock()
         planner.end_period = MagicMock()
         planner.continue_period = MagicMock()
@@ -301,7 +326,7 @@ class TestAdvancePeriod(object):
         current_day = datetime.date(2012, 11, 13)
         self._set_up_advance_decision(planner_base, current_day)
         planner_base.jump_to_date = datetime.date(2012, 11, 17)
-        planner_base.get_log.return_value = True
+        planner_base.has_log.return_value = True
         status = planner_base.advance_period()
         assert status == Day
 
@@ -309,7 +334,7 @@ class TestAdvancePeriod(object):
         current_day = datetime.date(2012, 11, 13)
         self._set_up_advance_decision(planner_base, current_day)
         planner_base.jump_to_date = datetime.date(2012, 11, 19)
-        planner_base.get_log = ReturnTimes(1, False, True)
+        planner_base.has_log = ReturnTimes(1, False, True)
         status = planner_base.advance_period()
         assert status == Week
 
@@ -317,7 +342,7 @@ class TestAdvancePeriod(object):
         current_day = datetime.date(2012, 11, 13)
         self._set_up_advance_decision(planner_base, current_day)
         planner_base.jump_to_date = datetime.date(2012, 12, 19)
-        planner_base.get_log = ReturnTimes(2, False, True)
+        planner_base.has_log = ReturnTimes(2, False, True)
         status = planner_base.advance_period()
         assert status == Month
 
@@ -325,7 +350,7 @@ class TestAdvancePeriod(object):
         current_day = datetime.date(2012, 9, 13)
         self._set_up_advance_decision(planner_base, current_day)
         planner_base.jump_to_date = datetime.date(2012, 10, 19)
-        planner_base.get_log = ReturnTimes(3, False, True)
+        planner_base.has_log = ReturnTimes(3, False, True)
         status = planner_base.advance_period()
         assert status == Quarter
 
@@ -333,7 +358,7 @@ class TestAdvancePeriod(object):
         current_day = datetime.date(2012, 9, 13)
         self._set_up_advance_decision(planner_base, current_day)
         planner_base.jump_to_date = datetime.date(2013, 10, 19)
-        planner_base.get_log = ReturnTimes(4, False, True)
+        planner_base.has_log = ReturnTimes(4, False, True)
         status = planner_base.advance_period()
         assert status == Year
 
@@ -449,3 +474,72 @@ class TestJumpDate(object):
         jump_to_date = planner.date
         planner.set_jump_date(jump_to_date)
         assert planner.jump_to_date is None
+
+
+class TestPlannerAdvance(object):
+    def _set_up_advance(self, planner):
+        planner.date = datetime.date(2012, 12, 5)
+        planner.week_theme = ''
+        planner.agenda_reviewed = Zero
+        mock_has_log = MagicMock()
+        mock_has_log.return_value = True
+        planner.has_log = mock_has_log
+        planner.end_period = MagicMock()
+        planner.begin_period = MagicMock()
+        planner.continue_period = MagicMock()
+        return PlannerAdvance(planner, Zero, datetime.date(2012, 12, 6))
+
+    def test_completes_without_input(self, planner_base):
+        advance = self._set_up_advance(planner_base)
+        assert advance.run() is None
+        assert advance.status == Day
+
+    def test_needs_input(self, planner_base):
+        advance = self._set_up_advance(planner_base)
+        error = AgendaNotReviewedError("Not reviewed!", period=Day, agenda="")
+        planner_base.begin_period.side_effect = error
+        assert advance.run() is error
+        assert advance.status is None
+
+    def test_resume_retries_only_the_step_needing_input(self, planner_base):
+        advance = self._set_up_advance(planner_base)
+
+        def begin_period(period, for_day):
+            if advance.planner.agenda_reviewed < period:
+                raise AgendaNotReviewedError(
+                    "Not reviewed!", period=period, agenda=""
+                )
+
+        planner_base.begin_period.side_effect = begin_period
+        assert isinstance(advance.run(), AgendaNotReviewedError)
+        assert advance.resume({'agenda_reviewed': Day}) is None
+        assert advance.status == Day
+        assert planner_base.end_period.call_count == 1
+        assert planner_base.begin_period.call_count == 2
+        assert planner_base.continue_period.call_count == 1
+
+    def test_resume_discards_changes_from_step_needing_input(
+        self, planner_base
+    ):
+        advance = self._set_up_advance(planner_base)
+        themes_seen = []
+
+        def end_period(period):
+            themes_seen.append(advance.planner.week_theme)
+            advance.planner.week_theme = 'partially ended'
+            if (
+                advance.planner.logfile_completion_checking
+                == LOGFILE_CHECKING['STRICT']
+            ):
+                raise LogfileNotCompletedError("Not completed!", period)
+
+        planner_base.end_period.side_effect = end_period
+        assert isinstance(advance.run(), LogfileNotCompletedError)
+        # the same step may need input more than once
+        assert isinstance(advance.resume({}), LogfileNotCompletedError)
+        preferences = {'logfile_completion_checking': LOGFILE_CHECKING['LAX']}
+        assert advance.resume(preferences) is None
+        assert advance.status == Day
+        # each attempt starts from the state before the first
+        assert themes_seen == ['', '', '']
+        assert advance.planner.week_theme == 'partially ended'
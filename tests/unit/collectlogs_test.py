@@ -2,8 +2,9 @@ import unittest
 
 from datetime import date, timedelta
 
+from composer.backend.filesystem.interface import LogRecord
 from composer.collectlogs import extract_log_time_from_text, get_logs_times
-from composer.timeperiod import Week
+from composer.timeperiod import Day, Week
 
 from mock import patch, MagicMock
 
@@ -69,7 +70,26 @@ class TestGetLogsTimes(object):
         planner.date = date.today() - timedelta(days=15)
         mock_planner.return_value = planner
         mock_extract_log.return_value = ('notes', 10)
-        mock_get_logs.return_value = [MagicMock(), MagicMock()]
-        (logs, times) = get_logs_times('/path/to/wiki', Week)
+        mock_get_logs.return_value = [
+            LogRecord(Day, planner.date, '/path/to/log'),
+            LogRecord(Day, planner.date, '/path/to/log'),
+        ]
+        with patch('composer.backend.filesystem.interface.read_file'):
+            (logs, times) = get_logs_times('/path/to/wiki', Week)
         assert 'notes' in logs
         assert 10 in times
+
+    @patch('composer.collectlogs.FilesystemPlanner')
+    def test_logs_labeled_despite_missing_logs(self, mock_planner, tmp_path):
+        for filename in ("April 1, 2015.wiki", "April 3, 2015.wiki"):
+            (tmp_path / filename).write_text(
+                u"NOTES:\nnotes for {}\nTIME: 10 mins\n".format(filename)
+            )
+        (logs, times) = get_logs_times(
+            str(tmp_path), Week, reference_date=date(2015, 4, 1)
+        )
+        assert logs == (
+            "April 1, 2015.wiki\nnotes for April 1, 2015.wiki\n\n"
+            "April 3, 2015.wiki\nnotes for April 3, 2015.wiki\n\n"
+        )
+        assert times == ['10 mins', '10 mins']
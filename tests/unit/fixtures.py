@@ -167,6 +167,9 @@ def _planner_base():
         def get_log(self, for_day, period):
             pass
 
+        def has_log(self, for_day, period):
+            pass
+
         def get_agenda(self, period, complete=None):
             pass
 
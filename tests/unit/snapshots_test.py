@@ -0,0 +1,250 @@
+import os
+import subprocess
+
+import pytest
+
+from composer.errors import SnapshotError
+from composer.snapshots import (
+    END_OF_DAY,
+    JOURNAL_FILENAME,
+    START_OF_DAY,
+    GitSnapshots,
+    JournalSnapshots,
+)
+
+
+def _write(path, contents):
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.fixture
+def wikidir(tmp_path):
+    wikidir = str(tmp_path)
+    _write(os.path.join(wikidir, "TaskList.wiki"), "tasks")
+    _write(os.path.join(wikidir, "December 5, 2012.wiki"), "today")
+    _write(os.path.join(wikidir, "Notes.wiki"), "notes")
+    os.symlink("December 5, 2012.wiki", os.path.join(wikidir, "currentday"))
+    return wikidir
+
+
+def _has_git():
+    try:
+        subprocess.check_output(["git", "--version"])
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def _git(wikidir, *args):
+    return subprocess.check_output(("git",) + args, cwd=wikidir).decode()
+
+
+@pytest.fixture
+def gitwiki(wikidir):
+    _git(wikidir, "init", "-q")
+    _git(wikidir, "config", "user.name", "test")
+    _git(wikidir, "config", "user.email", "test@example.com")
+    _git(wikidir, "add", "-A")
+    _git(wikidir, "commit", "-q", "-m", "initial")
+    return wikidir
+
+
+def _advance(wikidir, snapshots=None):
+    """Make the changes that an advance would, returning the paths of the
+    files that change.
+    """
+    paths = [
+        os.path.join(wikidir, filename)
+        for filename in (
+            "TaskList.wiki",
+            "December 5, 2012.wiki",
+            "December 6, 2012.wiki",
+            "currentday",
+        )
+    ]
+    snapshots = snapshots or JournalSnapshots(wikidir)
+    snapshots.checkpoint(END_OF_DAY, "December 5, 2012", paths)
+    _write(paths[0], "advanced tasks")
+    _write(paths[1], "today, done")
+    _write(paths[2], "tomorrow")
+    os.remove(paths[3])
+    os.symlink("December 6, 2012.wiki", paths[3])
+    snapshots.checkpoint(START_OF_DAY, "December 6, 2012", paths)
+    return paths
+
+
+class TestJournalSnapshots(object):
+    def test_rollback_restores_state_before_advance(self, wikidir):
+        _advance(wikidir)
+        _write(os.path.join(wikidir, "Notes.wiki"), "more notes")
+        restored = JournalSnapshots(wikidir).rollback()
+        assert restored == "EOD December 5, 2012"
+        assert _read(os.path.join(wikidir, "TaskList.wiki")) == "tasks"
+        assert _read(os.path.join(wikidir, "December 5, 2012.wiki")) == (
+            "today"
+        )
+        assert not os.path.exists(
+            os.path.join(wikidir, "December 6, 2012.wiki")
+        )
+        assert os.readlink(os.path.join(wikidir, "currentday")) == (
+            "December 5, 2012.wiki"
+        )
+        # files that weren't about to change are left alone
+        assert _read(os.path.join(wikidir, "Notes.wiki")) == "more notes"
+
+    def test_rollback_to_latest_end_of_day(self, wikidir):
+        _advance(wikidir)
+        _write(os.path.join(wikidir, "TaskList.wiki"), "tasks on the 6th")
+        snapshots = JournalSnapshots(wikidir)
+        snapshots.checkpoint(
+            END_OF_DAY,
+            "December 6, 2012",
+            [os.path.join(wikidir, "TaskList.wiki")],
+        )
+        _write(os.path.join(wikidir, "TaskList.wiki"), "tasks on the 7th")
+        assert snapshots.rollback() == "EOD December 6, 2012"
+        assert _read(os.path.join(wikidir, "TaskList.wiki")) == (
+            "tasks on the 6th"
+        )
+
+    def test_journal_holds_last_two_days(self, wikidir):
+        _advance(wikidir)
+        journal = os.path.join(wikidir, JOURNAL_FILENAME)
+        with open(journal, "rb") as f:
+            contents = f.read()
+        _advance(wikidir)
+        with open(journal, "rb") as f:
+            assert f.read().startswith(contents)
+        _advance(wikidir)
+        with open(journal, "rb") as f:
+            assert not f.read().startswith(contents)
+        records = JournalSnapshots(wikidir).records()
+        kinds = [record["kind"] for record in records]
+        assert kinds == [END_OF_DAY, START_OF_DAY, END_OF_DAY, START_OF_DAY]
+        assert JournalSnapshots(wikidir).rollback() == "EOD December 5, 2012"
+
+    def test_incomplete_record_is_ignored(self, wikidir):
+        _advance(wikidir)
+        journal = os.path.join(wikidir, JOURNAL_FILENAME)
+        with open(journal, "ab") as f:
+            f.write(b"\x00\x00\x01\x00partial")
+        assert len(JournalSnapshots(wikidir).records()) == 2
+
+    def test_incomplete_record_is_discarded(self, wikidir):
+        _advance(wikidir)
+        journal = os.path.join(wikidir, JOURNAL_FILENAME)
+        with open(journal, "ab") as f:
+            f.write(b"\x00\x00\x01\x00partial")
+        _advance(wikidir)
+        records = JournalSnapshots(wikidir).records()
+        kinds = [record["kind"] for record in records]
+        assert kinds == [END_OF_DAY, START_OF_DAY, END_OF_DAY, START_OF_DAY]
+
+    def test_nothing_to_roll_back_to(self, wikidir):
+        with pytest.raises(SnapshotError):
+            JournalSnapshots(wikidir).rollback()
+
+
+@pytest.mark.skipif(not _has_git(), reason="git is not available")
+class TestGitSnapshots(object):
+    def test_rollback_restores_state_before_advance(self, gitwiki):
+        snapshots = GitSnapshots(gitwiki, all_changes=False)
+        _advance(gitwiki, snapshots)
+        assert snapshots.rollback() == "EOD December 5, 2012"
+        assert _read(os.path.join(gitwiki, "TaskList.wiki")) == "tasks"
+        assert _read(os.path.join(gitwiki, "December 5, 2012.wiki")) == (
+            "today"
+        )
+        assert not os.path.exists(
+            os.path.join(gitwiki, "December 6, 2012.wiki")
+        )
+        assert os.readlink(os.path.join(gitwiki, "currentday")) == (
+            "December 5, 2012.wiki"
+        )
+        assert _git(gitwiki, "status", "--porcelain") == ""
+
+    def test_commits_only_the_given_paths(self, gitwiki):
+        _write(os.path.join(gitwiki, "Notes.wiki"), "more notes")
+        paths = [
+            os.path.join(gitwiki, "TaskList.wiki"),
+            os.path.join(gitwiki, "December 6, 2012.wiki"),
+        ]
+        for path in paths:
+            _write(path, "advanced")
+        missing = os.path.join(gitwiki, "Baton.wiki")
+        GitSnapshots(gitwiki, all_changes=False).checkpoint(
+            START_OF_DAY, "December 6, 2012", paths + [missing]
+        )
+        committed = _git(gitwiki, "show", "--name-only", "--format=", "HEAD")
+        assert sorted(committed.split("\n")[:-1]) == sorted(
+            os.path.basename(path) for path in paths
+        )
+        assert _git(gitwiki, "diff", "--name-only") == "Notes.wiki\n"
+
+    def test_rollback_of_entire_wiki(self, gitwiki):
+        snapshots = GitSnapshots(gitwiki)
+        snapshots.checkpoint(END_OF_DAY, "December 5, 2012")
+        _write(os.path.join(gitwiki, "Notes.wiki"), "more notes")
+        _write(os.path.join(gitwiki, "December 6, 2012.wiki"), "tomorrow")
+        snapshots.checkpoint(START_OF_DAY, "December 6, 2012")
+        assert snapshots.rollback() == "EOD December 5, 2012"
+        assert _read(os.path.join(gitwiki, "Notes.wiki")) == "notes"
+        assert not os.path.exists(
+            os.path.join(gitwiki, "December 6, 2012.wiki")
+        )
+        assert _git(gitwiki, "status", "--porcelain") == ""
+
+    def test_files_that_werent_to_change_are_left_alone(self, gitwiki):
+        snapshots = GitSnapshots(gitwiki)
+        _advance(gitwiki, snapshots)
+        _write(os.path.join(gitwiki, "Notes.wiki"), "more notes")
+        _git(gitwiki, "commit", "-q", "-a", "-m", "notes")
+        snapshots.rollback()
+        assert _read(os.path.join(gitwiki, "Notes.wiki")) == "more notes"
+        assert _read(os.path.join(gitwiki, "TaskList.wiki")) == "tasks"
+
+    def test_refuses_with_other_uncommitted_changes(self, gitwiki):
+        snapshots = GitSnapshots(gitwiki)
+        _advance(gitwiki, snapshots)
+        _write(os.path.join(gitwiki, "Notes.wiki"), "more notes")
+        with pytest.raises(SnapshotError):
+            snapshots.rollback()
+        assert _read(os.path.join(gitwiki, "TaskList.wiki")) == (
+            "advanced tasks"
+        )
+        assert _read(os.path.join(gitwiki, "Notes.wiki")) == "more notes"
+
+    def test_no_empty_commits(self, gitwiki):
+        snapshots = GitSnapshots(gitwiki)
+        snapshots.checkpoint(
+            END_OF_DAY,
+            "December 5, 2012",
+            [os.path.join(gitwiki, "TaskList.wiki")],
+        )
+        assert _git(gitwiki, "rev-list", "--count", "HEAD") == "1\n"
+        _write(os.path.join(gitwiki, "TaskList.wiki"), "advanced tasks")
+        snapshots.checkpoint(START_OF_DAY, "December 6, 2012")
+        assert snapshots.rollback() == "EOD December 5, 2012"
+        assert _read(os.path.join(gitwiki, "TaskList.wiki")) == "tasks"
+
+    def test_nothing_to_roll_back_to(self, gitwiki):
+        with pytest.raises(SnapshotError):
+            GitSnapshots(gitwiki).rollback()
+
+    def test_wiki_that_isnt_a_repository(self, wikidir):
+        snapshots = GitSnapshots(wikidir)
+        # the advance goes ahead, without a checkpoint
+        snapshots.checkpoint(
+            END_OF_DAY,
+            "December 5, 2012",
+            [os.path.join(wikidir, "TaskList.wiki")],
+        )
+        snapshots.checkpoint(START_OF_DAY, "December 6, 2012")
+        with pytest.raises(SnapshotError):
+            snapshots.rollback()
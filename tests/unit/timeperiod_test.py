@@ -1,7 +1,11 @@
+import calendar
+import random
 from datetime import date, timedelta
 import pytest
 
 from composer.timeperiod import (
+    Period,
+    PeriodCalendar,
     Day,
     Week,
     Month,
@@ -10,6 +14,10 @@ from composer.timeperiod import (
     Zero,
     Eternity,
     get_time_periods,
+    get_month_name,
+    get_month_number,
+    day_of_week,
+    is_weekend,
     quarter_for_month,
     month_for_quarter,
     get_next_day,
@@ -260,6 +268,114 @@ class TestYearEndDate(TestEndDate):
         assert result == expected
 
 
+def _sample_dates(start, end, count, seed=0):
+    """A reproducible sample of dates in the given range, along with every
+    date in the month (and year) at each end of it.
+    """
+    rng = random.Random(seed)
+    span = (end - start).days
+    dates = [start + timedelta(days=rng.randrange(span)) for _ in range(count)]
+    for edge in (start, end):
+        first = date(edge.year, 1, 1)
+        dates.extend(first + timedelta(days=n) for n in range(366))
+    return dates
+
+
+class TestClosedFormBoundaries(object):
+    """The arithmetic start and end dates should agree with the generic
+    day-by-day search over the period's start criteria.
+    """
+
+    dates = _sample_dates(date(1700, 1, 1), date(2299, 1, 1), 3000)
+
+    @pytest.mark.parametrize("period", [Day, Week, Month, Quarter, Year])
+    def test_start_date(self, period):
+        for for_date in self.dates:
+            expected = Period.get_start_date(period, for_date)
+            assert period.get_start_date(for_date) == expected, for_date
+
+    @pytest.mark.parametrize("period", [Day, Week, Month, Quarter, Year])
+    def test_end_date(self, period):
+        for for_date in self.dates:
+            expected = Period.get_end_date(period, for_date)
+            assert period.get_end_date(for_date) == expected, for_date
+
+    def test_every_week_in_a_leap_cycle(self):
+        current_date = date(2000, 1, 1)
+        while current_date < date(2029, 1, 1):
+            assert Week.get_start_date(current_date) == (
+                Period.get_start_date(Week, current_date)
+            )
+            assert Week.get_end_date(current_date) == (
+                Period.get_end_date(Week, current_date)
+            )
+            current_date += timedelta(days=1)
+
+
+class TestPeriodCalendar(object):
+    def test_next_boundary_spanning_years(self):
+        period_calendar = PeriodCalendar()
+        for period in (Day, Week, Month, Quarter, Year):
+            result = period_calendar.next_boundary(date(2012, 12, 31), period)
+            assert result == date(2013, 1, 1)
+
+    def test_end_of_time(self):
+        period_calendar = PeriodCalendar()
+        with pytest.raises(OverflowError):
+            period_calendar.next_boundary(date.max, Year)
+
+    def test_next_boundary(self):
+        period_calendar = PeriodCalendar()
+        # the last days of the month are merged into the last full week
+        result = period_calendar.next_boundary(date(2013, 5, 27), Week)
+        assert result == date(2013, 6, 1)
+        result = period_calendar.next_boundary(date(2013, 5, 27), Quarter)
+        assert result == date(2013, 7, 1)
+
+    def test_agrees_with_periods(self):
+        period_calendar = PeriodCalendar()
+        current_date = date(2012, 1, 1)
+        while current_date < date(2014, 1, 1):
+            for period in (Day, Week, Month, Quarter, Year):
+                expected = period.get_end_date(current_date) + timedelta(
+                    days=1
+                )
+                assert (
+                    period_calendar.next_boundary(current_date, period)
+                    == expected
+                ), (period, current_date)
+            current_date += timedelta(days=1)
+
+    def test_bounded_cache(self):
+        period_calendar = PeriodCalendar(max_years=3)
+        for year in range(2000, 2010):
+            period_calendar.next_boundary(date(year, 6, 1), Month)
+        assert len(period_calendar._years) == 3
+        assert 2009 in period_calendar._years
+
+
+class TestCalendarNames(object):
+    def test_day_of_week(self):
+        for n in range(14):
+            current_date = date(2012, 1, 1) + timedelta(days=n)
+            assert day_of_week(current_date) == current_date.strftime("%A")
+            assert is_weekend(current_date) == (
+                current_date.strftime("%A") in ('Saturday', 'Sunday')
+            )
+
+    def test_month_name_and_number(self):
+        for number, name in enumerate(calendar.month_name):
+            assert get_month_name(number) == name
+            assert get_month_number(name) == number
+            assert get_month_number(name.upper()) == number
+
+    def test_unknown_month(self):
+        with pytest.raises(KeyError):
+            get_month_name(13)
+        with pytest.raises(KeyError):
+            get_month_number("Smarch")
+
+
 class TestGetTimePeriods(object):
     _time_periods = (Zero, Day, Week, Month, Quarter, Year, Eternity)
 
@@ -1,15 +1,20 @@
 #!/usr/bin/env python
 import os
 import pytest
+import shutil
 from mock import patch
 
 from composer.updateindex import (
     get_files,
     format_for_display,
+    index_filename,
     is_wiki,
     prepare_index,
+    update_index,
     Index,
+    IndexManifest,
     PreIndex,
+    MANIFEST_FILENAME,
 )
 
 
@@ -108,3 +113,94 @@ class TestPrepareIndex(object):
             index_name, "= INDEX (BY DATE) =", formatted_entries, filename
         )
         assert result == expected
+
+
+def _write_pages(wikidir, names, mtime):
+    for name in names:
+        path = os.path.join(wikidir, name + ".wiki")
+        with open(path, "w") as f:
+            f.write(name)
+        os.utime(path, (mtime, mtime))
+
+
+def _read_index(wikidir, index_name):
+    with open(index_filename(wikidir, 'pages', index_name)) as f:
+        return f.read()
+
+
+class TestUpdateIndex(object):
+    @pytest.fixture
+    def wikidir(self, tmp_path):
+        wikidir = str(tmp_path)
+        _write_pages(wikidir, ['b', 'c'], 1000)
+        _write_pages(wikidir, ['a'], 2000)
+        return wikidir
+
+    def _settle(self, wikidir):
+        """Update the index until it no longer changes, since the index files
+        are themselves wiki pages that are listed in the index.
+        """
+        for _ in range(10):
+            if not update_index(wikidir):
+                return
+        raise AssertionError("The index didn't settle!")
+
+    def test_writes_every_index(self, wikidir):
+        written = update_index(wikidir)
+        assert sorted(written) == sorted(
+            [
+                index_filename(wikidir, 'pages'),
+                index_filename(wikidir, 'pages', 'alphabetical'),
+                index_filename(wikidir, 'pages', 'by date modified'),
+                index_filename(wikidir, 'pages', 'by date created'),
+            ]
+        )
+        assert _read_index(wikidir, 'alphabetical') == (
+            "= INDEX (ALPHABETICAL) =\n"
+            "\t* [[a]]\n\t* [[b]]\n\t* [[c]]\n"
+        )
+        assert _read_index(wikidir, 'by date modified') == (
+            "= INDEX (BY DATE MODIFIED) =\n"
+            "\t* [[a]]\n\t* [[c]]\n\t* [[b]]\n"
+        )
+        assert os.path.isfile(os.path.join(wikidir, MANIFEST_FILENAME))
+
+    def test_unchanged_indexes_are_not_written(self, wikidir):
+        self._settle(wikidir)
+        _write_pages(wikidir, ['b'], 3000)
+        assert update_index(wikidir) == [
+            index_filename(wikidir, 'pages', 'by date modified')
+        ]
+
+    def test_same_as_full_update(self, wikidir, tmp_path_factory):
+        self._settle(wikidir)
+        _write_pages(wikidir, ['d'], 1500)
+        _write_pages(wikidir, ['c'], 3000)
+        os.remove(os.path.join(wikidir, 'b.wiki'))
+        # the same wiki, with the same modification times
+        copy = os.path.join(str(tmp_path_factory.mktemp('copy')), 'wiki')
+        shutil.copytree(wikidir, copy)
+        update_index(wikidir)
+        update_index(copy, full=True)
+        for name in ('alphabetical', 'by date modified'):
+            assert _read_index(wikidir, name) == _read_index(copy, name)
+        assert '[[b]]' not in _read_index(wikidir, 'alphabetical')
+        assert '[[d]]' in _read_index(wikidir, 'alphabetical')
+
+    def test_full_update_writes_every_index(self, wikidir):
+        self._settle(wikidir)
+        assert len(update_index(wikidir, full=True)) == 4
+
+    def test_removed_index_is_written(self, wikidir):
+        self._settle(wikidir)
+        filename = index_filename(wikidir, 'pages', 'alphabetical')
+        os.remove(filename)
+        assert filename in update_index(wikidir)
+        assert os.path.isfile(filename)
+
+    def test_manifest_for_another_title_is_ignored(self, wikidir):
+        self._settle(wikidir)
+        manifest_path = os.path.join(wikidir, MANIFEST_FILENAME)
+        assert IndexManifest.load(manifest_path, 'pages', 'index')
+        assert not IndexManifest.load(manifest_path, 'pages', 'wiki')
+        assert len(update_index(wikidir, title='wiki')) == 4
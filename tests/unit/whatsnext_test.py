@@ -0,0 +1,220 @@
+import datetime
+import threading
+import time
+
+import os
+
+import pytest
+from mock import MagicMock, patch
+
+from composer import whatsnext
+from composer.backend.filesystem.scheduling import DateCache, string_to_date
+from composer.snapshots import END_OF_DAY, JournalSnapshots
+from composer.timeperiod import PeriodCalendar
+from composer.utils import ConsoleQueue, display_message, ask_input
+
+
+def _prompting_process(answers):
+    def process(wikidir, preferences):
+        display_message("working on {}".format(wikidir))
+        time.sleep(0.02)
+        display_message("{} needs input".format(wikidir))
+        answers[wikidir] = ask_input()
+        display_message("done with {}".format(wikidir))
+        return datetime.date(2012, 12, 5)
+
+    return process
+
+
+class TestProcessWikis(object):
+    @patch('composer.utils.raw_input')
+    def test_prompts_are_not_interleaved(self, mock_input, capsys):
+        mock_input.side_effect = ["first", "second", "third"]
+        wikidirs = ["wiki1", "wiki2", "wiki3"]
+        answers = {}
+        process = _prompting_process(answers)
+        whatsnext.process_wikis(process, wikidirs, {}, jobs=3)
+        output = capsys.readouterr().out
+        assert sorted(answers.values()) == ["first", "second", "third"]
+        for wikidir in wikidirs:
+            # each wiki's output is shown together with its prompt
+            expected = "[{w}]\nworking on {w}\n{w} needs input\n".format(
+                w=wikidir
+            )
+            assert expected in output
+
+    def test_summary_is_shown(self, capsys):
+        def process(wikidir, preferences):
+            if wikidir == "wiki2":
+                return None
+            return datetime.date(2012, 12, 5)
+
+        whatsnext.process_wikis(process, ["wiki1", "wiki2"], {}, jobs=2)
+        output = capsys.readouterr().out
+        assert "wiki1  Advanced to December 05, 2012" in output
+        assert "wiki2  Not advanced" in output
+
+    def test_errors_are_raised_after_summary(self, capsys):
+        def process(wikidir, preferences):
+            if wikidir == "wiki2":
+                raise ValueError("oops")
+            return None
+
+        with pytest.raises(ValueError):
+            whatsnext.process_wikis(process, ["wiki1", "wiki2"], {}, jobs=2)
+        output = capsys.readouterr().out
+        assert "wiki2  Failed: oops" in output
+
+    def test_preferences_are_not_shared(self):
+        def process(wikidir, preferences):
+            preferences[wikidir] = True
+
+        preferences = {}
+        whatsnext.process_wikis(process, ["wiki1", "wiki2"], preferences, 2)
+        assert preferences == {}
+
+    def test_wikis_are_processed_concurrently(self):
+        def process(wikidir, preferences):
+            time.sleep(0.05)
+
+        wikidirs = ["wiki{}".format(i) for i in range(8)]
+        start = time.time()
+        whatsnext.process_wikis(process, wikidirs, {}, jobs=8)
+        assert time.time() - start < 0.05 * len(wikidirs) / 2
+
+    def test_shared_caches_are_safe_across_wikis(self):
+        datestrs = ["TOMORROW", "NEXT WEEK", "NEXT MONTH", "Q3", "NEXT YEAR"]
+        reference_dates = [
+            datetime.date(2012, 1, 1) + datetime.timedelta(days=days)
+            for days in range(0, 2000, 7)
+        ]
+
+        def parse_all():
+            return [
+                string_to_date(datestr, reference_date)
+                for reference_date in reference_dates
+                for datestr in datestrs
+            ]
+
+        expected = parse_all()
+        results = {}
+
+        def process(wikidir, preferences):
+            results[wikidir] = parse_all()
+
+        # small caches, so that the wikis are constantly evicting each
+        # other's entries
+        cache = DateCache(8)
+        with patch(
+            'composer.backend.filesystem.scheduling.date_cache', cache
+        ), patch(
+            'composer.backend.filesystem.date_parsers.period_calendar',
+            PeriodCalendar(2),
+        ):
+            whatsnext.process_wikis(process, ["wiki1", "wiki2"], {}, jobs=2)
+        info = cache.info()
+        assert info.hits + info.misses == len(expected) * 2
+        assert results == {"wiki1": expected, "wiki2": expected}
+
+
+class TestGetSnapshots(object):
+    def test_all_changes_are_committed_by_default(self):
+        snapshots = whatsnext._get_snapshots("wiki", {})
+        assert snapshots.all_changes
+
+    def test_targeted_staging_is_opt_in(self):
+        snapshots = whatsnext._get_snapshots(
+            "wiki", {"git_staging": "targeted"}
+        )
+        assert not snapshots.all_changes
+
+
+def _write(path, contents):
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+class TestCatchUpWiki(object):
+    @patch('composer.whatsnext._post_advance_tasks')
+    @patch('composer.whatsnext._catch_up')
+    @patch('composer.whatsnext.FilesystemPlanner')
+    @patch('composer.whatsnext.FilesystemTasklist')
+    def test_catching_up_can_be_rolled_back(
+        self,
+        mock_tasklist,
+        mock_planner,
+        mock_catch_up,
+        mock_post_advance,
+        tmp_path,
+    ):
+        wikidir = str(tmp_path)
+        tasklist = os.path.join(wikidir, "TaskList.wiki")
+        today = os.path.join(wikidir, "December 5, 2012.wiki")
+        tomorrow = os.path.join(wikidir, "December 6, 2012.wiki")
+        currentday = os.path.join(wikidir, "currentday")
+        _write(tasklist, "old tasks")
+        # a checkpoint from an earlier advance
+        JournalSnapshots(wikidir).checkpoint(
+            END_OF_DAY, "December 1, 2012", [tasklist]
+        )
+        _write(tasklist, "tasks")
+        _write(today, "today")
+        os.symlink("December 5, 2012.wiki", currentday)
+        planner = mock_planner.return_value
+        planner.date = datetime.date(2012, 12, 5)
+        planner.get_current_files.return_value = [tasklist, today]
+
+        def catch_up(planner, batch, policy):
+            batch.write("caught up tasks", tasklist)
+            batch.write("tomorrow", tomorrow)
+            batch.link("December 6, 2012.wiki", currentday)
+            caught_up = MagicMock(date=datetime.date(2012, 12, 6))
+            return caught_up, [tasklist, tomorrow], None
+
+        mock_catch_up.side_effect = catch_up
+        preferences = {"snapshots": "journal"}
+        whatsnext.catch_up_wiki(wikidir, dict(preferences))
+        assert _read(tasklist) == "caught up tasks"
+        whatsnext.rollback_wiki(wikidir, dict(preferences))
+        assert _read(tasklist) == "tasks"
+        assert _read(today) == "today"
+        assert not os.path.exists(tomorrow)
+        assert os.readlink(currentday) == "December 5, 2012.wiki"
+
+
+class TestConsoleQueue(object):
+    def test_turns_are_taken_in_order(self):
+        queue = ConsoleQueue()
+        order = []
+        with queue.turn():
+            threads = []
+            for i in range(3):
+                thread = threading.Thread(
+                    target=lambda i=i: _take_turn(queue, order, i)
+                )
+                thread.start()
+                # wait for the thread to queue for its turn
+                time.sleep(0.02)
+                threads.append(thread)
+        for thread in threads:
+            thread.join()
+        assert order == [0, 1, 2]
+
+    def test_output_is_held_until_done(self, capsys):
+        queue = ConsoleQueue()
+        with queue.task("wiki"):
+            display_message("hello")
+            assert capsys.readouterr().out == ""
+        assert capsys.readouterr().out == "\n[wiki]\nhello\n"
+        display_message("unqueued")
+        assert capsys.readouterr().out == "unqueued\n"
+
+
+def _take_turn(queue, order, i):
+    with queue.turn():
+        order.append(i)